@@ -0,0 +1,83 @@
+"""로그 호출 비용 마이크로벤치마크
+
+model.Log의 로그 함수를 초당 몇 번 호출할 수 있는지 측정합니다.
+비교용으로 이전 방식(전역 락 + inspect 프레임 탐색 + 호출 전 f-string 생성)을
+같은 로거에 대해 흉내 낸 결과도 함께 출력합니다.
+
+- filtered: 로그 레벨이 INFO일 때의 debug 호출 (기록되지 않음)
+- enabled: 로그 레벨이 DEBUG일 때의 debug 호출 (임시 파일에 기록)
+
+사용법:
+    python benchmark/bench_log.py [--calls 200000]
+"""
+import argparse
+import inspect
+import json
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from model.Log import log
+
+_legacy_lock = threading.Lock()
+
+def _legacy_caller_info():
+    frame = inspect.currentframe()
+    try:
+        while frame:
+            frame = frame.f_back
+            if frame and frame.f_code.co_filename != __file__:
+                return f"{os.path.basename(frame.f_code.co_filename)}:{frame.f_lineno}"
+    finally:
+        del frame
+    return "unknown:0"
+
+def _legacy_debug(msg):
+    """이전 Log.debug와 같은 순서로 동작하는 함수"""
+    with _legacy_lock:
+        if log._logger:
+            caller_info = _legacy_caller_info()
+            log._logger.debug(f"[{caller_info}] {msg}")
+
+def _calls_per_second(calls, func):
+    start = time.perf_counter()
+    for i in range(calls):
+        func(i)
+    return calls / (time.perf_counter() - start)
+
+def bench(calls, log_level, log_file):
+    log.setup(enable_logging=True, log_file=log_file, max_size_mb=1024, backup_count=0, log_level=log_level)
+    # 콘솔 출력은 측정에서 제외
+    log._logger.removeHandler(log._console_handler)
+    try:
+        return {
+            'legacy': round(_calls_per_second(calls, lambda i: _legacy_debug(f"다운로드 진행률: {i % 100}%"))),
+            'fstring': round(_calls_per_second(calls, lambda i: log.debug(f"다운로드 진행률: {i % 100}%"))),
+            'lazy': round(_calls_per_second(calls, lambda i: log.debug("다운로드 진행률: %d%%", i % 100)))
+        }
+    finally:
+        log._remove_existing_handlers()
+
+def main():
+    parser = argparse.ArgumentParser(description='로그 호출 비용 마이크로벤치마크')
+    parser.add_argument('--calls', type=int, default=200000, help='측정할 호출 수 (기본값: 200000)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        log_file = os.path.join(temp_dir, 'bench_log.txt')
+        filtered = bench(args.calls, 'INFO', log_file)
+        enabled = bench(args.calls // 10, 'DEBUG', log_file)
+        logging.shutdown()
+
+    print(json.dumps({
+        'calls': args.calls,
+        'calls_per_second': {'filtered': filtered, 'enabled': enabled}
+    }, indent=2))
+
+if __name__ == '__main__':
+    main()
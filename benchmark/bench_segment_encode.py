@@ -0,0 +1,107 @@
+"""구간 병렬 인코딩 벤치마크
+
+긴 오디오 파일 하나를 한 번에 MP3로 인코딩할 때와 SegmentedEncoder로 구간 수별로 나누어
+동시에 인코딩할 때의 경과 시간을 비교합니다. 속도 향상은 CPU 코어 수에 따라 달라지므로
+결과에 cpu_count를 함께 기록합니다. 네트워크 없이 실행됩니다.
+
+사용법:
+    python benchmark/bench_segment_encode.py [--duration 1800] [--segments 1,2,4,8] [--preset cbr]
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmark.media_server import Fixture, generate_fixtures
+from controller.logic.ConverterToMP3 import converter_to_mp3_instance
+from controller.logic.SegmentedEncoder import segmented_encoder_instance
+
+def _default_segments():
+    """1, 2, 4, ... CPU 코어 수까지"""
+    counts = [1]
+    while counts[-1] * 2 <= (os.cpu_count() or 1):
+        counts.append(counts[-1] * 2)
+    if counts[-1] != (os.cpu_count() or 1):
+        counts.append(os.cpu_count())
+    return counts
+
+def bench_encode(fixture, segments, quality, preset, work_dir):
+    """구간 수 segments로 한 번 인코딩하고 (경과 시간, 실제 구간 수, 출력 크기)를 반환합니다."""
+    # config.json과 관계없이 길이 조건 없이 지정한 구간 수로 나누도록 설정
+    segmented_encoder_instance._settings = {
+        'enabled': segments > 1,
+        'min_duration_seconds': 0,
+        'segments': segments,
+        'preroll_frames': 4
+    }
+    source = {'duration': fixture.duration, 'acodec': 'mp4a.40.2', 'abr': fixture.bitrate_kbps, 'asr': fixture.sample_rate}
+    settings = converter_to_mp3_instance.plan_output('mp3', quality, source, preset)
+    planned = segmented_encoder_instance.plan(settings, fixture.duration)
+
+    # 변환은 입력 파일을 삭제하므로 복사본 사용 (복사 시간은 측정에서 제외)
+    input_file = os.path.join(work_dir, f"input_{segments}.m4a")
+    shutil.copyfile(fixture.path, input_file)
+    started = time.perf_counter()
+    output, _ = converter_to_mp3_instance.convert(
+        input_file, f"segments_{segments}", quality, work_dir, source=source, profile='mp3', preset=preset
+    )
+    wall = time.perf_counter() - started
+    size = os.path.getsize(output)
+    os.remove(output)
+    return wall, len(planned) if planned else 1, size
+
+def main():
+    parser = argparse.ArgumentParser(description='구간 병렬 인코딩 벤치마크')
+    parser.add_argument('--duration', type=int, default=1800, help='오디오 길이 (초, 기본값: 1800)')
+    parser.add_argument('--bitrate', type=int, default=160, help='입력 AAC 비트레이트 (kbps, 기본값: 160)')
+    parser.add_argument('--segments', default=','.join(map(str, _default_segments())), help='구간 수 목록 (기본값: 1, 2, 4, ... CPU 코어 수)')
+    parser.add_argument('--quality', default='192K', help='MP3 품질 (기본값: 192K)')
+    parser.add_argument('--preset', default='cbr', help='인코딩 프리셋 (기본값: cbr)')
+    parser.add_argument('--fixtures-dir', default=os.path.join(tempfile.gettempdir(), 'youtube_to_mp3_bench_fixtures'), help='생성한 오디오 파일 저장 경로 (재사용)')
+    args = parser.parse_args()
+
+    fixture, = generate_fixtures(
+        [Fixture('segment', args.duration, args.bitrate)],
+        args.fixtures_dir,
+        converter_to_mp3_instance.get_ffmpeg_path()
+    )
+
+    results = []
+    baseline = None
+    with tempfile.TemporaryDirectory(prefix='bench_segment_') as work_dir:
+        for segments in [int(value) for value in args.segments.split(',')]:
+            wall, used, size = bench_encode(fixture, segments, args.quality, args.preset, work_dir)
+            if baseline is None and used == 1:
+                baseline = wall
+            results.append({
+                'segments': used,
+                'wall_s': round(wall, 3),
+                'speedup': round(baseline / wall, 2) if baseline else None,
+                'realtime_x': round(fixture.duration / wall, 1),
+                'output_bytes': size
+            })
+            print(f"구간 {used}개: {wall:.2f}초", file=sys.stderr)
+
+    print(json.dumps({
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count()
+        },
+        'settings': {
+            'duration_s': args.duration,
+            'input_bitrate_kbps': args.bitrate,
+            'quality': args.quality,
+            'preset': args.preset
+        },
+        'results': results
+    }, indent=2, ensure_ascii=False))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+"""YoutubeDL 인스턴스 풀 벤치마크
+
+작업마다 yt_dlp.YoutubeDL을 새로 만드는 방식(이전)과 YoutubeDLPool에서
+인스턴스를 빌려 쓰는 방식(이후)의 작업당 준비 시간과, 로컬 HTTP 서버에 대한
+정보 추출까지 포함한 작업당 시간을 비교합니다. 네트워크 없이 실행됩니다.
+
+사용법:
+    python benchmark/bench_ydl_pool.py [--jobs 50]
+"""
+import argparse
+import http.server
+import json
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import yt_dlp
+from controller.logic.YoutubeDLPool import YoutubeDLPool, youtube_dl_pool_instance
+
+PAYLOAD = b'\xff\xfb\x90\x00' * 256
+
+class _KeepAliveHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_HEAD(self):
+        self._send_headers()
+
+    def do_GET(self):
+        self._send_headers()
+        self.wfile.write(PAYLOAD)
+
+    def _send_headers(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'audio/mpeg')
+        self.send_header('Content-Length', str(len(PAYLOAD)))
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+def _start_server():
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), _KeepAliveHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def _job_options(index):
+    return {
+        'format': 'bestaudio/best',
+        'outtmpl': f'bench_{index}.%(ext)s',
+        'progress_hooks': [lambda d: None]
+    }
+
+def bench_setup(jobs):
+    """작업당 YoutubeDL 준비 시간 (생성 + 종료 vs 풀에서 빌리기 + 반납)"""
+    start = time.perf_counter()
+    for i in range(jobs):
+        options = dict(YoutubeDLPool._base_options, **_job_options(i))
+        with yt_dlp.YoutubeDL(options) as ydl:
+            ydl._request_director  # HTTP 핸들러 생성 (첫 요청 시 수행되는 초기화)
+    before = (time.perf_counter() - start) / jobs
+
+    start = time.perf_counter()
+    for i in range(jobs):
+        with youtube_dl_pool_instance.acquire(**_job_options(i)) as ydl:
+            ydl._request_director
+    after = (time.perf_counter() - start) / jobs
+    return before, after
+
+def bench_extract(jobs, url):
+    """정보 추출까지 포함한 작업당 시간"""
+    start = time.perf_counter()
+    for i in range(jobs):
+        options = dict(YoutubeDLPool._base_options, **_job_options(i))
+        with yt_dlp.YoutubeDL(options) as ydl:
+            ydl.extract_info(url, download=False)
+    before = (time.perf_counter() - start) / jobs
+
+    start = time.perf_counter()
+    for i in range(jobs):
+        with youtube_dl_pool_instance.acquire(**_job_options(i)) as ydl:
+            ydl.extract_info(url, download=False)
+    after = (time.perf_counter() - start) / jobs
+    return before, after
+
+def main():
+    parser = argparse.ArgumentParser(description='YoutubeDL 인스턴스 풀 벤치마크')
+    parser.add_argument('--jobs', type=int, default=50, help='측정할 작업 수 (기본값: 50)')
+    args = parser.parse_args()
+
+    server = _start_server()
+    url = f'http://127.0.0.1:{server.server_address[1]}/audio.mp3'
+
+    # 풀 인스턴스를 미리 만들어 두고 측정 (장기 실행 프로세스의 상태)
+    with youtube_dl_pool_instance.acquire() as ydl:
+        ydl.extract_info(url, download=False)
+
+    setup_before, setup_after = bench_setup(args.jobs)
+    extract_before, extract_after = bench_extract(args.jobs, url)
+    server.shutdown()
+    youtube_dl_pool_instance.close()
+
+    print(json.dumps({
+        'jobs': args.jobs,
+        'setup_ms_per_job': {'new_instance': round(setup_before * 1000, 3), 'pool': round(setup_after * 1000, 3)},
+        'extract_ms_per_job': {'new_instance': round(extract_before * 1000, 3), 'pool': round(extract_after * 1000, 3)}
+    }, indent=2))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""벤치마크용 yt-dlp 추출기
+
+'bench'로 시작하는 11자리 비디오 ID의 YouTube URL(https://www.youtube.com/watch?v=bench000001)을
+로컬 미디어 서버의 오디오 파일로 연결합니다. 애플리케이션 코드(비디오 ID 추출, 캐시 키 등)는
+실제 YouTube URL과 같은 경로로 동작하고, 네트워크 요청은 로컬 서버로만 나갑니다.
+"""
+import yt_dlp
+from yt_dlp.extractor.common import InfoExtractor
+
+class BenchYoutubeIE(InfoExtractor):
+    IE_NAME = 'bench:youtube'
+    _VALID_URL = r'https?://(?:www\.)?youtube\.com/watch\?v=(?P<id>bench[0-9A-Za-z_-]{6})'
+
+    # 비디오 ID → (Fixture, URL), install()에서 설정
+    catalog = {}
+
+    def _real_extract(self, url):
+        video_id = self._match_id(url)
+        fixture, media_url = self.catalog[video_id]
+        return {
+            'id': video_id,
+            'title': f"bench {fixture.name} {video_id}",
+            'duration': fixture.duration,
+            'webpage_url': f"https://www.youtube.com/watch?v={video_id}",
+            'formats': [{
+                'format_id': '140',
+                'url': media_url,
+                'ext': 'm4a',
+                'acodec': 'mp4a.40.2',
+                'vcodec': 'none',
+                'abr': fixture.bitrate_kbps,
+                'asr': fixture.sample_rate,
+                'filesize': fixture.size,
+                'protocol': 'http'
+            }]
+        }
+
+def video_id(index):
+    """벤치마크 작업 번호로 비디오 ID를 만듭니다."""
+    return f"bench{index:06d}"
+
+def video_url(index):
+    return f"https://www.youtube.com/watch?v={video_id(index)}"
+
+def install(server, fixtures, job_count):
+    """작업 번호별로 오디오 파일을 순서대로 배정하고, 이후 생성되는 YoutubeDL이
+    실제 YouTube 추출기보다 먼저 BenchYoutubeIE를 사용하도록 합니다.
+
+    YoutubeDLPool은 인스턴스를 만들 때 yt_dlp.YoutubeDL을 참조하므로
+    풀을 사용하기 전에 호출해야 합니다.
+    """
+    BenchYoutubeIE.catalog = {
+        video_id(i): (fixtures[i % len(fixtures)], server.url(fixtures[i % len(fixtures)]))
+        for i in range(job_count)
+    }
+    if getattr(yt_dlp.YoutubeDL, '_bench_installed', False):
+        return
+
+    base = yt_dlp.YoutubeDL
+
+    class BenchYoutubeDL(base):
+        _bench_installed = True
+
+        def add_default_info_extractors(self):
+            # 추출기는 등록 순서대로 URL을 검사하므로 가장 먼저 등록
+            self.add_info_extractor(BenchYoutubeIE())
+            super().add_default_info_extractors()
+
+    yt_dlp.YoutubeDL = BenchYoutubeDL
@@ -0,0 +1,158 @@
+"""벤치마크용 로컬 미디어 서버
+
+ffmpeg으로 생성한 오디오 파일(길이, 비트레이트별)을 HTTP로 제공합니다.
+Range 요청을 지원하며, 연결당 전송 속도 제한과 응답 지연을 넣어
+실제 스트리밍 서버와 비슷한 조건을 네트워크 없이 만들 수 있습니다.
+"""
+import http.server
+import os
+import re
+import subprocess
+import threading
+import time
+
+# 전송 속도 제한 시 한 번에 보내는 크기
+SEND_SIZE = 16 * 1024
+
+class Fixture:
+    """벤치마크용 오디오 파일 정보"""
+
+    def __init__(self, name, duration, bitrate_kbps, sample_rate=44100):
+        self.name = name
+        self.duration = duration
+        self.bitrate_kbps = bitrate_kbps
+        self.sample_rate = sample_rate
+        self.path = None
+        self.size = 0
+
+    @property
+    def filename(self):
+        return f"{self.name}_{self.duration}s_{self.bitrate_kbps}k.m4a"
+
+    @classmethod
+    def parse(cls, spec):
+        """'이름:길이(초):비트레이트(kbps)' 형식의 문자열을 Fixture로 변환합니다."""
+        name, duration, bitrate = spec.split(':')
+        return cls(name, int(duration), int(bitrate))
+
+def generate_fixtures(fixtures, output_dir, ffmpeg_path='ffmpeg'):
+    """오디오 파일이 없으면 ffmpeg으로 생성합니다 (사인파 + 약한 잡음, AAC).
+
+    Args:
+        fixtures (list[Fixture]): 생성할 파일 목록
+        output_dir (str): 저장 경로 (같은 설정의 파일이 있으면 재사용)
+        ffmpeg_path (str): ffmpeg 실행 파일 경로
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    for fixture in fixtures:
+        fixture.path = os.path.join(output_dir, fixture.filename)
+        if not os.path.exists(fixture.path):
+            temp_path = fixture.path + '.tmp.m4a'
+            subprocess.run([
+                ffmpeg_path, '-v', 'error', '-y',
+                '-f', 'lavfi', '-i', f"sine=frequency=440:duration={fixture.duration}:sample_rate={fixture.sample_rate}",
+                '-f', 'lavfi', '-i', f"anoisesrc=amplitude=0.05:duration={fixture.duration}:sample_rate={fixture.sample_rate}",
+                '-filter_complex', 'amix=inputs=2', '-ac', '2',
+                '-c:a', 'aac', '-b:a', f"{fixture.bitrate_kbps}k",
+                temp_path
+            ], check=True)
+            os.replace(temp_path, fixture.path)
+        fixture.size = os.path.getsize(fixture.path)
+    return fixtures
+
+class _MediaRequestHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_HEAD(self):
+        self._serve(send_body=False)
+
+    def do_GET(self):
+        self._serve(send_body=True)
+
+    def _serve(self, send_body):
+        server = self.server
+        if server.latency:
+            time.sleep(server.latency)
+
+        path = server.files.get(self.path.split('?')[0].lstrip('/'))
+        if path is None:
+            self.send_error(404)
+            return
+
+        size = os.path.getsize(path)
+        start, end = 0, size - 1
+        range_header = self.headers.get('Range')
+        if range_header:
+            match = re.match(r'bytes=(\d+)-(\d*)', range_header)
+            start = int(match.group(1))
+            if match.group(2):
+                end = min(int(match.group(2)), size - 1)
+            if start >= size:
+                self.send_response(416)
+                self.send_header('Content-Range', f'bytes */{size}')
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+            self.send_response(206)
+            self.send_header('Content-Range', f'bytes {start}-{end}/{size}')
+        else:
+            self.send_response(200)
+        self.send_header('Content-Type', 'audio/mp4')
+        self.send_header('Accept-Ranges', 'bytes')
+        self.send_header('Content-Length', str(end - start + 1))
+        self.end_headers()
+        if not send_body:
+            return
+
+        with open(path, 'rb') as f:
+            f.seek(start)
+            remaining = end - start + 1
+            began = time.monotonic()
+            sent = 0
+            while remaining > 0:
+                data = f.read(min(SEND_SIZE, remaining))
+                if not data:
+                    break
+                try:
+                    self.wfile.write(data)
+                except (BrokenPipeError, ConnectionResetError):
+                    return
+                remaining -= len(data)
+                sent += len(data)
+                if server.throttle:
+                    # 연결당 전송 속도를 throttle(바이트/초) 이하로 유지
+                    delay = sent / server.throttle - (time.monotonic() - began)
+                    if delay > 0:
+                        time.sleep(delay)
+
+    def log_message(self, *args):
+        pass
+
+class MediaServer:
+    """오디오 파일을 제공하는 로컬 HTTP 서버
+
+    Args:
+        fixtures (list[Fixture]): 제공할 파일 목록 (generate_fixtures로 생성된 것)
+        throttle_kbps (int): 연결당 전송 속도 제한 (KB/s, 0이면 제한 없음)
+        latency_ms (int): 응답 전 지연 시간 (밀리초)
+    """
+
+    def __init__(self, fixtures, throttle_kbps=0, latency_ms=0):
+        self._server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), _MediaRequestHandler)
+        self._server.daemon_threads = True
+        self._server.files = {fixture.filename: fixture.path for fixture in fixtures}
+        self._server.throttle = throttle_kbps * 1024
+        self._server.latency = latency_ms / 1000
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, name='media-server', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def url(self, fixture):
+        return f"http://127.0.0.1:{self._server.server_address[1]}/{fixture.filename}"
@@ -0,0 +1,281 @@
+"""오프라인 종단 간 벤치마크
+
+로컬 미디어 서버(benchmark/media_server.py)와 가짜 yt-dlp 추출기(benchmark/fake_extractor.py)로
+네트워크 없이 다음 시나리오를 동시 작업 수별로 실행하고 결과를 JSON으로 출력합니다.
+
+- download: DownloadYoutubeAudio.download_audio
+- convert: ConverterToMP3.convert (로컬 오디오 파일 → MP3)
+- pipeline: JobEngine (다운로드 + 인코딩 전체 파이프라인)
+
+측정 항목: 분당 작업 수, MB/s, 작업 지연 시간(p50/p95/max), 최대 RSS(자식 프로세스 포함)
+
+사용법:
+    python benchmark/run_benchmark.py [--jobs 12] [--concurrency 1,2,4]
+        [--scenarios download,convert,pipeline] [--throttle-kbps 0] [--latency-ms 0]
+        [--fixtures short:30:128,medium:120:160,long:300:128] [--output result.json]
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmark import fake_extractor
+from benchmark.media_server import Fixture, MediaServer, generate_fixtures
+from controller.logic.ConverterToMP3 import converter_to_mp3_instance
+from controller.logic.DownloadYoutubeAudio import download_youtube_audio_instance
+from controller.logic.JobEngine import JobEngine
+from controller.logic.YoutubeDLPool import youtube_dl_pool_instance
+
+DEFAULT_FIXTURES = 'short:30:128,medium:120:160,long:300:128'
+SCENARIOS = ('download', 'convert', 'pipeline')
+
+class RssSampler:
+    """이 프로세스와 자식 프로세스(ffmpeg)의 RSS 합계 최댓값을 주기적으로 기록합니다.
+
+    /proc이 없는 환경에서는 getrusage의 최대 RSS(프로세스 전체 기간)를 사용합니다.
+    """
+
+    def __init__(self, interval=0.05):
+        self._interval = interval
+        self._stop = threading.Event()
+        self._thread = None
+        self.peak = 0
+
+    def __enter__(self):
+        self.peak = self._sample() or 0
+        self._thread = threading.Thread(target=self._run, name='rss-sampler', daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        if not self.peak:
+            self.peak = self._max_rss_fallback()
+
+    def _run(self):
+        while not self._stop.wait(self._interval):
+            rss = self._sample()
+            if rss:
+                self.peak = max(self.peak, rss)
+
+    def _sample(self):
+        if not os.path.exists('/proc/self/status'):
+            return None
+        total = self._read_rss('self')
+        for task in os.listdir('/proc/self/task'):
+            try:
+                with open(f'/proc/self/task/{task}/children') as f:
+                    children = f.read().split()
+            except OSError:
+                continue
+            for pid in children:
+                total += self._read_rss(pid)
+        return total
+
+    @staticmethod
+    def _read_rss(pid):
+        try:
+            with open(f'/proc/{pid}/status') as f:
+                for line in f:
+                    if line.startswith('VmRSS:'):
+                        return int(line.split()[1]) * 1024
+        except OSError:
+            pass
+        return 0
+
+    @staticmethod
+    def _max_rss_fallback():
+        try:
+            import resource
+        except ImportError:
+            return 0
+        scale = 1 if sys.platform == 'darwin' else 1024
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+def _percentile(values, percent):
+    """nearest-rank 방식의 백분위수"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(percent / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+def _summarize(scenario, concurrency, latencies, failures, total_bytes, wall, peak_rss):
+    return {
+        'scenario': scenario,
+        'concurrency': concurrency,
+        'jobs': len(latencies) + failures,
+        'failed': failures,
+        'wall_s': round(wall, 3),
+        'jobs_per_min': round(len(latencies) / wall * 60, 2) if wall else None,
+        'mb_per_s': round(total_bytes / wall / 1e6, 3) if wall else None,
+        'latency_s': {
+            'p50': round(_percentile(latencies, 50), 3) if latencies else None,
+            'p95': round(_percentile(latencies, 95), 3) if latencies else None,
+            'max': round(max(latencies), 3) if latencies else None
+        },
+        'peak_rss_mb': round(peak_rss / 1024 / 1024, 1)
+    }
+
+def _run_parallel(task, job_count, concurrency):
+    """task(index)를 동시에 concurrency개씩 실행하고 (지연 시간 목록, 처리 바이트, 실패 수, 경과 시간)을 반환합니다."""
+    latencies = []
+    failures = 0
+    total_bytes = 0
+    lock = threading.Lock()
+
+    def timed(index):
+        nonlocal failures, total_bytes
+        started = time.perf_counter()
+        try:
+            processed = task(index)
+        except Exception as e:
+            print(f"작업 {index} 실패: {e}", file=sys.stderr)
+            with lock:
+                failures += 1
+            return
+        with lock:
+            latencies.append(time.perf_counter() - started)
+            total_bytes += processed
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(timed, range(job_count)))
+    return latencies, total_bytes, failures, time.perf_counter() - started
+
+def bench_download(job_count, concurrency, quality, work_dir, fixtures):
+    def task(index):
+        downloaded_file, _, _ = download_youtube_audio_instance.download_audio(
+            fake_extractor.video_url(index), quality, save_path=work_dir
+        )
+        size = os.path.getsize(downloaded_file)
+        os.remove(downloaded_file)
+        return size
+
+    with RssSampler() as rss:
+        latencies, total_bytes, failures, wall = _run_parallel(task, job_count, concurrency)
+    return _summarize('download', concurrency, latencies, failures, total_bytes, wall, rss.peak)
+
+def bench_convert(job_count, concurrency, quality, work_dir, fixtures):
+    # 변환은 입력 파일을 삭제하므로 작업마다 복사본을 미리 준비 (복사 시간은 측정에서 제외)
+    inputs = []
+    for index in range(job_count):
+        fixture = fixtures[index % len(fixtures)]
+        input_file = os.path.join(work_dir, f"input_{index}.m4a")
+        shutil.copyfile(fixture.path, input_file)
+        inputs.append((input_file, fixture))
+
+    def task(index):
+        input_file, fixture = inputs[index]
+        output, _ = converter_to_mp3_instance.convert(
+            input_file, f"convert_{index}", quality, work_dir,
+            source={'duration': fixture.duration, 'acodec': 'mp4a.40.2'}, profile='mp3'
+        )
+        os.remove(output)
+        return fixture.size
+
+    with RssSampler() as rss:
+        latencies, total_bytes, failures, wall = _run_parallel(task, job_count, concurrency)
+    return _summarize('convert', concurrency, latencies, failures, total_bytes, wall, rss.peak)
+
+def bench_pipeline(job_count, concurrency, quality, work_dir, fixtures):
+    engine = JobEngine(download_workers=concurrency, encode_workers=concurrency)
+    with RssSampler() as rss:
+        started = time.perf_counter()
+        engine.start()
+        jobs = [engine.submit(fake_extractor.video_url(index), quality, work_dir) for index in range(job_count)]
+        for job in jobs:
+            job.wait()
+        wall = time.perf_counter() - started
+        engine.shutdown()
+
+    latencies = [job.finished_at - job.submitted_at for job in jobs if job.error is None]
+    failures = sum(1 for job in jobs if job.error is not None)
+    for job in jobs:
+        if job.error is not None:
+            print(f"작업 {job.job_id} 실패: {job.error}", file=sys.stderr)
+    total_bytes = sum(fixtures[index % len(fixtures)].size for index, job in enumerate(jobs) if job.error is None)
+    return _summarize('pipeline', concurrency, latencies, failures, total_bytes, wall, rss.peak)
+
+BENCHMARKS = {
+    'download': bench_download,
+    'convert': bench_convert,
+    'pipeline': bench_pipeline
+}
+
+def main():
+    parser = argparse.ArgumentParser(description='오프라인 종단 간 벤치마크')
+    parser.add_argument('--jobs', type=int, default=12, help='시나리오/동시 작업 수별 작업 수 (기본값: 12)')
+    parser.add_argument('--concurrency', default='1,2,4', help='동시 작업 수 목록 (기본값: 1,2,4)')
+    parser.add_argument('--scenarios', default=','.join(SCENARIOS), help=f"실행할 시나리오 (기본값: {','.join(SCENARIOS)})")
+    parser.add_argument('--quality', default='192K', help='MP3 품질 (기본값: 192K)')
+    parser.add_argument('--fixtures', default=DEFAULT_FIXTURES, help=f"이름:길이(초):비트레이트(kbps) 목록 (기본값: {DEFAULT_FIXTURES})")
+    parser.add_argument('--fixtures-dir', default=os.path.join(tempfile.gettempdir(), 'youtube_to_mp3_bench_fixtures'), help='생성한 오디오 파일 저장 경로 (재사용)')
+    parser.add_argument('--throttle-kbps', type=int, default=0, help='서버의 연결당 전송 속도 제한 (KB/s, 기본값: 0 = 제한 없음)')
+    parser.add_argument('--latency-ms', type=int, default=0, help='서버 응답 지연 (밀리초, 기본값: 0)')
+    parser.add_argument('--output', default=None, help='결과 JSON 파일 경로 (기본값: 표준 출력)')
+    args = parser.parse_args()
+
+    scenarios = [name.strip() for name in args.scenarios.split(',') if name.strip()]
+    for name in scenarios:
+        if name not in BENCHMARKS:
+            parser.error(f"알 수 없는 시나리오: {name}")
+    concurrency_levels = [int(value) for value in args.concurrency.split(',')]
+
+    fixtures = generate_fixtures(
+        [Fixture.parse(spec) for spec in args.fixtures.split(',')],
+        args.fixtures_dir,
+        converter_to_mp3_instance.get_ffmpeg_path()
+    )
+    server = MediaServer(fixtures, throttle_kbps=args.throttle_kbps, latency_ms=args.latency_ms).start()
+    fake_extractor.install(server, fixtures, args.jobs)
+
+    results = []
+    try:
+        for name in scenarios:
+            for concurrency in concurrency_levels:
+                # 이전 실행의 다운로드 파일을 재사용하지 않도록 매번 새 작업 경로 사용
+                with tempfile.TemporaryDirectory(prefix=f"bench_{name}_") as work_dir:
+                    result = BENCHMARKS[name](args.jobs, concurrency, args.quality, work_dir, fixtures)
+                results.append(result)
+                print(f"{name} x{concurrency}: {result['jobs_per_min']} jobs/min, {result['mb_per_s']} MB/s", file=sys.stderr)
+    finally:
+        server.stop()
+        youtube_dl_pool_instance.close()
+
+    report = json.dumps({
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count()
+        },
+        'settings': {
+            'jobs': args.jobs,
+            'quality': args.quality,
+            'throttle_kbps': args.throttle_kbps,
+            'latency_ms': args.latency_ms
+        },
+        'fixtures': [
+            {'name': f.name, 'duration_s': f.duration, 'bitrate_kbps': f.bitrate_kbps, 'size_bytes': f.size}
+            for f in fixtures
+        ],
+        'results': results
+    }, indent=2, ensure_ascii=False)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(report + '\n')
+    else:
+        print(report)
+
+if __name__ == '__main__':
+    main()
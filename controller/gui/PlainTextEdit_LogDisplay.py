@@ -1,11 +1,15 @@
 from PyQt5.QtWidgets import QMainWindow, QPlainTextEdit
-from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QTextCursor
+from PyQt5.QtCore import Qt, QTimer
+from collections import deque
 from datetime import datetime
 import threading
 from model.Log import log
 
 TIME_STRING_LENGTH = 24
 LOG_DISPLAY_WINDOW_WIDTH = 88
+# 로그 디스플레이에 보관할 최대 라인 수 (오래된 라인부터 삭제)
+MAX_LOG_LINES = 1000
 
 class PlainTextEdit_LogDisplay:
     """로그 디스플레이를 관리하는 컨트롤러 클래스"""
@@ -23,7 +27,8 @@ class PlainTextEdit_LogDisplay:
         """PlainTextEdit_LogDisplay 초기화"""
         self._window = None
         self._log_display = None
-        self._contents = []  # 문자열을 저장하는 리스트
+        self._contents = deque(maxlen=MAX_LOG_LINES)  # 최근 문자열만 보관하는 링 버퍼
+        self._scroll_pending = False
         
     def setup(self, window: QMainWindow):
         """PlainTextEdit_LogDisplay를 초기화합니다.
@@ -37,6 +42,8 @@ class PlainTextEdit_LogDisplay:
             if self._log_display:
                 # 가로 스크롤바가 생성되지 않도록 자동 줄바꿈 설정
                 self._log_display.setLineWrapMode(QPlainTextEdit.WidgetWidth)
+                # 문서도 같은 라인 수만 유지 (초과분은 위에서부터 삭제)
+                self._log_display.setMaximumBlockCount(MAX_LOG_LINES)
             else:
                 log.critical("LogDisplay 초기화 실패")
 
@@ -77,20 +84,16 @@ class PlainTextEdit_LogDisplay:
         with self._lock:
             if self._log_display:
                 log_message = self._get_current_time() + " " + message
-                self._contents.pop()
-                self._contents.append(log_message)
-                for i in range(len(self._contents)):
-                    if i == 0 :
-                        self._print(self._contents[i],True)
-                    else:
-                        self._print(self._contents[i])
+                if not self._contents:
+                    self._contents.append(log_message)
+                    self._print(log_message)
+                    return
+                self._contents[-1] = log_message
+                self._replace_last_line(log_message)
 
-    def _print(self, log_message: str, set_flag: bool = False):
-        if set_flag == True:
-            self._log_display.setPlainText(log_message)
-        else:
-            self._log_display.appendPlainText(log_message)
-        self._scroll_to_bottom()
+    def _print(self, log_message: str):
+        self._log_display.appendPlainText(log_message)
+        self._request_scroll()
         '''
         log_message_list = self._string_devider(log_message, LOG_DISPLAY_WINDOW_WIDTH, LOG_DISPLAY_WINDOW_WIDTH - TIME_STRING_LENGTH, TIME_STRING_LENGTH)
         i = 0
@@ -102,9 +105,25 @@ class PlainTextEdit_LogDisplay:
             i += 1
             self._scroll_to_bottom()
         '''
+        
+    def _replace_last_line(self, log_message: str):
+        """문서 전체를 다시 그리지 않고 마지막 블록만 교체합니다."""
+        cursor = QTextCursor(self._log_display.document())
+        cursor.movePosition(QTextCursor.End)
+        cursor.movePosition(QTextCursor.StartOfBlock, QTextCursor.KeepAnchor)
+        cursor.insertText(log_message)
+        self._request_scroll()
+        
+    def _request_scroll(self):
+        """같은 이벤트 루프 차례에 출력된 라인들을 모아 한 번만 스크롤합니다."""
+        if self._scroll_pending:
+            return
+        self._scroll_pending = True
+        QTimer.singleShot(0, self._scroll_to_bottom)
             
     def _scroll_to_bottom(self):
         """로그 디스플레이를 최하단으로 스크롤합니다."""
+        self._scroll_pending = False
         if self._log_display:
             v_scrollbar = self._log_display.verticalScrollBar()
             v_scrollbar.setValue(v_scrollbar.maximum()) 
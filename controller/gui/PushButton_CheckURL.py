@@ -5,6 +5,8 @@ from controller.gui.ComboBox_AudioQuality import combo_box_audio_quality_instanc
 from controller.gui.PushButton_Download import push_button_download_instance
 from controller.gui.PlainTextEdit_LogDisplay import plain_text_edit_log_display_instance
 from controller.logic.CheckURL import check_url_instance
+from model.PerformanceLog import performance_log_instance
+from model.TraceLog import trace_log_instance
 import threading
 from model.Log import log
 from controller.logic.YoutubeTitle import youtube_title_instance
@@ -17,12 +19,16 @@ class TitleFetchThread(QThread):
     def __init__(self, url):
         super().__init__()
         self.url = url
+        self.info = None
         
     def run(self):
         try:
-            title = youtube_title_instance.get(self.url)
-            if title:
-                self.get_title_success.emit(title)
+            # 추출한 정보는 다운로드 단계에서 재사용 (정보 추출 중복 방지)
+            with performance_log_instance.job_context(check_url_instance.extract_video_id(self.url)), \
+                    trace_log_instance.span('TitleFetchThread', 'gui', url=self.url):
+                self.info = youtube_title_instance.get_info(self.url)
+            if self.info:
+                self.get_title_success.emit(self.info['title'])
             else:
                 self.get_title_failed.emit("제목을 가져올 수 없습니다.")
         except Exception as e:
@@ -107,6 +113,7 @@ class PushButton_CheckURL:
     def _thread_get_title_success(self, title):
         """제목 가져오기 성공 핸들러"""
         plain_text_edit_log_display_instance.print_next_line("제목: " + title)
+        push_button_download_instance.set_video_info(self._title_fetch_thread.url, self._title_fetch_thread.info)
         self._button_mode_change_change_url()
 
     def _thread_get_title_failed(self, message):
@@ -120,6 +127,7 @@ class PushButton_CheckURL:
         self._button_mode_change_check_url()
         
     def _button_mode_change_check_url(self):
+        push_button_download_instance.set_video_info(None, None)
         line_edit_url_input_instance.enable()
         combo_box_audio_quality_instance.disable()
         push_button_download_instance.disable()
@@ -8,18 +8,22 @@ from controller.gui.PlainTextEdit_LogDisplay import plain_text_edit_log_display_
 from controller.logic.DownloadYoutubeAudio import download_youtube_audio_instance
 from controller.logic.DirectoryManager import directory_manager_instance
 from controller.logic.ConverterToMP3 import converter_to_mp3_instance
+from controller.logic.CheckURL import check_url_instance
+from model.PerformanceLog import performance_log_instance
+from model.TraceLog import trace_log_instance
 
 class DownloadThread(QThread):
     """다운로드 작업을 처리하는 스레드"""
     progress_updated = pyqtSignal(str)  # 진행 상황 메시지
-    download_completed = pyqtSignal(str, str)  # 완료 메시지
+    download_completed = pyqtSignal(str, str, dict)  # 완료 메시지 (파일 경로, 제목, 원본 오디오 정보)
     error_occurred = pyqtSignal(str)    # 오류 메시지
 
-    def __init__(self, url, quality, save_path):
+    def __init__(self, url, quality, save_path, info=None):
         super().__init__()
         self.url = url
         self.quality = quality
         self.save_path = save_path
+        self.info = info
         self.current_speed = "0.0 MB/s"
         
     def run(self):
@@ -35,15 +39,18 @@ class DownloadThread(QThread):
                 self.current_speed = speed
             
             # 다운로드
-            downloaded_file, title = download_youtube_audio_instance.download_audio(
-                url=self.url,
-                quality=self.quality,
-                progress_callback=on_progress,
-                speed_callback=on_speed
-            )
+            with performance_log_instance.job_context(check_url_instance.extract_video_id(self.url)), \
+                    trace_log_instance.span('DownloadThread', 'gui', url=self.url):
+                downloaded_file, title, source = download_youtube_audio_instance.download_audio(
+                    url=self.url,
+                    quality=self.quality,
+                    progress_callback=on_progress,
+                    speed_callback=on_speed,
+                    info=self.info
+                )
 
             # 다운로드 완료 메시지
-            self.download_completed.emit(downloaded_file, title)
+            self.download_completed.emit(downloaded_file, title, source)
             
         except Exception as e:
             self.error_occurred.emit(f"오류가 발생했습니다: {str(e)}")
@@ -51,15 +58,17 @@ class DownloadThread(QThread):
 class ConvertThread(QThread):
     """MP3 변환 작업을 처리하는 스레드"""
     progress_updated = pyqtSignal(str)  # 진행 상황 메시지
-    convert_completed = pyqtSignal(str)  # 완료 메시지
+    convert_completed = pyqtSignal(str, dict)  # 완료 메시지 (최종 파일 경로, 실제 적용된 출력 설정)
     error_occurred = pyqtSignal(str)    # 오류 메시지
 
-    def __init__(self, input_file, title, quality, save_path):
+    def __init__(self, input_file, title, quality, save_path, job_id=None, source=None):
         super().__init__()
         self.input_file = input_file
         self.title = title
         self.quality = quality
         self.save_path = save_path
+        self.job_id = job_id
+        self.source = source
 
     def run(self):
         try:
@@ -69,16 +78,18 @@ class ConvertThread(QThread):
                 self.progress_updated.emit(progress_text)
 
             # MP3 변환
-            self._final_path = converter_to_mp3_instance.convert(
-                input_file=self.input_file,
-                title=self.title,
-                quality=self.quality,
-                save_path=self.save_path,
-                progress_callback=on_progress
-            )   
+            with performance_log_instance.job_context(self.job_id), trace_log_instance.span('ConvertThread', 'gui'):
+                self._final_path, settings = converter_to_mp3_instance.convert(
+                    input_file=self.input_file,
+                    title=self.title,
+                    quality=self.quality,
+                    save_path=self.save_path,
+                    progress_callback=on_progress,
+                    source=self.source
+                )   
 
             # 변환 완료 메시지
-            self.convert_completed.emit(self._final_path)
+            self.convert_completed.emit(self._final_path, settings)
 
         except Exception as e:
             self.error_occurred.emit(f"오류가 발생했습니다: {str(e)}")
@@ -98,6 +109,8 @@ class PushButton_Download:
         self._download_button = None
         self._download_thread = None
         self._convert_thread = None
+        self._video_info_url = None
+        self._video_info = None
 
     def setup(self, window: QMainWindow):
         """PushButton_Download를 초기화합니다.
@@ -120,6 +133,16 @@ class PushButton_Download:
     def disable(self):
         self._download_button.setEnabled(False)
 
+    def set_video_info(self, url, info):
+        """Check URL 단계에서 추출한 비디오 정보를 저장합니다.
+        
+        Args:
+            url (str): 정보를 추출한 URL
+            info (dict): YoutubeTitle.get_info()의 결과
+        """
+        self._video_info_url = url
+        self._video_info = info
+
     def _handle_button_click_event(self):
         """다운로드 버튼 클릭 이벤트 핸들러"""
         log.debug("버튼 클릭 [Download]")
@@ -129,6 +152,8 @@ class PushButton_Download:
             self._url = line_edit_url_input_instance.get_url()
             self._quality = combo_box_audio_quality_instance.get_selected_quality()
             self._save_path = directory_manager_instance.make_download_directory()
+            # ffmpeg이나 출력 프로필에 필요한 인코더가 없으면 다운로드하기 전에 실패
+            converter_to_mp3_instance.require_profile_encoder()
                 
             plain_text_edit_log_display_instance.print_next_line("다운로드를 시작합니다.")
             plain_text_edit_log_display_instance.print_next_line("다운로드 준비 중...")
@@ -138,7 +163,9 @@ class PushButton_Download:
                 self._download_thread.terminate()
                 self._download_thread.wait()
 
-            self._download_thread = DownloadThread(self._url, self._quality, self._save_path)
+            # Check URL에서 추출한 정보가 같은 URL의 것이면 재사용
+            info = self._video_info if self._video_info_url == self._url else None
+            self._download_thread = DownloadThread(self._url, self._quality, self._save_path, info)
             self._download_thread.progress_updated.connect(self._progress_updated)
             self._download_thread.download_completed.connect(self._download_completed)
             self._download_thread.error_occurred.connect(self._error_occurred)
@@ -149,7 +176,7 @@ class PushButton_Download:
             plain_text_edit_log_display_instance.print_next_line(f"오류 발생: {str(e)}")
             self._all_buttons_enable()
    
-    def _download_completed(self, downloaded_file, title):
+    def _download_completed(self, downloaded_file, title, source):
         """다운로드 완료 핸들러"""
         progress_text = "다운로드: " + plain_text_edit_log_display_instance.create_progress_bar(100)
         plain_text_edit_log_display_instance.print_current_line(progress_text)
@@ -162,17 +189,30 @@ class PushButton_Download:
             self._convert_thread.terminate()
             self._convert_thread.wait()
 
-        self._convert_thread = ConvertThread(downloaded_file, title, self._quality, self._save_path)
+        self._convert_thread = ConvertThread(
+            downloaded_file, title, self._quality, self._save_path,
+            job_id=check_url_instance.extract_video_id(self._url),
+            source=source
+        )
         self._convert_thread.progress_updated.connect(self._progress_updated)
         self._convert_thread.convert_completed.connect(self._convert_completed)
         self._convert_thread.error_occurred.connect(self._error_occurred)
         self._convert_thread.start()
 
-    def _convert_completed(self, final_path):
+    def _convert_completed(self, final_path, settings):
         """MP3 변환 완료 핸들러"""
         progress_text = "MP3변환: " + plain_text_edit_log_display_instance.create_progress_bar(100)
         plain_text_edit_log_display_instance.print_current_line(progress_text)
         plain_text_edit_log_display_instance.print_next_line("MP3 변환 완료!")
+        if settings['encoder'] == 'copy':
+            plain_text_edit_log_display_instance.print_next_line(f"원본 오디오 유지 ({settings['source_codec']})")
+        elif settings['mode'] == 'vbr':
+            # VBR은 비트레이트 대신 품질로 인코딩 (bitrate_kbps는 None)
+            plain_text_edit_log_display_instance.print_next_line(f"VBR 품질: V{settings['vbr_quality']} ({settings['preset']})")
+        elif settings['bitrate_kbps'] != settings['requested_bitrate_kbps']:
+            plain_text_edit_log_display_instance.print_next_line(
+                f"비트레이트: {settings['bitrate_kbps']}kbps (원본 {settings['source_abr']}kbps, 요청 {settings['requested_bitrate_kbps']}kbps)"
+            )
         plain_text_edit_log_display_instance.print_next_line("저장 경로: " + final_path)
         self._all_buttons_enable()
 
@@ -0,0 +1,156 @@
+import argparse
+import json
+import sys
+import threading
+from model.Log import log
+from model.Configuration import configuration_instance
+from model.JobJournal import job_journal_instance
+from controller.logic.CheckURL import check_url_instance
+from controller.logic.DirectoryManager import directory_manager_instance
+from controller.logic.JobEngine import JobEngine
+from controller.logic.ConverterToMP3 import OUTPUT_PROFILES
+from controller.logic.FFmpegProbe import FFmpegNotFoundError
+from controller.logic.EncoderBackend import ENCODER_BACKENDS, EncoderBackendError
+
+QUALITY_CHOICES = ['320K', '256K', '192K', '160K', '128K', '96K', '64K', '48K']
+
+class BatchRunner:
+    """GUI 없이 여러 URL을 변환하는 배치 실행기
+
+    PyQt5, view, controller.gui 패키지를 import 하지 않으므로
+    디스플레이 서버가 없는 환경에서도 동작합니다.
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super(BatchRunner, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        pass
+
+    def parse_args(self, argv):
+        """배치 모드 명령행 인자를 파싱합니다.
+
+        Args:
+            argv (list[str]): 'batch' 이후의 명령행 인자
+
+        Returns:
+            argparse.Namespace: 파싱된 인자
+        """
+        parser = argparse.ArgumentParser(
+            prog='youtube_to_mp3 batch',
+            description='YouTube URL 목록을 GUI 없이 MP3로 변환합니다.'
+        )
+        parser.add_argument('urls', nargs='*', help='변환할 YouTube 동영상/플레이리스트/채널 URL')
+        parser.add_argument('-i', '--input', help="URL 목록 파일 (한 줄에 하나, '-'는 표준 입력)")
+        parser.add_argument('-q', '--quality', default='192K', choices=QUALITY_CHOICES, help='MP3 품질 (기본값: 192K)')
+        parser.add_argument('-p', '--profile', default=None, choices=OUTPUT_PROFILES, help="출력 프로필: mp3(항상 인코딩), original(원본 스트림 복사), mp3_if_needed(원본 코덱이 output.keep_codecs에 있으면 복사) (기본값: config.json의 output.profile)")
+        parser.add_argument('--preset', default=None, help="MP3 인코딩 프리셋: cbr, abr, vbr_high, vbr_standard, fast, mono 또는 config.json의 output.presets에 추가한 이름 (기본값: config.json의 output.preset)")
+        parser.add_argument('--backend', default=None, choices=ENCODER_BACKENDS, help="인코더 백엔드: ffmpeg(파일마다 ffmpeg 프로세스), pyav(PyAV로 작업 스레드 안에서 인코딩) (기본값: config.json의 output.encoder_backend)")
+        parser.add_argument('-o', '--output', default=None, help='저장 경로 (기본값: ./downloads)')
+        parser.add_argument('-j', '--download-workers', type=int, default=None, help='동시 다운로드 수 (기본값: config.json의 engine.download_workers)')
+        parser.add_argument('--encode-workers', type=int, default=None, help='동시 인코딩 수 (기본값: config.json의 engine.encode_workers, 0이면 CPU 코어 수)')
+        parser.add_argument('--stream', action='store_true', default=None, help='임시 파일 없이 다운로드 데이터를 ffmpeg으로 바로 전달 (기본값: config.json의 engine.streaming)')
+        parser.add_argument('--resume', action=argparse.BooleanOptionalAction, default=None, help='이전 실행에서 중단된 작업을 이어서 처리 (기본값: config.json의 engine.resume_on_startup)')
+        parser.add_argument('-c', '--config', default='config.json', help='설정 파일 경로 (기본값: config.json)')
+        return parser.parse_args(argv)
+
+    def run(self, args) -> int:
+        """배치 작업을 실행하고 작업별 결과를 JSON Lines 형식으로 출력합니다.
+
+        작업은 JobEngine에서 병렬로 처리되므로 결과는 완료된 순서대로 출력됩니다.
+
+        Args:
+            args (argparse.Namespace): parse_args()로 파싱된 인자
+
+        Returns:
+            int: 종료 코드 (모든 작업 성공 시 0, 하나라도 실패하면 1)
+        """
+        urls = self._collect_urls(args)
+        resume = self._option(args.resume, "resume_on_startup", True)
+        if not urls and not (resume and job_journal_instance.pending()):
+            log.error("변환할 URL이 없습니다.")
+            return 2
+
+        save_path = directory_manager_instance.make_download_directory(args.output)
+        log.info(f"배치 작업 시작 - {len(urls)}개 URL, 품질: {args.quality}, 저장 경로: {save_path}")
+
+        self._succeeded = 0
+        self._failed = 0
+        engine = JobEngine(
+            download_workers=self._option(args.download_workers, "download_workers", 3),
+            encode_workers=self._option(args.encode_workers, "encode_workers", 0),
+            encode_queue_size=self._option(None, "encode_queue_size", 0),
+            streaming=self._option(args.stream, "streaming", False),
+            playlist_resolvers=self._option(None, "playlist_resolvers", 2),
+            on_job_done=self._on_job_done,
+            output_profile=args.profile,
+            preset=args.preset,
+            backend=args.backend
+        )
+        try:
+            engine.start()
+        except (FFmpegNotFoundError, EncoderBackendError) as e:
+            log.error(str(e))
+            return 2
+        resumed_urls = set()
+        if resume:
+            # 이전 실행에서 중단된 작업을 먼저 이어서 처리
+            resumed_urls = {job.url for job in engine.resume_pending()}
+        for url in urls:
+            if url in resumed_urls:
+                continue
+            if check_url_instance.is_playlist_url(url):
+                engine.submit_playlist(url, args.quality, save_path)
+                continue
+            if not check_url_instance.is_valid_youtube_url(url):
+                self._report({'job_id': None, 'url': url, 'status': 'error', 'title': None, 'output': None, 'error': "유효하지 않은 URL입니다.", 'elapsed': 0.0})
+                continue
+            engine.submit(url, args.quality, save_path)
+        engine.shutdown(wait=True)
+
+        log.info(f"배치 작업 완료 - 성공: {self._succeeded}, 실패: {self._failed}")
+        return 0 if self._failed == 0 else 1
+
+    def _option(self, value, key, default):
+        """명령행 값이 없으면 config.json의 engine 설정을 사용합니다."""
+        if value is not None:
+            return value
+        return configuration_instance.get_or_default(default, "engine", key)
+
+    def _on_job_done(self, job):
+        self._report(job.to_dict())
+
+    def _collect_urls(self, args) -> list:
+        """명령행 인자, 파일, 표준 입력에서 URL을 모읍니다."""
+        lines = list(args.urls)
+        if args.input == '-' or (args.input is None and not args.urls and not sys.stdin.isatty()):
+            lines.extend(sys.stdin.read().splitlines())
+        elif args.input:
+            with open(args.input, 'r', encoding='utf-8') as f:
+                lines.extend(f.read().splitlines())
+
+        urls = []
+        for line in lines:
+            line = line.strip()
+            if line and not line.startswith('#'):
+                urls.append(line)
+        return urls
+
+    def _report(self, result):
+        """작업 결과를 표준 출력에 JSON 한 줄로 씁니다."""
+        with self._lock:
+            if result['status'] == 'ok':
+                self._succeeded += 1
+            else:
+                self._failed += 1
+            sys.stdout.write(json.dumps(result, ensure_ascii=False) + '\n')
+            sys.stdout.flush()
+
+# 싱글톤 인스턴스 생성
+batch_runner_instance = BatchRunner()
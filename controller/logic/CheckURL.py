@@ -1,5 +1,6 @@
 import re
 import threading
+from model.PerformanceLog import performance_log_instance
 
 class CheckURL:
     _instance = None
@@ -17,7 +18,21 @@ class CheckURL:
     def is_valid_youtube_url(self, url):
         """YouTube URL의 유효성을 검사합니다."""
         youtube_regex = r'(https?://)?(www\.)?(youtube|youtu|youtube-nocookie)\.(com|be)/(watch\?v=|embed/|v/|.+\?v=)?([^"&?/s]{11})'
-        return bool(re.match(youtube_regex, url))
+        with performance_log_instance.stage('url_check'):
+            return bool(re.match(youtube_regex, url))
+
+    def is_playlist_url(self, url):
+        """YouTube 플레이리스트 또는 채널 URL인지 검사합니다.
+        
+        동영상 ID와 list 파라미터가 함께 있는 URL(watch?v=...&list=...)은 동영상으로 취급합니다.
+        """
+        playlist_regex = r'(https?://)?(www\.|m\.|music\.)?youtube\.com/(playlist\?(.+&)?list=|channel/|c/|user/|@)'
+        return bool(re.match(playlist_regex, url))
+
+    def extract_video_id(self, url):
+        """YouTube URL에서 11자리 비디오 ID를 추출합니다. 추출할 수 없으면 None을 반환합니다."""
+        match = re.search(r'(?:[?&]v=|youtu\.be/|/embed/|/v/|/shorts/|/live/)([0-9A-Za-z_-]{11})(?![0-9A-Za-z_-])', url)
+        return match.group(1) if match else None
 
 # 싱글톤 인스턴스 생성
 check_url_instance = CheckURL() 
\ No newline at end of file
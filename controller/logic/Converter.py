@@ -41,4 +41,5 @@ class Converter:
     def convert_to_mp3(self, input_file, title, quality, progress_callback=None):
         """다운로드된 비디오를 MP3로 변환합니다."""
         sanitized_title = self.sanitize_filename(title)
-        return self.converter_to_mp3.convert(input_file, sanitized_title, quality, self.save_path, progress_callback)
\ No newline at end of file
+        final_path, _ = self.converter_to_mp3.convert(input_file, sanitized_title, quality, self.save_path, progress_callback)
+        return final_path
\ No newline at end of file
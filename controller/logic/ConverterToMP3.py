@@ -5,21 +5,62 @@ from model.Log import log
 import subprocess
 import re
 import threading
-import sys
+import uuid
+from controller.logic.ProgressThrottle import ProgressThrottle
+from controller.logic.FFmpegRunner import ffmpeg_runner_instance
+from controller.logic.FFmpegProbe import ffmpeg_probe_instance
+from controller.logic.EncoderBackend import ENCODER_BACKENDS, EncoderBackendError
+from controller.logic.FFmpegEncoderBackend import ffmpeg_encoder_backend_instance
+from controller.logic.PyAVEncoderBackend import pyav_encoder_backend_instance
+from model.Configuration import configuration_instance
+from model.PerformanceLog import performance_log_instance
+from model.TraceLog import trace_log_instance
 
-def get_application_path():
-    if getattr(sys, 'frozen', False):
-        # PyInstaller로 패키징된 경우
-        return os.path.dirname(sys.executable)
-    else:
-        # 개발 환경
-        return os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# 출력 프로필
+# - mp3: 항상 MP3로 인코딩 (기본값)
+# - original: 원본 오디오 스트림을 재인코딩 없이 컨테이너만 바꿔 저장 (.opus, .m4a, .ogg 등)
+# - mp3_if_needed: 원본 코덱이 output.keep_codecs에 있으면 그대로 저장하고, 아니면 MP3로 인코딩
+OUTPUT_PROFILES = ('mp3', 'original', 'mp3_if_needed')
+# 스트림 복사 시 코덱별 출력 확장자 (목록에 없는 코덱은 Matroska 오디오로 저장)
+_COPY_EXTENSIONS = {
+    'opus': 'opus',
+    'aac': 'm4a',
+    'vorbis': 'ogg',
+    'mp3': 'mp3',
+    'flac': 'flac'
+}
+# libmp3lame 인코딩 프리셋 (config.json의 output.presets로 추가/변경)
+# - mode: 'cbr'(고정 비트레이트), 'abr'(평균 비트레이트), 'vbr'(가변 비트레이트, vbr_quality 사용)
+# - vbr_quality: VBR 품질 (-q:a, 0이 최고 품질/최대 크기, 9가 최저)
+# - compression_level: LAME 알고리즘 품질 (0이 가장 느리고 정확, 9가 가장 빠름, None이면 LAME 기본값 3)
+# - joint_stereo: joint stereo 사용 여부 (None이면 LAME 기본값)
+# - mono: 모노로 다운믹스
+DEFAULT_PRESETS = {
+    'cbr': {'mode': 'cbr'},
+    'abr': {'mode': 'abr'},
+    'vbr_high': {'mode': 'vbr', 'vbr_quality': 2},
+    'vbr_standard': {'mode': 'vbr', 'vbr_quality': 4},
+    'fast': {'mode': 'cbr', 'compression_level': 9},
+    'mono': {'mode': 'cbr', 'mono': True}
+}
+# MPEG-1 Layer III 비트레이트 (kbps)와 샘플레이트 (Hz), MPEG-2/2.5의 낮은 샘플레이트 포함
+_MP3_BITRATES = (32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320)
+_MP3_SAMPLE_RATES = (8000, 11025, 12000, 16000, 22050, 24000, 32000, 44100, 48000)
 
 class ConverterToMP3:
     _instance = None
     _lock = threading.Lock()
-    _is_frozen = getattr(sys, 'frozen', False)
-    _base_path = get_application_path()
+    _rename_lock = threading.Lock()
+    _quality_map = {
+        '320K': '320',
+        '256K': '256',
+        '192K': '192',
+        '160K': '160',
+        '128K': '128',
+        '96K': '96',
+        '64K': '64',
+        '48K': '48'
+    }
 
     def __new__(cls) -> 'ConverterToMP3':
         with cls._lock:
@@ -31,125 +72,347 @@ class ConverterToMP3:
         pass
 
     def get_ffmpeg_path(self):
-        if getattr(sys, 'frozen', False):
-            # PyInstaller로 패키징된 경우
-            ffmpeg_path = os.path.join(self._base_path, 'resources', 'ffmpeg', 'ffmpeg.exe')
-            if not os.path.exists(ffmpeg_path):
-                # 상대 경로로 시도
-                ffmpeg_path = os.path.join('resources', 'ffmpeg', 'ffmpeg.exe')
-            log.info(f"FFmpeg 경로 (패키징): {ffmpeg_path}")
-            return ffmpeg_path
+        """ffmpeg 실행 파일 경로 (처음 한 번만 확인, FFmpegProbe 참고)"""
+        return ffmpeg_probe_instance.get_ffmpeg_path()
+            
+    def get_encoder_settings(self, quality, profile=None, preset=None, segmented=False):
+        """인코딩 결과를 구분하는 인코더 설정 문자열을 반환합니다 (다운로드 색인 키로 사용).
+
+        plan_output의 결과를 바꾸는 설정(프로필, 프리셋, adaptive_bitrate)을 모두 포함합니다.
+
+        Args:
+            segmented (bool): 구간 인코딩(SegmentedEncoder, 비트 저장소 끔)으로 만든 결과인지 여부
+        """
+        profile = self.get_profile(profile)
+        if profile == 'original':
+            return 'copy'
+        _, options = self.get_preset(preset)
+        if options['mode'] == 'vbr':
+            mp3_settings = f"{ffmpeg_probe_instance.require_encoder('mp3')}:vbr:q{options['vbr_quality']}"
+        else:
+            mp3_settings = f"{ffmpeg_probe_instance.require_encoder('mp3')}:{options['mode']}:{self._quality_map[quality]}k"
+        # 기본 프리셋(cbr)은 이전 버전과 같은 키를 사용
+        if options.get('compression_level') is not None:
+            mp3_settings += f":cl{options['compression_level']}"
+        if options.get('joint_stereo') is not None:
+            mp3_settings += ':js' if options['joint_stereo'] else ':stereo'
+        if options.get('mono'):
+            mp3_settings += ':mono'
+        if configuration_instance.get_or_default(True, "output", "adaptive_bitrate"):
+            # 원본에 맞춰 비트레이트/샘플레이트를 낮춘 결과는 요청한 그대로 인코딩한 결과와 구분
+            mp3_settings += ':adaptive'
+        if segmented:
+            mp3_settings += ':seg'
+        if profile == 'mp3_if_needed':
+            return f"copy[{','.join(self._keep_codecs())}]|{mp3_settings}"
+        return mp3_settings
+
+    def require_profile_encoder(self, profile=None):
+        """출력 프로필에 필요한 인코더가 있는지 확인합니다 (작업 시작 전에 실패하도록 사용).
+
+        'original'은 스트림 복사만 하므로 MP3 인코더 없이 ffmpeg만 있으면 됩니다.
+
+        Args:
+            profile (str): 출력 프로필 (None이면 config.json의 output.profile)
+
+        Returns:
+            str: 사용할 인코더 이름 ('original'이면 'copy')
+
+        Raises:
+            FFmpegNotFoundError: ffmpeg을 찾을 수 없는 경우
+            EncoderNotFoundError: 프로필에 필요한 인코더가 없는 경우
+        """
+        if self.get_profile(profile) == 'original':
+            ffmpeg_probe_instance.probe()
+            return 'copy'
+        return ffmpeg_probe_instance.require_encoder('mp3')
+
+    def get_profile(self, profile=None):
+        """출력 프로필을 확인합니다 (None이면 config.json의 output.profile)."""
+        if profile is None:
+            profile = configuration_instance.get_or_default('mp3', "output", "profile")
+        if profile not in OUTPUT_PROFILES:
+            log.warning(f"알 수 없는 출력 프로필 '{profile}' - mp3로 변환합니다.")
+            return 'mp3'
+        return profile
+
+    def get_backend(self, backend=None):
+        """인코더 백엔드를 반환합니다 (None이면 config.json의 output.encoder_backend).
+
+        Raises:
+            EncoderBackendError: 선택한 백엔드를 사용할 수 없는 경우 (예: PyAV가 설치되지 않음)
+        """
+        if backend is None:
+            backend = configuration_instance.get_or_default('ffmpeg', "output", "encoder_backend")
+        if backend not in ENCODER_BACKENDS:
+            log.warning(f"알 수 없는 인코더 백엔드 '{backend}' - ffmpeg으로 인코딩합니다.")
+            backend = 'ffmpeg'
+        instance = {
+            'ffmpeg': ffmpeg_encoder_backend_instance,
+            'pyav': pyav_encoder_backend_instance
+        }[backend]
+        if not instance.is_available():
+            if backend == 'pyav':
+                raise EncoderBackendError("PyAV가 설치되어 있지 않습니다. pip install av로 설치하거나 output.encoder_backend를 ffmpeg으로 바꿔 주세요.")
+            raise EncoderBackendError(f"{backend} 인코더 백엔드를 사용할 수 없습니다.")
+        return instance
+
+    def get_preset(self, preset=None):
+        """인코딩 프리셋을 확인합니다 (None이면 config.json의 output.preset).
+
+        Returns:
+            tuple: (프리셋 이름, 프리셋 옵션 dict)
+        """
+        if preset is None:
+            preset = configuration_instance.get_or_default('cbr', "output", "preset")
+        presets = self.get_presets()
+        if preset not in presets:
+            log.warning(f"알 수 없는 인코딩 프리셋 '{preset}' - cbr로 인코딩합니다.")
+            preset = 'cbr'
+        options = dict(presets[preset])
+        if options.get('mode') not in ('cbr', 'abr', 'vbr'):
+            log.warning(f"인코딩 프리셋 '{preset}'의 mode '{options.get('mode')}'를 알 수 없어 cbr로 인코딩합니다.")
+            options['mode'] = 'cbr'
+        if options['mode'] == 'vbr':
+            options['vbr_quality'] = min(9, max(0, int(options.get('vbr_quality', 4))))
+        if options.get('compression_level') is not None:
+            options['compression_level'] = min(9, max(0, int(options['compression_level'])))
+        return preset, options
+
+    def get_presets(self):
+        """사용할 수 있는 인코딩 프리셋 (기본 프리셋 + config.json의 output.presets)"""
+        presets = dict(DEFAULT_PRESETS)
+        presets.update(configuration_instance.get_or_default({}, "output", "presets"))
+        return presets
+
+    def plan_output(self, profile, quality, source=None, preset=None):
+        """출력 프로필과 원본 오디오 정보로 실제 적용할 출력 설정을 정합니다.
+
+        adaptive_bitrate가 켜져 있으면 원본에 없는 정보를 위해 CPU와 용량을 쓰지 않도록
+        비트레이트는 원본 비트레이트 이상인 가장 낮은 MP3 비트레이트로,
+        샘플레이트는 원본 샘플레이트 이하인 가장 높은 MP3 샘플레이트로 제한합니다.
+
+        Args:
+            profile (str): 출력 프로필 (OUTPUT_PROFILES)
+            quality (str): 요청한 MP3 품질 (예: '192K')
+            source (dict): 원본 오디오 정보 (DownloadYoutubeAudio.source_info)
+            preset (str): 인코딩 프리셋 이름 (None이면 config.json의 output.preset)
+
+        Returns:
+            dict: profile, encoder(인코더 이름 또는 'copy'), extension, preset, mode, bitrate_kbps(VBR이면 None),
+                vbr_quality, compression_level, channels(None이면 원본 유지), sample_rate(None이면 원본 유지),
+                requested_bitrate_kbps, source_codec, source_abr, source_asr
+        """
+        source = source or {}
+        codec = self._normalize_codec(source.get('acodec'))
+        settings = {
+            'profile': profile,
+            'encoder': 'copy',
+            'extension': _COPY_EXTENSIONS.get(codec, 'mka'),
+            'preset': None,
+            'mode': 'copy',
+            'bitrate_kbps': None,
+            'vbr_quality': None,
+            'compression_level': None,
+            'joint_stereo': None,
+            'channels': None,
+            'sample_rate': None,
+            'requested_bitrate_kbps': int(self._quality_map[quality]),
+            'source_codec': codec,
+            'source_abr': source.get('abr'),
+            'source_asr': source.get('asr')
+        }
+        if profile == 'original' or (profile == 'mp3_if_needed' and codec in self._keep_codecs()):
+            return settings
+
+        preset_name, options = self.get_preset(preset)
+        settings['encoder'] = ffmpeg_probe_instance.require_encoder('mp3')
+        settings['extension'] = 'mp3'
+        settings['preset'] = preset_name
+        settings['mode'] = options['mode']
+        settings['compression_level'] = options.get('compression_level')
+        settings['joint_stereo'] = options.get('joint_stereo')
+        settings['channels'] = 1 if options.get('mono') else None
+        if options['mode'] == 'vbr':
+            # VBR은 비트레이트 대신 품질로 지정하므로 비트레이트 제한을 적용하지 않음
+            settings['vbr_quality'] = options['vbr_quality']
         else:
-            # 개발 환경
-            log.info("FFmpeg 경로 (개발): 시스템 PATH 사용")
-            return 'ffmpeg'  # 시스템 PATH 사용
+            settings['bitrate_kbps'] = settings['requested_bitrate_kbps']
+        if configuration_instance.get_or_default(True, "output", "adaptive_bitrate"):
+            abr = source.get('abr')
+            if abr and settings['bitrate_kbps']:
+                ceiling = next((rate for rate in _MP3_BITRATES if rate >= abr), _MP3_BITRATES[-1])
+                settings['bitrate_kbps'] = min(settings['bitrate_kbps'], ceiling)
+            asr = source.get('asr')
+            if asr:
+                rate = max((rate for rate in _MP3_SAMPLE_RATES if rate <= asr), default=_MP3_SAMPLE_RATES[0])
+                if rate != asr:
+                    settings['sample_rate'] = rate
+                if rate < 32000 and settings['bitrate_kbps']:
+                    # MPEG-2/2.5 (32kHz 미만)의 최대 비트레이트는 160kbps
+                    settings['bitrate_kbps'] = min(settings['bitrate_kbps'], 160)
+        return settings
+
+    def _keep_codecs(self):
+        return configuration_instance.get_or_default(['mp3', 'aac'], "output", "keep_codecs")
+
+    @staticmethod
+    def _normalize_codec(acodec):
+        """yt-dlp의 acodec 값(예: 'mp4a.40.2', 'opus')을 코덱 이름으로 바꿉니다 (모르면 'unknown')."""
+        if not acodec or acodec == 'none':
+            return 'unknown'
+        codec = acodec.lower().split('.')[0]
+        return 'aac' if codec == 'mp4a' else codec
+
+    def sanitize_filename(self, filename):
+        """파일 이름에서 특수 문자를 제거합니다."""
+        # Windows에서 허용되지 않는 문자들을 제거
+        invalid_chars = r'[<>:"/\\|?*]'
+        sanitized = re.sub(invalid_chars, '_', filename)
+        # 공백을 언더스코어로 대체
+        sanitized = sanitized.replace(' ', '_')
+        return sanitized
+
+    def convert(self, input_file, title, quality, save_path, progress_callback=None, source=None, profile=None, preset=None, backend=None):
+        """다운로드된 비디오를 MP3로 변환합니다.
+        
+        출력 프로필이 허용하면 재인코딩 없이 원본 오디오 스트림을 복사하여
+        코덱에 맞는 컨테이너(.opus, .m4a, .ogg 등)로 저장합니다.
+        
+        Args:
+            input_file (str): 입력 오디오 파일 경로
+            title (str): 결과 파일 이름 (확장자 제외)
+            quality (str): MP3 품질 (예: '192K')
+            save_path (str): 저장 경로
+            progress_callback (callable): 진행률(0-100) 콜백
+            source (dict): 원본 오디오 정보 (DownloadYoutubeAudio.source_info의 duration, acodec, abr, asr).
+                코덱/비트레이트/샘플레이트가 없으면 파일에서 읽고, 길이가 없으면 ffmpeg 출력에서 읽음
+            profile (str): 출력 프로필 (OUTPUT_PROFILES, None이면 config.json의 output.profile)
+            preset (str): 인코딩 프리셋 이름 (DEFAULT_PRESETS 또는 output.presets, None이면 config.json의 output.preset)
+            backend (str): 인코더 백엔드 (ENCODER_BACKENDS, None이면 config.json의 output.encoder_backend)
             
-    def convert(self, input_file, title, quality, save_path, progress_callback=None):
-        """다운로드된 비디오를 MP3로 변환합니다."""
+        Returns:
+            tuple: (최종 파일 경로, 실제 적용된 출력 설정(plan_output의 결과, 사용한 백엔드 이름 'backend'와
+                인코딩 구간 수 'segments' 포함))
+        """
         try:
-            log.info(f"MP3 변환 시작 - 입력 파일: {input_file}")
-            log.info(f"변환 설정 - 제목: {title}, 품질: {quality}, 저장 경로: {save_path}")
+            source = dict(source or {})
+            if not (source.get('acodec') and source.get('abr') and source.get('asr')):
+                # 메타데이터에 없는 값만 파일에서 읽어 채움
+                for key, value in ffmpeg_probe_instance.probe_audio(input_file).items():
+                    if not source.get(key):
+                        source[key] = value
+            duration = source.get('duration')
+            profile = self.get_profile(profile)
+            settings = self.plan_output(profile, quality, source, preset)
+            backend = self.get_backend(backend)
+            if not backend.supports(settings):
+                log.info(f"{backend.name} 백엔드가 {settings['encoder']} 인코더를 지원하지 않아 ffmpeg 백엔드로 인코딩합니다.")
+                backend = ffmpeg_encoder_backend_instance
+            settings['backend'] = backend.name
+            extension = settings['extension']
+            log.info(f"변환 시작 - 입력 파일: {input_file}")
+            log.info(f"변환 설정 - 제목: {title}, 품질: {quality}, 저장 경로: {save_path}, 길이: {duration}초, 프로필: {profile}")
+            log.info(f"출력 설정 - 인코더: {settings['encoder']}, 프리셋: {settings['preset']} ({settings['mode']}), 비트레이트: {settings['bitrate_kbps']}k (요청 {settings['requested_bitrate_kbps']}k), 샘플레이트: {settings['sample_rate'] or '원본'}, 원본: {settings['source_codec']} {settings['source_abr']}k {settings['source_asr']}Hz")
+            progress_callback = ProgressThrottle.wrap(progress_callback, "변환")
             
             # 저장 경로가 없으면 생성
             if not os.path.exists(save_path):
                 log.info(f"저장 경로 생성: {save_path}")
                 os.makedirs(save_path)
                 
-            quality_map = {
-                '320K': '320',
-                '256K': '256',
-                '192K': '192',
-                '160K': '160',
-                '128K': '128',
-                '96K': '96',
-                '64K': '64',
-                '48K': '48'
-            }
+            # 임시 출력 파일 경로
+            temp_mp3 = os.path.join(save_path, f"temp_{int(datetime.now().timestamp())}_{uuid.uuid4().hex[:8]}.{extension}")
+            log.info(f"임시 출력 파일 경로: {temp_mp3}")
             
-            # 임시 MP3 파일 경로
-            temp_mp3 = os.path.join(save_path, f"temp_{int(datetime.now().timestamp())}.mp3")
-            log.info(f"임시 MP3 파일 경로: {temp_mp3}")
+            with performance_log_instance.stage('encode', input_bytes=os.path.getsize(input_file), encoder=settings['encoder'], bitrate_kbps=settings['bitrate_kbps'], backend=backend.name) as perf:
+                stats = backend.encode(input_file, temp_mp3, settings, duration, progress_callback)
+                perf['segments'] = stats['segments']
+                settings['segments'] = stats['segments']
+                if stats['cpu_seconds'] is not None:
+                    # 백엔드가 인코딩에 사용한 CPU 시간 (ffmpeg_cpu_ms: ffmpeg 프로세스, pyav_cpu_ms: 작업 스레드)
+                    perf[f"{backend.name}_cpu_ms"] = round(stats['cpu_seconds'] * 1000, 3)
+                perf['bytes'] = os.path.getsize(temp_mp3)
             
-            # ffmpeg 명령어 구성
-            ffmpeg_path = self.get_ffmpeg_path()
-            cmd = [
-                ffmpeg_path,
-                '-i', input_file,
-                '-acodec', 'libmp3lame',
-                '-b:a', f'{quality_map[quality]}k',
-                '-y',  # 덮어쓰기
-                temp_mp3
-            ]
-            log.info(f"FFmpeg 명령어: {' '.join(cmd)}")
+            with performance_log_instance.stage('rename'):
+                final_path = self.finalize_output(temp_mp3, title, save_path, extension)
+                
+                # 임시 파일 삭제
+                if os.path.exists(input_file):
+                    log.info(f"원본 임시 파일 삭제: {input_file}")
+                    os.remove(input_file)
+                
+            log.info(f"변환 완료: {final_path}")
+            return final_path, settings
             
-            # 진행률 추적을 위한 프로세스 실행
-            process = subprocess.Popen(
-                cmd,
-                stderr=subprocess.PIPE,
-                universal_newlines=True,
-                creationflags=subprocess.CREATE_NO_WINDOW  # CMD 창 숨기기
-            )
+        except Exception as e:
+            log.error(f"변환 중 오류 발생: {str(e)}")
+            log.exception("상세 오류 정보:")
+            raise 
+
+    def start_stream_encode(self, quality, save_path, source=None, preset=None):
+        """표준 입력으로 받은 오디오를 MP3로 인코딩하는 ffmpeg 프로세스를 시작합니다.
+        
+        Args:
+            quality (str): MP3 품질 (예: '192K')
+            save_path (str): 저장 경로
+            source (dict): 원본 오디오 정보 (DownloadYoutubeAudio.source_info, 비트레이트/샘플레이트 제한에 사용)
+            preset (str): 인코딩 프리셋 이름 (None이면 config.json의 output.preset)
             
-            # 진행률 추적
-            duration = None
-            while True:
-                line = process.stderr.readline()
-                if not line and process.poll() is not None:
-                    break
-                    
-                # duration 정보 추출
-                if duration is None and 'Duration:' in line:
-                    match = re.search(r'Duration: (\d{2}):(\d{2}):(\d{2})', line)
-                    if match:
-                        hours, minutes, seconds = map(int, match.groups())
-                        duration = hours * 3600 + minutes * 60 + seconds
-                        log.info(f"변환할 파일 길이: {hours}시간 {minutes}분 {seconds}초")
-                        
-                # 진행률 정보 추출
-                if duration is not None and 'time=' in line:
-                    match = re.search(r'time=(\d{2}):(\d{2}):(\d{2})', line)
-                    if match:
-                        hours, minutes, seconds = map(int, match.groups())
-                        current_time = hours * 3600 + minutes * 60 + seconds
-                        if progress_callback:
-                            progress = (current_time / duration) * 100
-                            progress_callback(progress)
-                            log.debug(f"변환 진행률: {progress:.1f}%")
-                            
-            # 프로세스 종료 확인
-            if process.returncode != 0:
-                error_msg = f"FFmpeg 변환 실패 (종료 코드: {process.returncode})"
-                log.error(error_msg)
-                raise Exception(error_msg)
+        Returns:
+            tuple: (ffmpeg 프로세스(FFmpegProcess), 임시 MP3 파일 경로, 실제 적용된 출력 설정)
+        """
+        settings = self.plan_output('mp3', quality, source, preset)
+        # 표준 입력으로 받는 스트리밍은 항상 ffmpeg 프로세스로 인코딩
+        settings['backend'] = ffmpeg_encoder_backend_instance.name
+        if not os.path.exists(save_path):
+            log.info(f"저장 경로 생성: {save_path}")
+            os.makedirs(save_path)
             
-            # 최종 파일명으로 변경
-            final_filename = f"{title}.mp3"
+        temp_mp3 = os.path.join(save_path, f"temp_{int(datetime.now().timestamp())}_{uuid.uuid4().hex[:8]}.mp3")
+        cmd = [
+            self.get_ffmpeg_path(),
+            *ffmpeg_runner_instance.thread_args(),
+            '-i', 'pipe:0',
+            *ffmpeg_encoder_backend_instance.encoder_args(settings),
+            *ffmpeg_runner_instance.thread_args(),
+            '-y',  # 덮어쓰기
+            temp_mp3
+        ]
+        log.info(f"FFmpeg 스트리밍 명령어: {' '.join(cmd)}")
+        
+        process = ffmpeg_runner_instance.start(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE
+        )
+        trace_log_instance.process_started(process, streaming=True)
+        return process, temp_mp3, settings
+
+    def finalize_output(self, temp_mp3, title, save_path, extension='mp3'):
+        """임시 출력 파일을 중복되지 않는 최종 파일명으로 옮깁니다.
+        
+        Returns:
+            str: 최종 파일 경로
+        """
+        # 동시에 실행되는 변환끼리 같은 이름을 고르지 않도록 잠금
+        with self._rename_lock:
+            final_filename = f"{title}.{extension}"
             final_path = os.path.join(save_path, final_filename)
             log.info(f"최종 파일 경로: {final_path}")
             
             # 파일명 중복 처리
             counter = 1
             while os.path.exists(final_path):
-                final_filename = f"{title}_{counter}.mp3"
+                final_filename = f"{title}_{counter}.{extension}"
                 final_path = os.path.join(save_path, final_filename)
                 counter += 1
                 log.info(f"파일명 중복으로 변경: {final_filename}")
                 
             log.info(f"임시 파일을 최종 파일로 이동: {temp_mp3} -> {final_path}")
             os.rename(temp_mp3, final_path)
-            
-            # 임시 파일 삭제
-            if os.path.exists(input_file):
-                log.info(f"원본 임시 파일 삭제: {input_file}")
-                os.remove(input_file)
-                
-            log.info(f"MP3 변환 완료: {final_path}")
-            return final_path
-            
-        except Exception as e:
-            log.error(f"변환 중 오류 발생: {str(e)}")
-            log.exception("상세 오류 정보:")
-            raise 
+        return final_path
 
 # 싱글톤 인스턴스 생성
 converter_to_mp3_instance = ConverterToMP3()
\ No newline at end of file
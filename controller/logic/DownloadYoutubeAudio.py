@@ -1,8 +1,29 @@
+import copy
 import yt_dlp
+from yt_dlp.networking import Request
+from yt_dlp.networking.exceptions import HTTPError
 import os
+import time
 import threading
-from datetime import datetime
 from model.Log import log
+from model.MetadataCache import metadata_cache_instance
+from model.Configuration import configuration_instance
+from model.PerformanceLog import performance_log_instance
+from controller.logic.CheckURL import check_url_instance
+from controller.logic.YoutubeDLPool import youtube_dl_pool_instance
+from controller.logic.RangeDownloader import range_downloader_instance, honours_range, RangeNotSupportedError
+from controller.logic.ProgressThrottle import ProgressThrottle
+
+# 다운로드 임시 파일 접두사 (partial_<비디오 ID>_<포맷 ID>.<확장자>)
+PARTIAL_PREFIX = 'partial_'
+# 스트리밍 읽기 단위
+STREAM_READ_SIZE = 64 * 1024
+# 청크 크기 정보가 없을 때 Range 요청 한 번에 받을 크기 (YouTube 전송 속도 제한 회피)
+DEFAULT_HTTP_CHUNK_SIZE = 10 * 1024 * 1024
+
+class StreamingNotSupportedError(Exception):
+    """선택된 포맷을 스트리밍으로 받을 수 없을 때 발생하는 예외 (파일 다운로드로 대체해야 함)"""
+    pass
 
 class DownloadYoutubeAudio:
     _instance = None
@@ -15,48 +36,317 @@ class DownloadYoutubeAudio:
         return cls._instance
     
     def __init__(self):
-        pass
+        with self._lock:
+            if not hasattr(self, '_settings'):
+                self._settings = None
             
-    def download_audio(self, url, quality, save_path=None, progress_callback=None, speed_callback=None):
-        """YouTube 비디오에서 오디오만 다운로드합니다."""
+    def download_audio(self, url, quality, save_path=None, progress_callback=None, speed_callback=None, info=None):
+        """YouTube 비디오에서 오디오만 다운로드합니다.
+        
+        info가 주어지거나 (YoutubeTitle.get_info()의 결과) 메타데이터 캐시에 정보가 있으면
+        정보 추출을 다시 하지 않고 포맷 선택과 다운로드만 수행합니다.
+        
+        Returns:
+            tuple: (다운로드된 파일 경로, 비디오 제목, 원본 오디오 정보(source_info))
+        """
         try:
             log.info(f"다운로드 시작 - URL: {url}")
             log.info(f"다운로드 설정 - 품질: {quality}")
+            progress_callback = ProgressThrottle.wrap(progress_callback, "다운로드")
             
             # 저장 경로 설정
             save_path = self._setup_save_path(save_path)
             log.info(f"저장 경로: {save_path}")
             
-            # 임시 파일명 생성
-            temp_filename = f"temp_{int(datetime.now().timestamp())}"
-            temp_path = os.path.join(save_path, f"{temp_filename}.%(ext)s")
+            # 비디오/포맷별로 고정된 임시 파일명 사용
+            # 중단된 다운로드의 .part 파일이 남아 있으면 yt-dlp가 HTTP Range 요청으로 이어받음
+            temp_path = os.path.join(save_path, f"{PARTIAL_PREFIX}%(id)s_%(format_id)s.%(ext)s")
             log.info(f"임시 파일 경로: {temp_path}")
             
-            # yt_dlp 옵션 설정
+            # yt_dlp 작업별 옵션 설정 (공통 옵션은 YoutubeDLPool에서 적용)
             ydl_opts = self._make_ydl_option(quality, temp_path, progress_callback, speed_callback)
-            log.info(f"yt-dlp 옵션: {ydl_opts}")
+            log.info("yt-dlp 옵션: %s", ydl_opts)
             
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                log.info("비디오 정보 추출 중...")
-                info = ydl.extract_info(url, download=True)
-                log.info(f"비디오 제목: {info['title']}")
+            with youtube_dl_pool_instance.acquire(**ydl_opts) as ydl:
+                # 포맷을 먼저 선택하고, 병렬 다운로드가 켜져 있고 단일 HTTP 스트림이면 여러 연결로 나누어 받음
+                selected = self._extract_or_process(ydl, url, info, download=False)
+                log.info(f"비디오 제목: {selected['title']}")
                 
-                # 다운로드된 파일 경로 찾기
-                downloaded_files = [f for f in os.listdir(save_path) if f.startswith(temp_filename)]
-                if not downloaded_files:
-                    error_msg = "다운로드된 파일을 찾을 수 없습니다."
-                    log.error(error_msg)
-                    raise FileNotFoundError(error_msg)
+                try:
+                    downloaded_file = self._download_selected(ydl, selected, save_path, progress_callback, speed_callback)
+                except Exception as e:
+                    if not self._is_expired_url_error(e):
+                        raise
+                    # 미리 추출되었거나 캐시된 포맷 URL이 만료되었을 수 있으므로 정보를 다시 추출하여 한 번 더 시도
+                    log.warning(f"다운로드 실패, 비디오 정보를 다시 추출하여 재시도합니다: {str(e)}")
+                    metadata_cache_instance.invalidate(check_url_instance.extract_video_id(url))
+                    selected = self._extract_or_process(ydl, url, None, download=False)
+                    downloaded_file = self._download_selected(ydl, selected, save_path, progress_callback, speed_callback)
                     
-                downloaded_file = os.path.join(save_path, downloaded_files[0])
                 log.info(f"다운로드 완료: {downloaded_file}")
-                return downloaded_file, info['title']
+                return downloaded_file, selected['title'], self.source_info(selected)
                 
         except Exception as e:
             log.error(f"다운로드 중 오류 발생: {str(e)}")
             log.exception("상세 오류 정보:")
             raise
             
+    def _download_selected(self, ydl, selected, save_path, progress_callback, speed_callback):
+        """선택된 포맷을 다운로드합니다 (병렬 다운로드가 켜져 있고 단일 HTTP 스트림이면 여러 연결로 나누어 받음)."""
+        with performance_log_instance.stage('download', format_id=selected.get('format_id')) as perf:
+            downloaded_file = None
+            if self._parallel_settings()['parallel_download'] and self._can_download_in_ranges(selected):
+                downloaded_file = self._download_in_ranges(ydl, selected, save_path, progress_callback, speed_callback)
+            if downloaded_file is None:
+                downloaded_file = self._download_single(ydl, selected, save_path)
+            perf['bytes'] = os.path.getsize(downloaded_file)
+        return downloaded_file
+
+    @staticmethod
+    def _is_expired_url_error(error):
+        """포맷 URL 만료로 볼 수 있는 다운로드 오류인지 확인합니다 (yt-dlp 다운로드 오류, HTTP 403/410)."""
+        if isinstance(error, yt_dlp.utils.DownloadError):
+            return True
+        return isinstance(error, HTTPError) and error.status in (403, 410)
+
+    @staticmethod
+    def source_info(info):
+        """선택된 포맷에서 변환에 필요한 원본 오디오 정보를 꺼냅니다.
+
+        Returns:
+            dict: duration(초), acodec(예: 'opus', 'mp4a.40.2'), abr(kbps), asr(Hz), ext. 모르는 값은 None
+        """
+        return {
+            'duration': info.get('duration'),
+            'acodec': info.get('acodec'),
+            'abr': info.get('abr'),
+            'asr': info.get('asr'),
+            'ext': info.get('ext')
+        }
+
+    def _parallel_settings(self):
+        """config.json의 download 항목에서 병렬 다운로드 설정을 읽습니다."""
+        if self._settings is None:
+            self._settings = {
+                'parallel_download': configuration_instance.get_or_default(False, "download", "parallel_download"),
+                'connections_per_job': max(1, configuration_instance.get_or_default(4, "download", "connections_per_job")),
+                'max_connections': max(1, configuration_instance.get_or_default(16, "download", "max_connections")),
+                'chunk_size': configuration_instance.get_or_default(4, "download", "chunk_size_mb") * 1024 * 1024
+            }
+        return self._settings
+        
+    def _can_download_in_ranges(self, info):
+        """선택된 포맷을 Range 요청으로 나누어 받을 수 있는지 확인합니다."""
+        settings = self._parallel_settings()
+        return (not info.get('requested_formats')
+                and info.get('protocol') in ('http', 'https')
+                and settings['connections_per_job'] > 1
+                and (info.get('filesize') or 0) >= settings['chunk_size'] * 2)
+                
+    def _download_in_ranges(self, ydl, info, save_path, progress_callback, speed_callback):
+        """선택된 포맷을 여러 연결로 나누어 다운로드합니다.
+
+        Returns:
+            str: 다운로드된 파일 경로 (서버가 Range 요청을 지원하지 않으면 None, 단일 연결로 받아야 함)
+        """
+        settings = self._parallel_settings()
+        output_path = os.path.join(save_path, f"{PARTIAL_PREFIX}{info['id']}_{info['format_id']}.{info['ext']}")
+        if os.path.exists(output_path):
+            log.info(f"이미 다운로드된 파일 사용: {output_path}")
+            return output_path
+            
+        try:
+            return range_downloader_instance.download(
+                ydl,
+                info['url'],
+                info.get('http_headers') or {},
+                info['filesize'],
+                output_path,
+                connections=min(settings['connections_per_job'], settings['max_connections']),
+                chunk_size=settings['chunk_size'],
+                progress_hook=lambda d: self._progress_hook(d, progress_callback, speed_callback)
+            )
+        except RangeNotSupportedError as e:
+            log.warning(f"분할 다운로드 불가, 단일 연결로 다운로드합니다: {str(e)}")
+            return None
+
+    def _download_single(self, ydl, info, save_path):
+        """선택된 포맷을 yt-dlp로 다운로드합니다 (단일 연결 또는 DASH/HLS 조각).
+
+        DASH/HLS 조각은 yt-dlp가 concurrent_fragment_downloads개의 연결로 받으므로,
+        병렬 다운로드가 켜져 있으면 그만큼의 연결을 전체 연결 수 제한에서 예약합니다.
+        """
+        if self._parallel_settings()['parallel_download']:
+            with range_downloader_instance.reserve_connections(self._connections_needed(info)):
+                info = self._process(ydl, info, download=True)
+        else:
+            info = self._process(ydl, info, download=True)
+
+        # 다운로드된 파일 경로 찾기
+        downloaded_file = self._find_downloaded_file(info, save_path)
+        if downloaded_file is None:
+            error_msg = "다운로드된 파일을 찾을 수 없습니다."
+            log.error(error_msg)
+            raise FileNotFoundError(error_msg)
+        return downloaded_file
+        
+    def _connections_needed(self, info):
+        """yt-dlp가 이 포맷을 받을 때 여는 연결 수 (조각 포맷이면 concurrent_fragment_downloads, 아니면 1)"""
+        formats = info.get('requested_formats') or [info]
+        if any(f.get('protocol') not in ('http', 'https') for f in formats):
+            return self._fragment_concurrency()
+        return 1
+
+    def _find_downloaded_file(self, info, save_path):
+        """yt-dlp가 기록한 다운로드 파일 경로를 반환합니다."""
+        for download in info.get('requested_downloads') or []:
+            filepath = download.get('filepath')
+            if filepath and os.path.exists(filepath):
+                return filepath
+                
+        prefix = f"{PARTIAL_PREFIX}{info.get('id')}_{info.get('format_id')}."
+        for f in os.listdir(save_path):
+            if f.startswith(prefix) and not f.endswith('.part'):
+                return os.path.join(save_path, f)
+        return None
+            
+    def stream_audio(self, url, quality, open_sink, progress_callback=None, speed_callback=None, info=None):
+        """YouTube 오디오를 임시 파일 없이 받아 sink로 흘려보냅니다.
+        
+        open_sink는 데이터 수신 전에 추출된 info dict로 한 번 호출되며,
+        write(bytes)를 가진 객체(예: ffmpeg 프로세스의 stdin)를 반환해야 합니다.
+        
+        Args:
+            url (str): YouTube URL
+            quality (str): 오디오 품질 (예: '192K')
+            open_sink (callable): info dict를 받아 쓰기 가능한 객체를 반환하는 함수
+            progress_callback (callable): 진행률(0-100) 콜백
+            speed_callback (callable): 다운로드 속도 문자열 콜백
+            info (dict): YoutubeTitle.get_info()로 미리 추출한 정보 (없으면 새로 추출)
+            
+        Returns:
+            dict: 추출된 비디오 정보
+            
+        Raises:
+            StreamingNotSupportedError: 선택된 포맷이 단일 HTTP 스트림이 아닌 경우
+        """
+        try:
+            log.info(f"스트리밍 다운로드 시작 - URL: {url}, 품질: {quality}")
+            progress_callback = ProgressThrottle.wrap(progress_callback, "다운로드")
+            ydl_opts = self._make_ydl_option(quality, '%(id)s.%(ext)s', None, None)
+            ydl_opts.pop('progress_hooks')
+            
+            with youtube_dl_pool_instance.acquire(**ydl_opts) as ydl:
+                info = self._extract_or_process(ydl, url, info, download=False)
+                
+                # DASH/HLS 조각 다운로드나 비디오+오디오 병합은 스트리밍하지 않음
+                if info.get('requested_formats') or info.get('protocol') not in ('http', 'https'):
+                    raise StreamingNotSupportedError(f"스트리밍을 지원하지 않는 포맷입니다: {info.get('format_id')} ({info.get('protocol')})")
+                    
+                log.info(f"스트리밍 포맷: {info.get('format_id')} ({info.get('ext')}), 제목: {info['title']}")
+                sink = open_sink(info)
+                with performance_log_instance.stage('download', format_id=info.get('format_id'), streaming=True) as perf:
+                    perf['bytes'] = self._pump_http_stream(ydl, info, sink, progress_callback, speed_callback)
+                log.info(f"스트리밍 다운로드 완료: {info['title']}")
+                return info
+                
+        except StreamingNotSupportedError as e:
+            log.info(str(e))
+            raise
+        except Exception as e:
+            # 캐시된 포맷 URL이 만료되었을 수 있으므로 다음 시도에서는 새로 추출
+            metadata_cache_instance.invalidate(check_url_instance.extract_video_id(url))
+            log.error(f"스트리밍 다운로드 중 오류 발생: {str(e)}")
+            log.exception("상세 오류 정보:")
+            raise
+            
+    def _extract_or_process(self, ydl, url, info, download):
+        """미리 추출된 정보나 캐시된 정보가 있으면 재사용하고, 없으면 새로 추출합니다."""
+        video_id = check_url_instance.extract_video_id(url)
+        if not self._has_formats(info):
+            info = metadata_cache_instance.get(video_id)
+            
+        if self._has_formats(info):
+            log.info("미리 추출된 비디오 정보 재사용 (정보 추출 생략)")
+            try:
+                return self._process(ydl, info, download)
+            except yt_dlp.utils.DownloadError as e:
+                # 저장된 포맷 URL이 만료되었을 수 있으므로 새로 추출
+                log.warning(f"저장된 비디오 정보로 처리 실패, 정보를 다시 추출합니다: {str(e)}")
+                metadata_cache_instance.invalidate(video_id)
+                
+        log.info("비디오 정보 추출 중...")
+        with performance_log_instance.stage('metadata', source='extract'):
+            info = ydl.extract_info(url, download=False, process=False)
+        metadata_cache_instance.put(info.get('id') or video_id, info)
+        return self._process(ydl, info, download)
+        
+    def _process(self, ydl, info, download):
+        """원본 정보로 포맷을 선택하고, download가 True이면 다운로드까지 수행합니다."""
+        # process_ie_result가 info를 수정하므로 호출자의 원본은 보존
+        if download:
+            return ydl.process_ie_result(copy.deepcopy(info), download=True)
+        with performance_log_instance.stage('format_selection'):
+            return ydl.process_ie_result(copy.deepcopy(info), download=False)
+        
+    def _has_formats(self, info):
+        """info로 정보 추출 없이 포맷 선택을 할 수 있는지 확인합니다."""
+        return bool(info) and bool(info.get('formats') or info.get('url'))
+        
+    def _pump_http_stream(self, ydl, info, sink, progress_callback, speed_callback):
+        """HTTP Range 요청을 청크 단위로 보내며 받은 데이터를 sink에 씁니다.
+        
+        Returns:
+            int: 받은 바이트 수
+        """
+        total = info.get('filesize') or info.get('filesize_approx') or 0
+        chunk_size = (info.get('downloader_options') or {}).get('http_chunk_size') or DEFAULT_HTTP_CHUNK_SIZE
+        headers = info.get('http_headers') or {}
+        downloaded = 0
+        start_time = time.monotonic()
+        
+        while True:
+            range_end = downloaded + chunk_size - 1
+            request_headers = dict(headers, Range=f'bytes={downloaded}-{range_end}')
+            try:
+                response = ydl.urlopen(Request(info['url'], headers=request_headers))
+            except HTTPError as e:
+                # 크기를 모르는 스트림이 청크 경계에서 정확히 끝난 경우
+                if e.status == 416 and downloaded > 0:
+                    break
+                raise
+            # 서버가 Range 요청을 무시하고 200으로 전체 본문을 보내면, 다음 청크를 요청할 때마다
+            # 같은 데이터를 처음부터 다시 받게 되므로 이 응답 하나로 끝까지 받고 멈춤
+            partial = honours_range(response, downloaded)
+            if not partial:
+                if downloaded > 0:
+                    response.close()
+                    raise IOError(f"서버가 Range 요청을 지원하지 않아 {downloaded} 바이트 이후부터 이어받을 수 없습니다.")
+                log.info("서버가 Range 요청을 지원하지 않아 전체 본문을 한 번에 받습니다.")
+            received = 0
+            try:
+                while True:
+                    data = response.read(STREAM_READ_SIZE)
+                    if not data:
+                        break
+                    sink.write(data)
+                    received += len(data)
+                    downloaded += len(data)
+                    self._progress_hook({
+                        'status': 'downloading',
+                        'total_bytes': total,
+                        'downloaded_bytes': downloaded,
+                        'speed': downloaded / max(time.monotonic() - start_time, 1e-6)
+                    }, progress_callback, speed_callback)
+            finally:
+                response.close()
+                
+            # 전체 본문을 받았거나 요청한 청크보다 적게 받았으면 스트림의 끝
+            if not partial or received < chunk_size or (total and downloaded >= total):
+                break
+
+        return downloaded
+
     def _setup_save_path(self, save_path):
         """저장 경로를 설정하고 필요한 경우 생성합니다."""
         if save_path is None:
@@ -70,7 +360,7 @@ class DownloadYoutubeAudio:
         return save_path
             
     def _make_ydl_option(self, quality, temp_path, progress_callback, speed_callback):
-        """yt_dlp 옵션을 생성합니다."""
+        """작업별 yt_dlp 옵션을 생성합니다."""
         quality_map = {
             '320K': '320',
             '256K': '256',
@@ -88,15 +378,16 @@ class DownloadYoutubeAudio:
             'format': f'bestaudio[abr<={quality_map[quality]}]',
             'outtmpl': temp_path,
             'progress_hooks': [lambda d: self._progress_hook(d, progress_callback, speed_callback)],
-            'noplaylist': True,
-            'extract_flat': False,
-            'quiet': True,
-            'no_warnings': True,
-            'noprogress': True,
-            'logger': log,
-            'verbose': False,
-            'ignoreerrors': False
+            'continuedl': True,  # 남아 있는 .part 파일 이어받기
+            # DASH/HLS 조각을 동시에 받을 개수 (병렬 다운로드를 사용하지 않으면 1)
+            'concurrent_fragment_downloads': self._fragment_concurrency()
         }
+        
+    def _fragment_concurrency(self):
+        settings = self._parallel_settings()
+        if not settings['parallel_download']:
+            return 1
+        return min(settings['connections_per_job'], settings['max_connections'])
             
     def _progress_hook(self, d, progress_callback, speed_callback):
         """다운로드 진행 상황을 추적하고 콜백을 호출합니다."""
@@ -109,12 +400,9 @@ class DownloadYoutubeAudio:
                 if total > 0 and progress_callback:
                     percentage = int((downloaded / total) * 100)
                     progress_callback(percentage)
-                    log.debug(f"다운로드 진행률: {percentage}%")
                     
                 if speed and speed_callback:
-                    speed_str = f"{speed/1024/1024:.1f} MB/s"
-                    speed_callback(speed_str)
-                    log.debug(f"다운로드 속도: {speed_str}")
+                    speed_callback(f"{speed/1024/1024:.1f} MB/s")
                     
             except Exception as e:
                 log.error(f"진행 상황 업데이트 중 오류 발생: {str(e)}")
@@ -0,0 +1,46 @@
+# 인코더 백엔드 (config.json의 output.encoder_backend)
+# - ffmpeg: 파일마다 ffmpeg 프로세스를 실행 (기본값, 긴 오디오는 구간 병렬 인코딩)
+# - pyav: PyAV(libav 바인딩)로 작업 스레드 안에서 디코딩/인코딩 (pip install av 필요)
+ENCODER_BACKENDS = ('ffmpeg', 'pyav')
+
+class EncoderBackendError(Exception):
+    """선택한 인코더 백엔드를 사용할 수 없을 때 발생하는 예외 (라이브러리 없음, 인코더 없음)"""
+    pass
+
+class EncoderBackend:
+    """인코더 백엔드 인터페이스
+
+    ConverterToMP3.convert가 출력 설정(plan_output의 결과)을 정한 뒤 백엔드의 encode()로
+    입력 파일을 임시 출력 파일로 인코딩하며, 파일 이름 정리와 입력 파일 삭제는 ConverterToMP3가 합니다.
+    새 백엔드는 이 클래스를 상속하고 ENCODER_BACKENDS와 ConverterToMP3.get_backend에 등록합니다.
+    모든 백엔드는 tests/test_encoder_backends.py의 확인 항목을 통과해야 합니다.
+    """
+
+    # config.json과 작업 결과에 쓰는 백엔드 이름
+    name = None
+
+    def is_available(self):
+        """백엔드를 사용할 수 있는지 확인합니다 (필요한 라이브러리/실행 파일이 있는지)."""
+        raise NotImplementedError
+
+    def supports(self, settings):
+        """출력 설정을 이 백엔드로 인코딩할 수 있는지 확인합니다 (지원하지 않으면 ffmpeg 백엔드 사용)."""
+        return True
+
+    def encode(self, input_file, output_file, settings, duration=None, progress_callback=None):
+        """입력 오디오를 출력 설정대로 인코딩(또는 스트림 복사)하여 output_file에 저장합니다.
+
+        Args:
+            input_file (str): 입력 오디오 파일 경로
+            output_file (str): 출력 파일 경로 (확장자는 settings['extension'])
+            settings (dict): ConverterToMP3.plan_output의 출력 설정
+            duration (float): 입력 길이 (초, 진행률 계산에 사용, 없으면 백엔드가 확인)
+            progress_callback (callable): 진행률(0-100) 콜백, 끝나면 100을 전달
+
+        Returns:
+            dict: cpu_seconds(인코딩에 사용한 CPU 시간, 모르면 None), segments(동시에 인코딩한 구간 수)
+
+        Raises:
+            Exception: 인코딩에 실패한 경우 (output_file은 남지 않음)
+        """
+        raise NotImplementedError
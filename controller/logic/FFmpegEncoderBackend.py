@@ -0,0 +1,194 @@
+import os
+import re
+import subprocess
+import threading
+from collections import deque
+from model.Log import log
+from model.PerformanceLog import performance_log_instance
+from model.TraceLog import trace_log_instance
+from controller.logic.EncoderBackend import EncoderBackend
+from controller.logic.FFmpegRunner import ffmpeg_runner_instance
+from controller.logic.FFmpegProbe import ffmpeg_probe_instance, FFmpegNotFoundError
+from controller.logic.SegmentedEncoder import segmented_encoder_instance, Mp3SpliceError
+
+# ffmpeg stderr에서 읽는 입력 길이 (메타데이터에 길이가 없을 때만 사용)
+_DURATION_PATTERN = re.compile(r'Duration: (\d+):(\d{2}):(\d{2}(?:\.\d+)?)')
+# -benchmark 옵션의 종료 시 출력 (사용자/시스템 CPU 시간)
+_BENCHMARK_PATTERN = re.compile(r'utime=([\d.]+)s stime=([\d.]+)s')
+
+class FFmpegEncoderBackend(EncoderBackend):
+    """파일마다 ffmpeg 프로세스를 실행하여 인코딩하는 백엔드 (기본값)
+
+    프로세스는 FFmpegRunner로 시작하므로 config.json의 ffmpeg 항목(스레드 수, 우선순위,
+    CPU 고정, 제한 시간)이 적용되고, 긴 오디오는 SegmentedEncoder로 나누어 동시에 인코딩합니다.
+    진행률은 ffmpeg의 -progress 출력에서 읽습니다.
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    name = 'ffmpeg'
+
+    def __new__(cls):
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super(FFmpegEncoderBackend, cls).__new__(cls)
+        return cls._instance
+
+    def is_available(self):
+        try:
+            ffmpeg_probe_instance.probe()
+        except FFmpegNotFoundError:
+            return False
+        return True
+
+    def encode(self, input_file, output_file, settings, duration=None, progress_callback=None):
+        segments = segmented_encoder_instance.plan(settings, duration)
+        try:
+            if segments:
+                # 구간마다 ffmpeg 프로세스가 하나씩 필요하므로, 이 작업의 슬롯에 더해
+                # 작업 엔진의 비어 있는 인코딩 슬롯을 빌린 만큼만 나눔
+                with ffmpeg_runner_instance.borrow_slots(len(segments) - 1) as extra:
+                    segments = segmented_encoder_instance.plan(settings, duration, max_segments=extra + 1)
+                    if segments:
+                        try:
+                            cpu_seconds = segmented_encoder_instance.encode(
+                                input_file, output_file, segments, self.encoder_args(settings),
+                                self.run, progress_callback, duration
+                            )
+                            return {'cpu_seconds': cpu_seconds, 'segments': len(segments)}
+                        except Mp3SpliceError as e:
+                            # 구간 출력이 맞지 않으면 (예: 메타데이터 길이가 실제와 다름) 한 번에 다시 인코딩
+                            log.warning(f"구간 인코딩 실패, 전체 인코딩으로 다시 시도: {str(e)}")
+                    else:
+                        log.info("비어 있는 인코딩 슬롯이 없어 구간으로 나누지 않고 인코딩합니다.")
+
+            # ffmpeg 명령어 구성
+            # 진행 상황은 -progress로 표준 출력에 key=value 형식으로 받고, 표준 에러의 상태 줄은 끔
+            thread_args = [] if settings['encoder'] == 'copy' else ffmpeg_runner_instance.thread_args()
+            cmd = [
+                ffmpeg_probe_instance.get_ffmpeg_path(),
+                '-nostats',
+                '-progress', 'pipe:1',
+                *thread_args,  # 디코더 스레드 수
+                '-i', input_file,
+                *self.encoder_args(settings),
+                *thread_args,  # 인코더 스레드 수
+                '-y',  # 덮어쓰기
+                output_file
+            ]
+            if performance_log_instance.is_enabled():
+                # 종료 시 ffmpeg 자신의 CPU 시간을 출력
+                cmd.insert(1, '-benchmark')
+            stderr_state = self.run(cmd, duration, progress_callback, input_file=os.path.basename(input_file))
+            return {'cpu_seconds': stderr_state['cpu_seconds'], 'segments': 1}
+        except BaseException:
+            # 실패한 인코딩의 출력 파일은 남기지 않음
+            if os.path.exists(output_file):
+                os.remove(output_file)
+            raise
+
+    def encoder_args(self, settings):
+        """출력 설정에 맞는 ffmpeg 인코더 옵션"""
+        if settings['encoder'] == 'copy':
+            # 디코딩/인코딩 없이 첫 번째 오디오 스트림만 새 컨테이너로 옮김
+            return ['-map', '0:a:0', '-c:a', 'copy']
+        args = ['-acodec', settings['encoder']]
+        if settings['mode'] == 'vbr':
+            args += ['-q:a', str(settings['vbr_quality'])]
+        else:
+            args += ['-b:a', f"{settings['bitrate_kbps']}k"]
+            if settings['mode'] == 'abr':
+                args += ['-abr', '1']
+        if settings['compression_level'] is not None:
+            args += ['-compression_level', str(settings['compression_level'])]
+        if settings['joint_stereo'] is not None:
+            args += ['-joint_stereo', '1' if settings['joint_stereo'] else '0']
+        if settings['channels']:
+            args += ['-ac', str(settings['channels'])]
+        if settings['sample_rate']:
+            args += ['-ar', str(settings['sample_rate'])]
+        return args
+
+    def run(self, cmd, duration, progress_callback=None, **trace_args):
+        """ffmpeg 명령을 실행하고 진행률을 전달하며 끝날 때까지 기다립니다.
+
+        Args:
+            cmd (list): ffmpeg 명령어 (-progress pipe:1 포함)
+            duration (float): 입력 길이 (초, 진행률 계산에 사용, 없으면 ffmpeg 출력에서 읽음)
+            progress_callback (callable): 진행률(0-100) 콜백
+            **trace_args: 트레이스에 함께 기록할 값
+
+        Returns:
+            dict: stderr 상태 (tail, duration, cpu_seconds)
+        """
+        log.info(f"FFmpeg 명령어: {' '.join(cmd)}")
+        # 예외로 블록을 벗어나면 ffmpeg 프로세스 그룹을 종료
+        with ffmpeg_runner_instance.start(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True
+        ) as process:
+            trace_log_instance.process_started(process, **trace_args)
+
+            # stderr는 별도 스레드에서 비워 파이프 버퍼가 가득 차 멈추지 않도록 함
+            stderr_state = {'tail': deque(maxlen=10), 'duration': None, 'cpu_seconds': None}
+            drain_thread = threading.Thread(target=self._drain_stderr, args=(process.stderr, stderr_state), daemon=True)
+            drain_thread.start()
+
+            try:
+                self._read_progress(process.stdout, duration, stderr_state, progress_callback)
+                returncode = process.wait()
+                drain_thread.join()
+            finally:
+                trace_log_instance.process_finished(process)
+        process.check_timeout()
+
+        # 프로세스 종료 확인
+        if returncode != 0:
+            error_msg = f"FFmpeg 변환 실패 (종료 코드: {returncode}): {' / '.join(stderr_state['tail'])}"
+            log.error(error_msg)
+            raise Exception(error_msg)
+        return stderr_state
+
+    def _read_progress(self, stream, duration, stderr_state, progress_callback):
+        """ffmpeg -progress 출력(key=value 줄)을 읽어 진행률 콜백을 호출합니다.
+
+        out_time_us는 마이크로초 단위의 인코딩 위치이며, 한 블록은 progress=continue/end 줄로 끝납니다.
+        """
+        duration_us = duration * 1_000_000 if duration else None
+        for line in stream:
+            key, _, value = line.strip().partition('=')
+            if key == 'out_time_us':
+                if duration_us is None and stderr_state['duration']:
+                    # 메타데이터에 길이가 없으면 ffmpeg이 출력한 입력 길이 사용
+                    duration_us = stderr_state['duration'] * 1_000_000
+                if progress_callback and duration_us and value.isdigit():
+                    progress_callback(min(100.0, int(value) / duration_us * 100))
+            elif key == 'progress' and value == 'end':
+                if progress_callback:
+                    progress_callback(100.0)
+        stream.close()
+
+    def _drain_stderr(self, stream, state):
+        """ffmpeg stderr를 끝까지 읽으며 마지막 몇 줄, 입력 길이, CPU 시간(-benchmark)을 보관합니다."""
+        for line in stream:
+            line = line.strip()
+            if not line:
+                continue
+            state['tail'].append(line)
+            if state['duration'] is None and 'Duration:' in line:
+                match = _DURATION_PATTERN.search(line)
+                if match:
+                    hours, minutes, seconds = match.groups()
+                    state['duration'] = int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+            elif line.startswith('bench: utime='):
+                match = _BENCHMARK_PATTERN.search(line)
+                if match:
+                    state['cpu_seconds'] = float(match.group(1)) + float(match.group(2))
+        stream.close()
+
+# 싱글톤 인스턴스 생성
+ffmpeg_encoder_backend_instance = FFmpegEncoderBackend()
@@ -0,0 +1,254 @@
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import threading
+from model.Log import log
+from model.Configuration import configuration_instance
+from model.PerformanceLog import performance_log_instance
+
+# 출력 코덱별 인코더 (우선순위 순). 'copy'는 재인코딩 없이 스트림 복사
+# MP3는 프리셋의 VBR/ABR, compression_level, joint_stereo 옵션이 LAME 옵션이므로 libmp3lame만 사용
+ENCODER_PREFERENCE = {
+    'mp3': ['libmp3lame']
+}
+# 프로브 명령 제한 시간 (초)
+PROBE_TIMEOUT = 10
+# `ffmpeg -i` 출력의 오디오 스트림 줄 (예: "Audio: aac (LC) (mp4a / 0x6134706D), 44100 Hz, stereo, fltp, 128 kb/s")
+_AUDIO_STREAM_PATTERN = re.compile(r'Audio: (\w+).*?, (\d+) Hz(?:.*?, (\d+) kb/s)?')
+# 스트림에 비트레이트가 없을 때 사용하는 전체 비트레이트 (예: "Duration: 00:03:00.05, start: 0.000000, bitrate: 130 kb/s")
+_TOTAL_BITRATE_PATTERN = re.compile(r'Duration: (\d+):(\d{2}):(\d{2}(?:\.\d+)?).*?bitrate: (\d+) kb/s')
+
+def get_application_path():
+    if getattr(sys, 'frozen', False):
+        # PyInstaller로 패키징된 경우
+        return os.path.dirname(sys.executable)
+    else:
+        # 개발 환경
+        return os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+class FFmpegNotFoundError(Exception):
+    """ffmpeg 실행 파일이 없거나 실행할 수 없을 때 발생하는 예외"""
+    pass
+
+class EncoderNotFoundError(FFmpegNotFoundError):
+    """ffmpeg이 필요한 인코더를 지원하지 않을 때 발생하는 예외"""
+    pass
+
+class FFmpegProbe:
+    """ffmpeg 실행 파일 위치와 지원 인코더를 한 번만 확인하여 보관하는 클래스
+
+    `ffmpeg -version`, `ffmpeg -encoders` 결과를 실행 파일의 수정 시간/크기와 함께
+    파일(config.json의 cache.ffmpeg_probe_file)에 저장하므로, 실행 파일이 바뀌지 않았으면
+    다음 실행에서는 ffmpeg을 실행하지 않고 저장된 결과를 사용합니다.
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super(FFmpegProbe, cls).__new__(cls)
+                cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        with self._lock:
+            if not self._initialized:
+                self._initialized = True
+                self._path = None
+                self._info = None
+
+    def get_ffmpeg_path(self):
+        """ffmpeg 실행 파일 경로를 반환합니다 (처음 한 번만 확인).
+
+        Raises:
+            FFmpegNotFoundError: ffmpeg 실행 파일을 찾을 수 없는 경우
+        """
+        if self._path is None:
+            with self._lock:
+                if self._path is None:
+                    self._path = self._resolve_path()
+        return self._path
+
+    def probe(self):
+        """ffmpeg 버전과 지원 인코더를 확인합니다 (결과는 캐시).
+
+        시작 시 호출하여 ffmpeg이 없으면 다운로드 전에 실패하도록 합니다.
+
+        Returns:
+            dict: {'path', 'version', 'encoders'(set)}
+
+        Raises:
+            FFmpegNotFoundError: ffmpeg 실행 파일이 없거나 실행할 수 없는 경우
+        """
+        if self._info is None:
+            path = self.get_ffmpeg_path()
+            with self._lock:
+                if self._info is None:
+                    self._info = self._load_or_probe(path)
+        return self._info
+
+    def warm_up(self):
+        """별도 스레드에서 probe()를 실행합니다 (GUI 시작 시 첫 다운로드가 기다리지 않도록)."""
+        def run():
+            try:
+                self.probe()
+            except FFmpegNotFoundError as e:
+                log.error(str(e))
+        threading.Thread(target=run, name='ffmpeg-probe', daemon=True).start()
+
+    def has_encoder(self, encoder):
+        """ffmpeg이 해당 인코더를 지원하는지 확인합니다 ('copy'는 항상 지원)."""
+        return encoder == 'copy' or encoder in self.probe()['encoders']
+
+    def select_encoder(self, codec):
+        """출력 코덱에 사용할 수 있는 가장 빠른 인코더를 반환합니다.
+
+        Args:
+            codec (str): 출력 코덱 (ENCODER_PREFERENCE의 키, 현재 'mp3')
+
+        Returns:
+            str: 인코더 이름 (지원하는 인코더가 없으면 None)
+        """
+        for encoder in ENCODER_PREFERENCE.get(codec, []):
+            if self.has_encoder(encoder):
+                return encoder
+        return None
+
+    def require_encoder(self, codec):
+        """출력 코덱에 사용할 인코더를 반환하고, 없으면 예외를 발생시킵니다.
+
+        Raises:
+            FFmpegNotFoundError: ffmpeg을 찾을 수 없는 경우
+            EncoderNotFoundError: 코덱을 인코딩할 수 있는 인코더가 없는 경우
+        """
+        encoder = self.select_encoder(codec)
+        if encoder is None:
+            raise EncoderNotFoundError(
+                f"FFmpeg이 {codec} 인코더({', '.join(ENCODER_PREFERENCE.get(codec, []))})를 지원하지 않습니다: {self.probe()['path']}"
+            )
+        return encoder
+
+    def probe_audio(self, input_file):
+        """오디오 파일의 코덱, 비트레이트, 샘플레이트, 길이를 읽습니다 (ffprobe 없이 `ffmpeg -i` 출력 사용).
+
+        Returns:
+            dict: acodec, abr(kbps), asr(Hz), duration(초) 중 읽은 값
+        """
+        try:
+            result = subprocess.run(
+                [self.get_ffmpeg_path(), '-hide_banner', '-i', input_file],
+                stdin=subprocess.DEVNULL,
+                capture_output=True,
+                text=True,
+                errors='replace',
+                timeout=PROBE_TIMEOUT,
+                creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0  # CMD 창 숨기기
+            )
+        except (OSError, subprocess.TimeoutExpired) as e:
+            log.warning(f"오디오 정보 확인 실패 ({input_file}): {str(e)}")
+            return {}
+
+        # 출력 파일을 지정하지 않았으므로 종료 코드는 항상 실패, 입력 정보만 사용
+        audio = {}
+        total = _TOTAL_BITRATE_PATTERN.search(result.stderr)
+        if total:
+            hours, minutes, seconds, bitrate = total.groups()
+            audio['duration'] = int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+            audio['abr'] = int(bitrate)
+        stream = _AUDIO_STREAM_PATTERN.search(result.stderr)
+        if stream:
+            audio['acodec'] = stream.group(1)
+            audio['asr'] = int(stream.group(2))
+            if stream.group(3):
+                audio['abr'] = int(stream.group(3))
+        log.debug("오디오 정보 (%s): %s", input_file, audio)
+        return audio
+
+    def _resolve_path(self):
+        if getattr(sys, 'frozen', False):
+            # PyInstaller로 패키징된 경우
+            ffmpeg_path = os.path.join(get_application_path(), 'resources', 'ffmpeg', 'ffmpeg.exe')
+            if not os.path.exists(ffmpeg_path):
+                # 상대 경로로 시도
+                ffmpeg_path = os.path.join('resources', 'ffmpeg', 'ffmpeg.exe')
+            log.info(f"FFmpeg 경로 (패키징): {ffmpeg_path}")
+        else:
+            # 개발 환경: 시스템 PATH 사용
+            ffmpeg_path = shutil.which('ffmpeg')
+            log.info(f"FFmpeg 경로 (개발): {ffmpeg_path}")
+
+        if ffmpeg_path is None or not os.path.isfile(ffmpeg_path):
+            raise FFmpegNotFoundError("FFmpeg을 찾을 수 없습니다. ffmpeg을 설치하거나 PATH에 추가해 주세요.")
+        return os.path.abspath(ffmpeg_path)
+
+    def _load_or_probe(self, path):
+        """저장된 결과가 같은 실행 파일(경로, 수정 시간, 크기)의 것이면 사용하고, 아니면 다시 확인합니다."""
+        stat = os.stat(path)
+        cache_file = configuration_instance.get_or_default("ffmpeg_probe.json", "cache", "ffmpeg_probe_file")
+        cached = self._read_cache(cache_file).get(path)
+        if cached and cached['mtime'] == stat.st_mtime and cached['size'] == stat.st_size:
+            log.info(f"FFmpeg 정보 (저장된 결과): {cached['version']}, 인코더 {len(cached['encoders'])}개")
+            return {'path': path, 'version': cached['version'], 'encoders': set(cached['encoders'])}
+
+        with performance_log_instance.stage('ffmpeg_probe'):
+            version = self._run(path, '-version').splitlines()[0].strip()
+            encoders = self._parse_encoders(self._run(path, '-encoders'))
+        log.info(f"FFmpeg 정보: {version}, 인코더 {len(encoders)}개")
+
+        entries = self._read_cache(cache_file)
+        entries[path] = {'mtime': stat.st_mtime, 'size': stat.st_size, 'version': version, 'encoders': sorted(encoders)}
+        try:
+            with open(cache_file, 'w', encoding='utf-8') as f:
+                json.dump(entries, f, ensure_ascii=False, indent=2)
+        except OSError as e:
+            log.warning(f"FFmpeg 정보 저장 실패: {str(e)}")
+        return {'path': path, 'version': version, 'encoders': encoders}
+
+    def _run(self, path, option):
+        try:
+            result = subprocess.run(
+                [path, '-hide_banner', option],
+                stdin=subprocess.DEVNULL,
+                capture_output=True,
+                text=True,
+                timeout=PROBE_TIMEOUT,
+                creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0  # CMD 창 숨기기
+            )
+        except (OSError, subprocess.TimeoutExpired) as e:
+            raise FFmpegNotFoundError(f"FFmpeg을 실행할 수 없습니다 ({path}): {str(e)}")
+        if result.returncode != 0:
+            raise FFmpegNotFoundError(f"FFmpeg {option} 실패 (종료 코드: {result.returncode}): {result.stderr.strip()}")
+        return result.stdout
+
+    @staticmethod
+    def _parse_encoders(output):
+        """`ffmpeg -encoders` 출력에서 오디오 인코더 이름을 읽습니다.
+
+        목록은 ' ------' 줄 다음부터 '플래그 이름 설명' 형식이며, 플래그의 첫 글자가 'A'이면 오디오 인코더입니다.
+        """
+        encoders = set()
+        started = False
+        for line in output.splitlines():
+            if not started:
+                started = line.strip().startswith('------')
+                continue
+            fields = line.split(None, 2)
+            if len(fields) >= 2 and fields[0].startswith('A'):
+                encoders.add(fields[1])
+        return encoders
+
+    @staticmethod
+    def _read_cache(cache_file):
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+# 싱글톤 인스턴스 생성
+ffmpeg_probe_instance = FFmpegProbe()
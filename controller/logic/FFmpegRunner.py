@@ -0,0 +1,306 @@
+import atexit
+import contextlib
+import os
+import shutil
+import signal
+import subprocess
+import sys
+import threading
+from model.Log import log
+from model.Configuration import configuration_instance
+
+# ionice 클래스 이름 → ionice -c 값
+_IO_CLASSES = {
+    'realtime': '1',
+    'best_effort': '2',
+    'idle': '3'
+}
+
+class FFmpegTimeoutError(Exception):
+    """ffmpeg 프로세스가 제한 시간 안에 끝나지 않아 종료되었을 때 발생하는 예외"""
+    pass
+
+class FFmpegProcess:
+    """FFmpegRunner가 시작한 ffmpeg 프로세스
+
+    subprocess.Popen과 같은 방식(stdin/stdout/stderr, poll, wait, kill)으로 사용하며,
+    kill()은 프로세스 그룹 전체를 종료합니다. with 블록을 벗어날 때 프로세스가
+    아직 실행 중이면(예외, 취소) 프로세스 그룹을 종료하고 회수합니다.
+    """
+
+    def __init__(self, runner, popen, timeout):
+        self._runner = runner
+        self._popen = popen
+        self.pid = popen.pid
+        self.stdin = popen.stdin
+        self.stdout = popen.stdout
+        self.stderr = popen.stderr
+        self.timeout = timeout
+        self.timed_out = False
+        self._timer = None
+        if timeout:
+            self._timer = threading.Timer(timeout, self._on_timeout)
+            self._timer.daemon = True
+            self._timer.start()
+
+    @property
+    def returncode(self):
+        return self._popen.returncode
+
+    def poll(self):
+        return self._popen.poll()
+
+    def wait(self, timeout=None):
+        returncode = self._popen.wait(timeout)
+        self._release()
+        return returncode
+
+    def kill(self):
+        """프로세스 그룹 전체를 강제 종료합니다."""
+        if self._popen.poll() is not None:
+            return
+        try:
+            if os.name == 'posix':
+                # start_new_session으로 만든 그룹이므로 그룹 ID = 프로세스 ID
+                os.killpg(self.pid, signal.SIGKILL)
+            else:
+                self._popen.kill()
+        except (ProcessLookupError, PermissionError):
+            pass
+
+    def check_timeout(self):
+        """제한 시간 초과로 종료된 경우 FFmpegTimeoutError를 발생시킵니다."""
+        if self.timed_out:
+            raise FFmpegTimeoutError(f"FFmpeg 제한 시간 초과 ({self.timeout}초, pid {self.pid})")
+
+    def _on_timeout(self):
+        if self._popen.poll() is None:
+            log.warning("FFmpeg 제한 시간 초과 (%s초) - 프로세스 종료: pid %d", self.timeout, self.pid)
+            self.timed_out = True
+            self.kill()
+
+    def _release(self):
+        if self._timer:
+            self._timer.cancel()
+        self._runner._forget(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        if self._popen.poll() is None:
+            self.kill()
+        # 프로세스가 종료되면 stdout/stderr은 EOF가 되어 읽는 스레드도 끝남
+        if self.stdin:
+            try:
+                self.stdin.close()
+            except OSError:
+                pass
+        self.wait()
+
+class FFmpegRunner:
+    """ffmpeg 프로세스를 운영체제에 맞게 시작하고 자원 사용을 제어하는 클래스
+
+    config.json의 ffmpeg 항목에 따라 다음을 적용합니다.
+    - threads: ffmpeg -threads 값 (0이면 ffmpeg 기본값)
+    - nice: CPU 우선순위 (POSIX nice 값, Windows에서는 우선순위 클래스로 변환)
+    - io_priority: 디스크 I/O 우선순위 ('', 'best_effort', 'idle', Linux의 ionice)
+    - pin_cpus: 인코딩 워커마다 서로 다른 CPU 코어에 고정 (Linux)
+    - timeout_seconds: 프로세스 하나의 최대 실행 시간 (0이면 제한 없음)
+
+    프로세스는 별도 프로세스 그룹으로 시작되어 취소하거나 제한 시간을 넘기면 그룹 전체가 종료되며,
+    애플리케이션 종료 시 남아 있는 ffmpeg 프로세스도 모두 종료됩니다.
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super(FFmpegRunner, cls).__new__(cls)
+                cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        with self._lock:
+            if not self._initialized:
+                self._initialized = True
+                self._settings = None
+                self._processes = set()
+                self._context = threading.local()
+                self._warned = set()
+                self._programs = {}
+                atexit.register(self.kill_all)
+
+    def thread_args(self):
+        """ffmpeg 명령어에 넣을 -threads 옵션 (설정하지 않았으면 빈 리스트)"""
+        threads = self._get_settings()['threads']
+        return ['-threads', str(threads)] if threads > 0 else []
+
+    @contextlib.contextmanager
+    def worker_slot(self, index, slots=None):
+        """이 스레드에서 시작하는 ffmpeg 프로세스를 index번 워커의 CPU 코어에 고정합니다.
+
+        Args:
+            index (int): 인코딩 워커 번호
+            slots (threading.Semaphore): 이 워커가 하나를 차지하고 있는 인코딩 슬롯
+                (borrow_slots()로 비어 있는 슬롯을 더 빌릴 때 사용, None이면 제한 없음)
+        """
+        previous = self.current_worker_slot()
+        self._context.slot, self._context.slots = index, slots
+        try:
+            yield
+        finally:
+            self._context.slot, self._context.slots = previous
+
+    def current_worker_slot(self):
+        """이 스레드의 (워커 번호, 인코딩 슬롯) - 다른 스레드에서 worker_slot(*값)으로 이어받음"""
+        return getattr(self._context, 'slot', None), getattr(self._context, 'slots', None)
+
+    @contextlib.contextmanager
+    def borrow_slots(self, count):
+        """현재 워커의 인코딩 슬롯 중 비어 있는 것을 기다리지 않고 count개까지 빌립니다.
+
+        한 작업이 ffmpeg 프로세스를 여러 개 실행할 때(구간 인코딩) 전체 프로세스 수가
+        인코딩 워커 수를 넘지 않도록 하며, 블록을 벗어나면 빌린 슬롯을 돌려줍니다.
+        worker_slot()으로 슬롯이 지정되지 않은 스레드(GUI, 벤치마크)에서는 count개를 모두 빌린 것으로 봅니다.
+
+        Yields:
+            int: 빌린 슬롯 수
+        """
+        slots = getattr(self._context, 'slots', None)
+        if slots is None:
+            yield count
+            return
+        borrowed = 0
+        while borrowed < count and slots.acquire(blocking=False):
+            borrowed += 1
+        try:
+            yield borrowed
+        finally:
+            for _ in range(borrowed):
+                slots.release()
+
+    def start(self, cmd, stdin=None, stdout=None, stderr=None, text=False):
+        """ffmpeg 프로세스를 시작합니다.
+
+        Args:
+            cmd (list): ffmpeg 명령어
+            stdin, stdout, stderr: subprocess.Popen과 같은 값
+            text (bool): 텍스트 모드로 파이프를 열지 여부
+
+        Returns:
+            FFmpegProcess: 시작된 프로세스
+        """
+        settings = self._get_settings()
+        prefix = []
+        kwargs = {}
+        cpus = self._slot_cpus(settings)
+
+        if os.name == 'posix':
+            # 새 세션(프로세스 그룹)으로 시작하여 그룹 단위로 종료할 수 있게 함
+            kwargs['start_new_session'] = True
+            # Linux의 nice/CPU 고정은 스레드 단위이므로, ffmpeg이 스레드를 만들기 전에
+            # 적용되도록 exec 전에 설정하는 유틸리티(nice, ionice, taskset)를 앞에 붙임
+            if settings['nice'] and self._which('nice'):
+                prefix += ['nice', '-n', str(settings['nice'])]
+            if settings['io_priority'] in _IO_CLASSES and self._which('ionice'):
+                prefix += ['ionice', '-c', _IO_CLASSES[settings['io_priority']]]
+            if cpus and self._which('taskset', warn=False):
+                prefix += ['taskset', '-c', ','.join(map(str, cpus))]
+        else:
+            kwargs['creationflags'] = (
+                subprocess.CREATE_NO_WINDOW  # CMD 창 숨기기
+                | subprocess.CREATE_NEW_PROCESS_GROUP
+                | self._windows_priority_class(settings['nice'])
+            )
+
+        popen = subprocess.Popen(
+            prefix + list(cmd),
+            stdin=stdin,
+            stdout=stdout,
+            stderr=stderr,
+            universal_newlines=text,
+            **kwargs
+        )
+        process = FFmpegProcess(self, popen, settings['timeout_seconds'])
+        with self._lock:
+            self._processes.add(process)
+        if cpus and os.name == 'posix' and not self._which('taskset', warn=False):
+            # taskset이 없으면 시작 직후 설정 (이미 만들어진 ffmpeg 스레드에는 적용되지 않을 수 있음)
+            self._set_affinity(process.pid, cpus)
+        log.debug("FFmpeg 프로세스 시작 - pid: %d, 우선순위: %s, CPU: %s", process.pid, settings['nice'], cpus or '전체')
+        return process
+
+    def kill_all(self):
+        """실행 중인 ffmpeg 프로세스를 모두 종료합니다 (애플리케이션 종료, 전체 취소)."""
+        with self._lock:
+            processes = list(self._processes)
+        for process in processes:
+            process.kill()
+
+    def _forget(self, process):
+        with self._lock:
+            self._processes.discard(process)
+
+    def _get_settings(self):
+        """config.json의 ffmpeg 항목을 읽습니다."""
+        if self._settings is None:
+            self._settings = {
+                'threads': max(0, configuration_instance.get_or_default(0, "ffmpeg", "threads")),
+                'nice': configuration_instance.get_or_default(0, "ffmpeg", "nice"),
+                'io_priority': configuration_instance.get_or_default("", "ffmpeg", "io_priority"),
+                'pin_cpus': configuration_instance.get_or_default(False, "ffmpeg", "pin_cpus"),
+                'timeout_seconds': max(0, configuration_instance.get_or_default(0, "ffmpeg", "timeout_seconds"))
+            }
+        return self._settings
+
+    def _slot_cpus(self, settings):
+        """현재 워커에 배정된 CPU 코어 목록 (고정하지 않으면 None)
+
+        워커마다 (threads 값 또는 1)개의 연속된 코어를 순서대로 배정합니다.
+        """
+        slot = getattr(self._context, 'slot', None)
+        if not settings['pin_cpus'] or slot is None:
+            return None
+        if not hasattr(os, 'sched_getaffinity'):
+            self._warn_once('affinity', "이 운영체제에서는 CPU 고정(pin_cpus)을 지원하지 않습니다.")
+            return None
+        cores = sorted(os.sched_getaffinity(0))
+        count = min(len(cores), max(1, settings['threads']))
+        start = slot * count
+        return [cores[(start + i) % len(cores)] for i in range(count)]
+
+    def _set_affinity(self, pid, cpus):
+        try:
+            os.sched_setaffinity(pid, cpus)
+        except OSError as e:
+            log.warning("CPU 고정 실패 - pid: %d, 오류: %s", pid, e)
+
+    def _which(self, program, warn=True):
+        """nice, ionice, taskset 명령이 있는지 확인합니다 (결과는 캐시)."""
+        found = self._programs.get(program)
+        if found is None:
+            found = self._programs[program] = shutil.which(program) is not None
+        if not found and warn:
+            self._warn_once(program, f"{program} 명령을 찾을 수 없어 해당 설정을 적용하지 않습니다.")
+        return found
+
+    def _warn_once(self, key, message):
+        if key not in self._warned:
+            self._warned.add(key)
+            log.warning(message)
+
+    @staticmethod
+    def _windows_priority_class(nice):
+        if sys.platform != 'win32' or not nice:
+            return 0
+        if nice >= 15:
+            return subprocess.IDLE_PRIORITY_CLASS
+        if nice > 0:
+            return subprocess.BELOW_NORMAL_PRIORITY_CLASS
+        return subprocess.ABOVE_NORMAL_PRIORITY_CLASS
+
+# 싱글톤 인스턴스 생성
+ffmpeg_runner_instance = FFmpegRunner()
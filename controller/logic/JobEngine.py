@@ -0,0 +1,447 @@
+import os
+import queue
+import threading
+import time
+from model.Log import log
+from model.DownloadArchive import download_archive_instance
+from model.JobJournal import job_journal_instance
+from model.PerformanceLog import performance_log_instance
+from model.TraceLog import trace_log_instance
+from controller.logic.CheckURL import check_url_instance
+from controller.logic.DownloadYoutubeAudio import download_youtube_audio_instance, StreamingNotSupportedError
+from controller.logic.ConverterToMP3 import converter_to_mp3_instance
+from controller.logic.FFmpegRunner import ffmpeg_runner_instance
+from controller.logic.StreamingPipeline import streaming_pipeline_instance
+from controller.logic.PlaylistResolver import playlist_resolver_instance
+from controller.logic.SegmentedEncoder import segmented_encoder_instance
+
+# 워커 스레드 종료 신호
+_STOP = object()
+
+class Job:
+    """다운로드 + MP3 변환 작업 하나의 상태를 담는 클래스"""
+
+    def __init__(self, job_id: int, url: str, quality: str, save_path: str, progress_callback=None, info=None, profile: str = 'mp3', preset: str = None):
+        self.job_id = job_id
+        self.url = url
+        self.quality = quality
+        self.save_path = save_path
+        self.profile = profile  # 출력 프로필 (ConverterToMP3.OUTPUT_PROFILES)
+        self.preset = preset  # 인코딩 프리셋 이름 (None이면 config.json의 output.preset)
+        self.progress_callback = progress_callback
+        self.info = info  # 미리 추출된 비디오 정보 (YoutubeTitle.get_info)
+        self.video_id = check_url_instance.extract_video_id(url)
+        self.archived = False  # 다운로드 색인의 기존 결과를 반환했는지 여부
+        self.playlist_url = None  # 플레이리스트에서 펼쳐진 작업이면 원본 플레이리스트 URL
+        self.playlist_index = None
+        self.journal_id = None  # 끝나지 않은 작업 저널 항목 ID
+        self.status = 'pending'  # pending, downloading, streaming, queued, encoding, done, error
+        self.title = None
+        self.downloaded_file = None
+        self.source = None  # 원본 오디오 정보 (DownloadYoutubeAudio.source_info)
+        self.output = None
+        self.settings = None  # 실제 적용된 출력 설정 (ConverterToMP3.plan_output)
+        self.error = None
+        self.submitted_at = time.monotonic()
+        self.finished_at = None
+        self._done_event = threading.Event()
+
+    def wait(self, timeout=None) -> bool:
+        """작업이 끝날 때까지 대기합니다.
+
+        Returns:
+            bool: 제한 시간 안에 작업이 끝났으면 True
+        """
+        return self._done_event.wait(timeout)
+
+    def is_done(self) -> bool:
+        return self._done_event.is_set()
+
+    def to_dict(self) -> dict:
+        """작업 결과를 JSON 직렬화 가능한 dict로 반환합니다."""
+        elapsed = None
+        if self.finished_at is not None:
+            elapsed = round(self.finished_at - self.submitted_at, 3)
+        return {
+            'job_id': self.job_id,
+            'url': self.url,
+            'status': 'ok' if self.status == 'done' else self.status,
+            'title': self.title,
+            'profile': self.profile,
+            'preset': self.preset,
+            'output': self.output,
+            'settings': self.settings,
+            'error': self.error,
+            'archived': self.archived,
+            'playlist_url': self.playlist_url,
+            'playlist_index': self.playlist_index,
+            'elapsed': elapsed
+        }
+
+class JobEngine:
+    """GUI와 독립적인 다운로드/인코딩 작업 엔진
+
+    네트워크 작업(yt-dlp 다운로드)과 CPU 작업(ffmpeg 인코딩)을 서로 다른
+    워커 풀에서 처리하여, 서로 다른 영상의 다운로드와 인코딩이 겹쳐서 실행됩니다.
+    두 풀 사이의 인코딩 대기열은 크기가 제한되어 있어 인코딩이 밀리면
+    다운로드 워커가 대기합니다 (다운로드된 임시 파일이 무한히 쌓이지 않음).
+    """
+
+    def __init__(self, download_workers: int = 3, encode_workers: int = 0, encode_queue_size: int = 0, streaming: bool = False, playlist_resolvers: int = 2, on_job_done=None, output_profile: str = None, preset: str = None, backend: str = None):
+        """JobEngine을 초기화합니다.
+
+        Args:
+            download_workers (int): 다운로드 워커 수
+            encode_workers (int): 인코딩 워커 수 (0이면 CPU 코어 수)
+            encode_queue_size (int): 인코딩 대기열 크기 (0이면 인코딩 워커 수의 2배)
+            streaming (bool): True이면 임시 파일 없이 다운로드 데이터를 ffmpeg으로 바로 전달.
+                스트리밍할 수 없는 포맷은 일반 다운로드 후 인코딩으로 처리
+            playlist_resolvers (int): 동시에 항목을 확인하는 플레이리스트/채널 수
+            on_job_done (callable): 작업이 끝날 때마다 Job을 인자로 호출되는 콜백
+            output_profile (str): 기본 출력 프로필 ('mp3', 'original', 'mp3_if_needed', None이면 config.json의 output.profile).
+                스트리밍은 'mp3' 프로필에만 사용
+            preset (str): 기본 인코딩 프리셋 ('cbr', 'vbr_high', 'fast' 등, None이면 config.json의 output.preset)
+            backend (str): 인코더 백엔드 ('ffmpeg', 'pyav', None이면 config.json의 output.encoder_backend).
+                스트리밍은 항상 ffmpeg 프로세스로 인코딩
+        """
+        if encode_workers <= 0:
+            encode_workers = os.cpu_count() or 1
+        if encode_queue_size <= 0:
+            encode_queue_size = encode_workers * 2
+
+        self._download_worker_count = max(1, download_workers)
+        self._encode_worker_count = encode_workers
+        self._streaming = streaming
+        self._output_profile = converter_to_mp3_instance.get_profile(output_profile)
+        self._preset = converter_to_mp3_instance.get_preset(preset)[0]
+        self._backend = backend
+        self._on_job_done = on_job_done
+        # 동시에 실행되는 ffmpeg 프로세스 수 제한 (인코딩 워커 + 스트리밍 작업)
+        self._encode_slots = threading.BoundedSemaphore(encode_workers)
+        self._download_queue = queue.Queue()
+        self._encode_queue = queue.Queue(maxsize=encode_queue_size)
+        self._workers = []
+        self._resolver_threads = []
+        self._inflight = {}  # 비디오 ID → 진행 중인 작업
+        self._resolver_slots = threading.BoundedSemaphore(max(1, playlist_resolvers))
+        self._job_lock = threading.Lock()
+        self._next_job_id = 1
+        self._started = False
+        self._alive_download_workers = 0
+
+    def start(self):
+        """다운로드/인코딩 워커 스레드를 시작합니다.
+
+        Raises:
+            FFmpegNotFoundError: ffmpeg이나 기본 출력 프로필에 필요한 인코더가 없는 경우 (다운로드 전에 실패)
+            EncoderBackendError: 선택한 인코더 백엔드를 사용할 수 없는 경우
+        """
+        converter_to_mp3_instance.require_profile_encoder(self._output_profile)
+        self._backend = converter_to_mp3_instance.get_backend(self._backend).name
+        with self._job_lock:
+            if self._started:
+                return
+            self._started = True
+            self._alive_download_workers = self._download_worker_count
+
+        log.info(f"작업 엔진 시작 - 다운로드 워커: {self._download_worker_count}, 인코딩 워커: {self._encode_worker_count}, 인코딩 대기열: {self._encode_queue.maxsize}, 스트리밍: {self._streaming}, 인코더 백엔드: {self._backend}")
+        for i in range(self._download_worker_count):
+            self._start_worker(self._download_worker, f"download-{i}")
+        for i in range(self._encode_worker_count):
+            self._start_worker(self._encode_worker, f"encode-{i}", i)
+
+    def submit(self, url: str, quality: str, save_path: str, progress_callback=None, info=None, profile: str = None, preset: str = None) -> Job:
+        """작업을 등록합니다.
+
+        Args:
+            url (str): YouTube URL
+            quality (str): MP3 품질 (예: '192K')
+            save_path (str): 저장 경로
+            progress_callback (callable): (job, stage, percentage)로 호출되는 진행률 콜백.
+                stage는 'download' 또는 'encode'
+            info (dict): 미리 추출된 비디오 정보. 주어지면 다운로드 시 정보 추출을 생략
+            profile (str): 이 작업의 출력 프로필 (None이면 엔진의 기본 출력 프로필)
+            preset (str): 이 작업의 인코딩 프리셋 (None이면 엔진의 기본 인코딩 프리셋)
+
+        Returns:
+            Job: 등록된 작업
+        """
+        job = self._new_job(url, quality, save_path, progress_callback, info, profile, preset)
+        job.journal_id = job_journal_instance.add(url, quality, save_path, job.profile, job.preset)
+        log.info(f"작업 등록 [{job.job_id}] - URL: {url}")
+        self._download_queue.put(job)
+        return job
+
+    def resume_pending(self, progress_callback=None) -> list:
+        """이전 실행에서 끝나지 않은 작업을 다시 등록합니다.
+
+        임시 파일명이 비디오/포맷별로 고정되어 있으므로, 남아 있는 .part 파일은
+        처음부터가 아니라 받은 부분 이후부터 이어서 다운로드됩니다.
+        출력 프로필과 프리셋은 등록할 때의 값을 사용합니다 (이전 저널의 항목이면 엔진의 기본값).
+
+        Returns:
+            list[Job]: 다시 등록된 작업 목록
+        """
+        jobs = []
+        for pending in job_journal_instance.pending():
+            job = self._new_job(
+                pending['url'], pending['quality'], pending['save_path'], progress_callback,
+                profile=pending['profile'], preset=pending['preset']
+            )
+            job.journal_id = pending['journal_id']
+            log.info(f"중단된 작업 재등록 [{job.job_id}] - URL: {job.url}")
+            self._download_queue.put(job)
+            jobs.append(job)
+        return jobs
+
+    def submit_playlist(self, url: str, quality: str, save_path: str, progress_callback=None, profile: str = None, preset: str = None):
+        """플레이리스트/채널의 동영상을 발견되는 즉시 작업으로 등록합니다.
+
+        전체 목록을 기다리지 않고 항목을 가져오는 대로 다운로드 대기열에 넣으므로,
+        목록 확인과 다운로드/인코딩이 동시에 진행됩니다.
+
+        Args:
+            url (str): 플레이리스트 또는 채널 URL
+            quality (str): MP3 품질 (예: '192K')
+            save_path (str): 저장 경로
+            progress_callback (callable): submit()과 같은 진행률 콜백
+            profile (str): 항목들의 출력 프로필 (None이면 엔진의 기본 출력 프로필)
+            preset (str): 항목들의 인코딩 프리셋 (None이면 엔진의 기본 인코딩 프리셋)
+        """
+        log.info(f"플레이리스트 등록 - URL: {url}")
+        resolver = threading.Thread(
+            target=self._resolve_playlist,
+            args=(url, quality, save_path, progress_callback, profile, preset),
+            name=f"playlist-{len(self._resolver_threads)}",
+            daemon=True
+        )
+        self._resolver_threads.append(resolver)
+        resolver.start()
+
+    def shutdown(self, wait: bool = True):
+        """등록된 작업을 모두 처리한 뒤 워커 스레드를 종료합니다."""
+        # 플레이리스트 항목 등록이 끝나야 종료 신호를 보낼 수 있음
+        for resolver in self._resolver_threads:
+            resolver.join()
+        self._resolver_threads = []
+
+        for _ in range(self._download_worker_count):
+            self._download_queue.put(_STOP)
+        if wait:
+            for worker in self._workers:
+                worker.join()
+            self._workers = []
+        log.info("작업 엔진 종료")
+
+    def _start_worker(self, target, name, *args):
+        worker = threading.Thread(target=target, name=name, args=args, daemon=True)
+        worker.start()
+        self._workers.append(worker)
+
+    def _resolve_playlist(self, url, quality, save_path, progress_callback, profile=None, preset=None):
+        """플레이리스트 항목을 확인하며 하나씩 작업으로 등록합니다."""
+        with self._resolver_slots:
+            try:
+                for entry in playlist_resolver_instance.iter_entries(url):
+                    job = self._new_job(entry['url'], quality, save_path, progress_callback, profile=profile, preset=preset)
+                    job.playlist_url = url
+                    job.playlist_index = entry['index']
+                    job.journal_id = job_journal_instance.add(job.url, quality, save_path, job.profile, job.preset)
+                    log.info(f"작업 등록 [{job.job_id}] - URL: {job.url} (플레이리스트 {entry['index']}번)")
+                    self._download_queue.put(job)
+            except Exception as e:
+                # 목록 확인 실패도 작업 결과로 보고
+                job = self._new_job(url, quality, save_path, profile=profile, preset=preset)
+                job.playlist_url = url
+                self._finish(job, e)
+
+    def _new_job(self, url, quality, save_path, progress_callback=None, info=None, profile=None, preset=None):
+        if profile is None:
+            profile = self._output_profile
+        else:
+            profile = converter_to_mp3_instance.get_profile(profile)
+        preset = self._preset if preset is None else converter_to_mp3_instance.get_preset(preset)[0]
+        with self._job_lock:
+            job = Job(self._next_job_id, url, quality, save_path, progress_callback, info, profile, preset)
+            self._next_job_id += 1
+        return job
+
+    def _download_worker(self):
+        """다운로드 대기열에서 작업을 꺼내 다운로드하고 인코딩 대기열로 넘깁니다."""
+        while True:
+            job = self._download_queue.get()
+            if job is _STOP:
+                self._on_download_worker_stopped()
+                return
+
+            self._wait_for_duplicate(job)
+            if self._check_archive(job):
+                continue
+
+            if self._streaming and job.profile == 'mp3' and self._run_streaming(job):
+                continue
+
+            try:
+                job.status = 'downloading'
+                with performance_log_instance.job_context(job.job_id), trace_log_instance.span('job.download', url=job.url):
+                    job.downloaded_file, job.title, job.source = download_youtube_audio_instance.download_audio(
+                        url=job.url,
+                        quality=job.quality,
+                        save_path=job.save_path,
+                        progress_callback=self._make_progress_callback(job, 'download'),
+                        info=job.info
+                    )
+            except Exception as e:
+                self._finish(job, e)
+                continue
+
+            job.status = 'queued'
+            # 인코딩 대기열이 가득 차면 여기서 대기 (backpressure)
+            self._encode_queue.put(job)
+
+    def _encode_worker(self, index):
+        """인코딩 대기열에서 작업을 꺼내 MP3로 변환합니다.
+
+        Args:
+            index (int): 워커 번호 (ffmpeg CPU 고정 설정 시 워커별 코어 배정에 사용)
+        """
+        while True:
+            job = self._encode_queue.get()
+            if job is _STOP:
+                return
+
+            try:
+                with self._encode_slots, ffmpeg_runner_instance.worker_slot(index, self._encode_slots), \
+                        performance_log_instance.job_context(job.job_id), trace_log_instance.span('job.encode'):
+                    job.status = 'encoding'
+                    job.output, job.settings = converter_to_mp3_instance.convert(
+                        input_file=job.downloaded_file,
+                        title=converter_to_mp3_instance.sanitize_filename(job.title),
+                        quality=job.quality,
+                        save_path=job.save_path,
+                        progress_callback=self._make_progress_callback(job, 'encode'),
+                        source=job.source,
+                        profile=job.profile,
+                        preset=job.preset,
+                        backend=self._backend
+                    )
+                self._finish(job)
+            except Exception as e:
+                self._finish(job, e)
+
+    def _wait_for_duplicate(self, job):
+        """같은 비디오의 작업이 진행 중이면 끝날 때까지 기다립니다.
+
+        임시 파일명은 비디오/포맷별이고 품질이 달라도 같은 포맷이 선택될 수 있으므로,
+        품질과 관계없이 같은 비디오의 작업을 하나씩 처리하여 두 작업이 같은 임시 파일에
+        쓰거나 다른 작업이 아직 쓰고 있는 파일을 인코딩 후 지우지 않도록 합니다.
+        먼저 끝난 작업의 결과는 다운로드 색인을 통해 재사용됩니다.
+        """
+        if job.video_id is None:
+            return
+        while True:
+            with self._job_lock:
+                running = self._inflight.get(job.video_id)
+                if running is None:
+                    self._inflight[job.video_id] = job
+                    return
+            log.info(f"작업 [{job.job_id}] 같은 비디오의 작업 [{running.job_id}]이 끝날 때까지 대기")
+            running.wait()
+
+    def _check_archive(self, job) -> bool:
+        """같은 설정으로 같은 저장 경로에 이미 변환한 결과가 있으면 네트워크 작업 없이 작업을 끝냅니다.
+
+        Returns:
+            bool: 기존 결과로 작업을 끝냈으면 True
+        """
+        # 구간 인코딩 결과는 구간 인코딩을 켰을 때만 사용
+        archived = None
+        for segmented in ((False, True) if segmented_encoder_instance.is_enabled() else (False,)):
+            archived = download_archive_instance.get(
+                job.video_id, job.quality, converter_to_mp3_instance.get_encoder_settings(job.quality, job.profile, job.preset, segmented),
+                job.save_path
+            )
+            if archived is not None:
+                break
+        if archived is None:
+            return False
+
+        log.info(f"작업 [{job.job_id}] 이미 변환된 파일 사용: {archived['output_path']}")
+        job.title = archived['title']
+        job.output = archived['output_path']
+        job.archived = True
+        self._finish(job)
+        return True
+
+    def _run_streaming(self, job) -> bool:
+        """작업을 스트리밍 파이프라인으로 처리합니다.
+
+        Returns:
+            bool: 작업이 끝났으면 True, 스트리밍할 수 없어 일반 경로로 처리해야 하면 False
+        """
+        try:
+            with self._encode_slots, performance_log_instance.job_context(job.job_id), trace_log_instance.span('job.streaming', url=job.url):
+                job.status = 'streaming'
+                job.output, job.title, job.settings = streaming_pipeline_instance.run(
+                    url=job.url,
+                    quality=job.quality,
+                    save_path=job.save_path,
+                    progress_callback=self._make_progress_callback(job, 'download'),
+                    info=job.info,
+                    preset=job.preset
+                )
+        except StreamingNotSupportedError:
+            log.info(f"작업 [{job.job_id}] 스트리밍 불가 - 파일 다운로드로 처리합니다.")
+            return False
+        except Exception as e:
+            self._finish(job, e)
+            return True
+        self._finish(job)
+        return True
+
+    def _on_download_worker_stopped(self):
+        """마지막 다운로드 워커가 종료되면 인코딩 워커에도 종료 신호를 보냅니다."""
+        with self._job_lock:
+            self._alive_download_workers -= 1
+            last = self._alive_download_workers == 0
+        if last:
+            for _ in range(self._encode_worker_count):
+                self._encode_queue.put(_STOP)
+
+    def _record_archive(self, job):
+        """변환 결과를 다운로드 색인에 기록합니다."""
+        segmented = (job.settings or {}).get('segments', 1) > 1
+        try:
+            download_archive_instance.put(
+                job.video_id, job.quality, converter_to_mp3_instance.get_encoder_settings(job.quality, job.profile, job.preset, segmented),
+                job.save_path, job.output, job.title
+            )
+        except Exception as e:
+            log.error(f"다운로드 색인 기록 실패 [{job.job_id}]: {str(e)}")
+
+    def _make_progress_callback(self, job, stage):
+        if job.progress_callback is None:
+            return None
+        return lambda percentage: job.progress_callback(job, stage, percentage)
+
+    def _finish(self, job, error=None):
+        if error is None:
+            job.status = 'done'
+            log.info(f"작업 완료 [{job.job_id}] - {job.output}")
+            if not job.archived:
+                self._record_archive(job)
+        else:
+            job.status = 'error'
+            job.error = str(error)
+            log.error(f"작업 실패 [{job.job_id}] - URL: {job.url}, 오류: {str(error)}")
+        job.finished_at = time.monotonic()
+        job_journal_instance.remove(job.journal_id)
+        with self._job_lock:
+            if self._inflight.get(job.video_id) is job:
+                del self._inflight[job.video_id]
+        job._done_event.set()
+        if self._on_job_done:
+            try:
+                self._on_job_done(job)
+            except Exception as e:
+                log.error(f"작업 완료 콜백 오류: {str(e)}")
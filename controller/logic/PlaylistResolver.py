@@ -0,0 +1,83 @@
+import threading
+from model.Log import log
+from controller.logic.YoutubeDLPool import youtube_dl_pool_instance
+
+# 채널 URL → 탭(동영상, Shorts 등) → 동영상 순으로 중첩될 수 있음
+MAX_NESTING_DEPTH = 3
+
+class PlaylistResolver:
+    """플레이리스트/채널 URL을 동영상 URL로 펼치는 클래스
+
+    yt-dlp의 원본 추출 결과(process=False)를 사용하므로 항목은 페이지 단위로
+    필요할 때 가져오며(flat, lazy), 발견되는 즉시 호출자에게 전달됩니다.
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super(PlaylistResolver, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        pass
+
+    def iter_entries(self, url):
+        """플레이리스트/채널의 동영상 항목을 발견되는 순서대로 반환합니다.
+
+        Args:
+            url (str): 플레이리스트 또는 채널 URL
+
+        Yields:
+            dict: {'url': 동영상 URL, 'id': 비디오 ID, 'title': 제목(없을 수 있음), 'index': 순번(1부터)}
+        """
+        log.info(f"플레이리스트 항목 확인 시작 - URL: {url}")
+        count = 0
+        # 항목은 페이지 단위로 필요할 때 가져오므로 확인이 끝날 때까지 인스턴스를 사용함
+        # 풀의 인스턴스를 쓰면 그동안 다운로드 작업이 기다리므로 별도 인스턴스 사용
+        with youtube_dl_pool_instance.dedicated(noplaylist=False) as ydl:
+            for entry in self._iter_video_entries(ydl, url, 0):
+                count += 1
+                entry['index'] = count
+                yield entry
+        log.info(f"플레이리스트 항목 확인 완료 - {count}개, URL: {url}")
+
+    def _iter_video_entries(self, ydl, url, depth):
+        result = ydl.extract_info(url, download=False, process=False)
+        if result is None:
+            return
+
+        # 플레이리스트가 아닌 단일 동영상 결과
+        if 'entries' not in result:
+            video = self._to_video_entry(result)
+            if video:
+                yield video
+            return
+
+        for entry in result['entries']:
+            if not entry:
+                continue
+            if entry.get('_type') in ('url', 'url_transparent') and entry.get('ie_key') != 'Youtube':
+                # 채널의 탭이나 중첩 플레이리스트
+                if depth + 1 >= MAX_NESTING_DEPTH:
+                    log.warning(f"플레이리스트 중첩이 너무 깊어 건너뜁니다: {entry.get('url')}")
+                    continue
+                yield from self._iter_video_entries(ydl, entry['url'], depth + 1)
+                continue
+            video = self._to_video_entry(entry)
+            if video:
+                yield video
+
+    def _to_video_entry(self, entry):
+        video_id = entry.get('id')
+        if not video_id:
+            return None
+        url = entry.get('webpage_url') or entry.get('url')
+        if not url or not url.startswith('http'):
+            url = f'https://www.youtube.com/watch?v={video_id}'
+        return {'url': url, 'id': video_id, 'title': entry.get('title')}
+
+# 싱글톤 인스턴스 생성
+playlist_resolver_instance = PlaylistResolver()
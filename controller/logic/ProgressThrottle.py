@@ -0,0 +1,52 @@
+import threading
+import time
+from model.Log import log
+from model.Configuration import configuration_instance
+
+# 진행률 전달 최소 간격 기본값 (밀리초)
+DEFAULT_UPDATE_INTERVAL_MS = 100
+
+class ProgressThrottle:
+    """작업 하나의 진행률 콜백 호출을 모아서 전달하는 클래스
+
+    yt-dlp progress hook이나 ffmpeg 출력처럼 초당 여러 번 발생하는 진행률을
+    설정한 간격마다 최대 한 번만 전달합니다. 정수로 반올림한 진행률이 바뀌지 않은
+    업데이트는 버리고, 100% 업데이트는 간격과 관계없이 항상 전달합니다.
+    """
+
+    def __init__(self, callback, label, interval_ms=None):
+        """
+        Args:
+            callback (callable): 진행률(0-100)을 받는 원래 콜백
+            label (str): 디버그 로그에 사용할 단계 이름 (예: '다운로드')
+            interval_ms (int): 전달 최소 간격 (None이면 config.json의 progress.update_interval_ms)
+        """
+        if interval_ms is None:
+            interval_ms = configuration_instance.get_or_default(DEFAULT_UPDATE_INTERVAL_MS, "progress", "update_interval_ms")
+        self._callback = callback
+        self._label = label
+        self._interval = max(0, interval_ms) / 1000
+        self._lock = threading.Lock()
+        self._last_percentage = None
+        self._last_time = 0.0
+
+    @classmethod
+    def wrap(cls, callback, label):
+        """콜백이 있으면 ProgressThrottle로 감싸서 반환합니다."""
+        if callback is None or isinstance(callback, cls):
+            return callback
+        return cls(callback, label)
+
+    def __call__(self, percentage):
+        rounded = min(100, int(percentage))
+        now = time.monotonic()
+        with self._lock:
+            if rounded == self._last_percentage:
+                return
+            if rounded < 100 and now - self._last_time < self._interval:
+                return
+            self._last_percentage = rounded
+            self._last_time = now
+
+        self._callback(percentage)
+        log.debug("%s 진행률: %d%%", self._label, rounded)
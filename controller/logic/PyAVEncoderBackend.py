@@ -0,0 +1,120 @@
+import os
+import threading
+import time
+from model.Log import log
+from controller.logic.EncoderBackend import EncoderBackend
+
+try:
+    import av
+except ImportError:
+    # PyAV는 선택 사항이며, 없으면 이 백엔드를 사용할 수 없음 (pip install av)
+    av = None
+
+# ffmpeg -q:a와 같은 VBR 품질 값을 만드는 배율 (libavcodec의 FF_QP2LAMBDA)
+_QP2LAMBDA = 118
+
+class PyAVEncoderBackend(EncoderBackend):
+    """PyAV(libav 바인딩)로 작업 스레드 안에서 인코딩하는 백엔드
+
+    ffmpeg 프로세스를 시작하지 않고 디코딩한 오디오 프레임을 바로 인코더에 넘기므로
+    파일마다 드는 프로세스 시작, 파이프 전송, -progress 출력 해석 비용이 없고,
+    진행률은 디코딩한 프레임의 재생 위치로 전달합니다.
+
+    ffmpeg 항목의 프로세스 설정(우선순위, CPU 고정, 제한 시간)과 구간 병렬 인코딩은 적용되지 않으며,
+    PyAV에 포함된 libav에 없는 인코더는 ffmpeg 백엔드로 인코딩합니다.
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    name = 'pyav'
+
+    def __new__(cls):
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super(PyAVEncoderBackend, cls).__new__(cls)
+        return cls._instance
+
+    def is_available(self):
+        return av is not None
+
+    def supports(self, settings):
+        return settings['encoder'] == 'copy' or (av is not None and settings['encoder'] in av.codecs_available)
+
+    def encode(self, input_file, output_file, settings, duration=None, progress_callback=None):
+        started = time.thread_time()
+        log.info(f"PyAV 인코딩 - 입력: {input_file}, 출력: {output_file}, 인코더: {settings['encoder']}")
+        try:
+            with av.open(input_file) as source, av.open(output_file, 'w') as output:
+                in_stream = source.streams.audio[0]
+                if not duration and source.duration:
+                    duration = source.duration / av.time_base
+                if settings['encoder'] == 'copy':
+                    self._copy(source, in_stream, output, duration, progress_callback)
+                else:
+                    self._transcode(source, in_stream, output, settings, duration, progress_callback)
+        except BaseException:
+            # 실패한 인코딩의 출력 파일은 남기지 않음
+            if os.path.exists(output_file):
+                os.remove(output_file)
+            raise
+        if progress_callback:
+            progress_callback(100.0)
+        return {'cpu_seconds': time.thread_time() - started, 'segments': 1}
+
+    def _copy(self, source, in_stream, output, duration, progress_callback):
+        """디코딩/인코딩 없이 첫 번째 오디오 스트림의 패킷만 새 컨테이너로 옮깁니다."""
+        if hasattr(output, 'add_stream_from_template'):
+            out_stream = output.add_stream_from_template(in_stream)
+        else:
+            # PyAV 14 미만
+            out_stream = output.add_stream(template=in_stream)
+        for packet in source.demux(in_stream):
+            # demux가 끝에 내보내는 빈 패킷은 건너뜀
+            if packet.dts is None:
+                continue
+            self._report(packet.pts, packet.time_base, duration, progress_callback)
+            packet.stream = out_stream
+            output.mux(packet)
+
+    def _transcode(self, source, in_stream, output, settings, duration, progress_callback):
+        """디코딩한 프레임을 출력 설정의 샘플레이트/채널로 바꿔 인코딩합니다."""
+        encoder = settings['encoder']
+        rate = settings['sample_rate'] or in_stream.rate
+        layout = 'mono' if settings['channels'] == 1 or in_stream.channels == 1 else 'stereo'
+        # 인코더가 지원하는 첫 번째 샘플 형식 사용 (libmp3lame은 s32p)
+        sample_format = av.Codec(encoder, 'w').audio_formats[0].name
+        out_stream = output.add_stream(encoder, rate=rate, layout=layout, format=sample_format)
+
+        # ffmpeg 백엔드의 명령줄 옵션과 같은 값을 코덱 옵션으로 지정
+        options = {}
+        if settings['mode'] == 'vbr':
+            options['flags'] = '+qscale'
+            options['global_quality'] = str(settings['vbr_quality'] * _QP2LAMBDA)
+        else:
+            out_stream.codec_context.bit_rate = settings['bitrate_kbps'] * 1000
+            if settings['mode'] == 'abr':
+                options['abr'] = '1'
+        if settings['compression_level'] is not None:
+            options['compression_level'] = str(settings['compression_level'])
+        if settings['joint_stereo'] is not None:
+            options['joint_stereo'] = '1' if settings['joint_stereo'] else '0'
+        out_stream.codec_context.options = options
+
+        resampler = av.AudioResampler(format=sample_format, layout=layout, rate=rate)
+        for frame in source.decode(in_stream):
+            self._report(frame.pts, frame.time_base, duration, progress_callback)
+            for resampled in resampler.resample(frame):
+                output.mux(out_stream.encode(resampled))
+        # 리샘플러와 인코더에 남은 샘플을 내보냄
+        for resampled in resampler.resample(None):
+            output.mux(out_stream.encode(resampled))
+        output.mux(out_stream.encode(None))
+
+    @staticmethod
+    def _report(pts, time_base, duration, progress_callback):
+        if progress_callback and duration and pts is not None and time_base is not None:
+            progress_callback(min(100.0, float(pts * time_base) / duration * 100))
+
+# 싱글톤 인스턴스 생성
+pyav_encoder_backend_instance = PyAVEncoderBackend()
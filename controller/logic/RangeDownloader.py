@@ -0,0 +1,243 @@
+import contextlib
+import os
+import queue
+import threading
+import time
+from yt_dlp.networking import Request
+from model.Log import log
+from model.Configuration import configuration_instance
+
+# 청크 하나를 받을 때 읽는 단위
+READ_SIZE = 64 * 1024
+# 청크별 재시도 횟수
+CHUNK_RETRIES = 3
+
+class RangeNotSupportedError(Exception):
+    """서버가 Range 요청을 무시하여 여러 연결로 나누어 받을 수 없을 때 발생하는 예외 (단일 연결로 받아야 함)"""
+    pass
+
+def honours_range(response, start):
+    """응답이 start 바이트부터의 부분 응답(206, Content-Range)인지 확인합니다."""
+    if response.status != 206:
+        return False
+    content_range = response.headers.get('Content-Range') or ''
+    # 예: "bytes 1048576-2097151/5242880"
+    if not content_range.startswith('bytes '):
+        return True
+    return content_range[len('bytes '):].split('-', 1)[0].strip() == str(start)
+
+class RangeDownloader:
+    """단일 HTTP 스트림을 여러 연결로 나누어 받는 다운로더
+
+    파일을 고정 크기 청크로 나누고 청크마다 HTTP Range 요청을 보내 동시에 받습니다.
+    연결당 속도 제한이 있는 서버에서 한 파일의 다운로드 속도를 높이기 위해 사용합니다.
+    받은 청크 번호는 <파일>.part.chunks에 기록되므로, 중단된 다운로드는
+    남은 청크만 이어서 받습니다.
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super(RangeDownloader, cls).__new__(cls)
+                cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        with self._lock:
+            if not self._initialized:
+                self._initialized = True
+                self._connection_slots = None
+                self._max_connections = None
+                # 여러 연결을 한꺼번에 예약하는 작업끼리 일부씩 나누어 잡고 서로 기다리지 않도록 직렬화
+                self._reserve_lock = threading.Lock()
+
+    def download(self, ydl, url, headers, total_size, output_path, connections, chunk_size, progress_hook=None):
+        """파일을 여러 연결로 나누어 다운로드합니다.
+
+        Args:
+            ydl (yt_dlp.YoutubeDL): 요청에 사용할 인스턴스 (쿠키, 프록시 설정 공유)
+            url (str): 다운로드 URL
+            headers (dict): HTTP 헤더
+            total_size (int): 전체 파일 크기 (바이트)
+            output_path (str): 저장할 파일 경로
+            connections (int): 이 작업에서 사용할 최대 연결 수
+            chunk_size (int): 청크 크기 (바이트)
+            progress_hook (callable): yt-dlp progress hook과 같은 형식의 dict를 받는 콜백
+
+        Returns:
+            str: 저장된 파일 경로
+
+        Raises:
+            RangeNotSupportedError: 서버가 Range 요청을 무시한 경우 (임시 파일과 상태 파일은 삭제됨)
+        """
+        part_path = output_path + '.part'
+        state_path = part_path + '.chunks'
+        chunks = [(start, min(start + chunk_size, total_size) - 1) for start in range(0, total_size, chunk_size)]
+        done = self._load_state(part_path, state_path, total_size, chunk_size)
+        pending = queue.Queue()
+        for index in range(len(chunks)):
+            if index not in done:
+                pending.put(index)
+
+        worker_count = max(1, min(connections, pending.qsize()))
+        log.info(f"분할 다운로드 시작 - 청크: {len(chunks)}개 (남은 청크: {pending.qsize()}개), 연결: {worker_count}, 파일: {output_path}")
+
+        resumed = sum(chunks[i][1] - chunks[i][0] + 1 for i in done)
+        progress = {
+            'downloaded': resumed,
+            'resumed': resumed,
+            'start_time': time.monotonic(),
+            'lock': threading.Lock(),
+            'errors': []
+        }
+        with open(state_path, 'a', encoding='utf-8') as state_file:
+            workers = [
+                threading.Thread(
+                    target=self._worker,
+                    args=(ydl, url, headers, part_path, chunks, pending, state_file, progress, total_size, progress_hook),
+                    daemon=True
+                )
+                for _ in range(worker_count)
+            ]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+
+        if progress['errors']:
+            error = progress['errors'][0]
+            if isinstance(error, RangeNotSupportedError):
+                # 받은 청크 기록을 믿을 수 없으므로 이어받지 않도록 모두 삭제
+                for path in (part_path, state_path):
+                    if os.path.exists(path):
+                        os.remove(path)
+            raise error
+
+        os.replace(part_path, output_path)
+        os.remove(state_path)
+        log.info(f"분할 다운로드 완료: {output_path}")
+        return output_path
+
+    def _load_state(self, part_path, state_path, total_size, chunk_size):
+        """이전에 받은 청크 번호를 읽고, 이어받을 수 없으면 임시 파일을 새로 만듭니다."""
+        header = f"{total_size} {chunk_size}"
+        done = set()
+        if os.path.exists(part_path) and os.path.exists(state_path) and os.path.getsize(part_path) == total_size:
+            with open(state_path, 'r', encoding='utf-8') as f:
+                lines = f.read().splitlines()
+            if lines and lines[0] == header:
+                done = {int(line) for line in lines[1:] if line.strip().isdigit()}
+                log.info(f"분할 다운로드 이어받기 - 받은 청크: {len(done)}개")
+                return done
+
+        with open(part_path, 'wb') as f:
+            f.truncate(total_size)
+        with open(state_path, 'w', encoding='utf-8') as f:
+            f.write(header + '\n')
+        return done
+
+    def _worker(self, ydl, url, headers, part_path, chunks, pending, state_file, progress, total_size, progress_hook):
+        with open(part_path, 'r+b') as f:
+            while not progress['errors']:
+                try:
+                    index = pending.get_nowait()
+                except queue.Empty:
+                    return
+
+                for attempt in range(1, CHUNK_RETRIES + 1):
+                    try:
+                        with self._get_connection_slots():
+                            self._fetch_chunk(ydl, url, headers, f, chunks[index], progress, total_size, progress_hook)
+                        break
+                    except RangeNotSupportedError as e:
+                        # 다시 요청해도 같은 응답이므로 재시도하지 않음
+                        log.warning(f"청크 {index}: {str(e)}")
+                        progress['errors'].append(e)
+                        return
+                    except Exception as e:
+                        if attempt == CHUNK_RETRIES:
+                            log.error(f"청크 {index} 다운로드 실패: {str(e)}")
+                            progress['errors'].append(e)
+                            return
+                        log.warning(f"청크 {index} 다운로드 재시도 ({attempt}/{CHUNK_RETRIES}): {str(e)}")
+
+                with progress['lock']:
+                    state_file.write(f"{index}\n")
+                    state_file.flush()
+
+    def _fetch_chunk(self, ydl, url, headers, f, chunk, progress, total_size, progress_hook):
+        start, end = chunk
+        response = ydl.urlopen(Request(url, headers=dict(headers, Range=f'bytes={start}-{end}')))
+        # 서버가 Range를 무시하고 200으로 전체 본문을 보내면 이 청크 위치부터 파일 전체가 쓰여
+        # 이미 받은 뒤쪽 청크를 덮어쓰므로, 본문을 읽기 전에 확인
+        if not honours_range(response, start):
+            response.close()
+            raise RangeNotSupportedError(f"서버가 Range 요청을 지원하지 않습니다 (HTTP {response.status}, 요청 위치 {start})")
+        received = 0
+        try:
+            f.seek(start)
+            while True:
+                data = response.read(READ_SIZE)
+                if not data:
+                    break
+                f.write(data)
+                received += len(data)
+                self._report(progress, len(data), total_size, progress_hook)
+        except Exception:
+            self._report(progress, -received, total_size, None)
+            raise
+        finally:
+            response.close()
+
+        if received != end - start + 1:
+            self._report(progress, -received, total_size, None)
+            raise IOError(f"청크 크기가 맞지 않습니다 (기대: {end - start + 1}, 실제: {received})")
+
+    def _report(self, progress, delta, total_size, progress_hook):
+        with progress['lock']:
+            progress['downloaded'] += delta
+            downloaded = progress['downloaded']
+        if progress_hook:
+            elapsed = max(time.monotonic() - progress['start_time'], 1e-6)
+            progress_hook({
+                'status': 'downloading',
+                'total_bytes': total_size,
+                'downloaded_bytes': downloaded,
+                'speed': (downloaded - progress['resumed']) / elapsed
+            })
+
+    @contextlib.contextmanager
+    def reserve_connections(self, count):
+        """전체 연결 수 제한에서 count개의 연결을 예약합니다.
+
+        yt-dlp가 직접 여러 연결을 여는 다운로드(DASH/HLS 조각)가 분할 다운로드와
+        같은 max_connections 제한을 따르도록, 다운로드하는 동안 연결을 잡아 둡니다.
+
+        Args:
+            count (int): 예약할 연결 수 (max_connections보다 크면 max_connections)
+        """
+        slots = self._get_connection_slots()
+        count = max(1, min(count, self._max_connections))
+        with self._reserve_lock:
+            for _ in range(count):
+                slots.acquire()
+        try:
+            yield count
+        finally:
+            for _ in range(count):
+                slots.release()
+
+    def _get_connection_slots(self):
+        """모든 작업이 공유하는 전체 연결 수 제한"""
+        with self._lock:
+            if self._connection_slots is None:
+                max_connections = configuration_instance.get_or_default(16, "download", "max_connections")
+                self._max_connections = max(1, max_connections)
+                self._connection_slots = threading.BoundedSemaphore(self._max_connections)
+        return self._connection_slots
+
+# 싱글톤 인스턴스 생성
+range_downloader_instance = RangeDownloader()
@@ -0,0 +1,356 @@
+import os
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from model.Log import log
+from model.Configuration import configuration_instance
+from model.PerformanceLog import performance_log_instance
+from controller.logic.FFmpegProbe import ffmpeg_probe_instance
+from controller.logic.FFmpegRunner import ffmpeg_runner_instance
+
+# MPEG-1 Layer III 프레임 하나의 샘플 수
+SAMPLES_PER_FRAME = 1152
+# 구간 하나의 최소 길이 (초), 이보다 짧게 나누면 프로세스 시작 비용이 더 큼
+MIN_SEGMENT_SECONDS = 60
+# MPEG-1 Layer III 헤더의 비트레이트 인덱스 → kbps (0은 free format, 15는 사용 안 함)
+_FRAME_BITRATES = (None, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, None)
+# MPEG-1 헤더의 샘플레이트 인덱스 → Hz (구간 인코딩은 MPEG-1 샘플레이트에서만 사용)
+_FRAME_SAMPLE_RATES = (44100, 48000, 32000, None)
+# Xing/Info 태그 플래그: 프레임 수, 바이트 수, TOC, 품질 (ffmpeg이 항상 모두 기록)
+_XING_FLAGS = 0x0F
+# LAME 태그의 CRC-16 (다항식 0x8005, 비트 역순, 초깃값 0)
+_CRC16_TABLE = []
+for _byte in range(256):
+    _crc = _byte
+    for _ in range(8):
+        _crc = (_crc >> 1) ^ 0xA001 if _crc & 1 else _crc >> 1
+    _CRC16_TABLE.append(_crc)
+# 0 바이트를 이만큼 이어 붙이면 CRC 레지스터가 원래 값으로 돌아옴 (x^8의 위수)
+_CRC16_PERIOD = 32767
+
+def _crc16(data, crc=0):
+    for byte in data:
+        crc = _CRC16_TABLE[(crc ^ byte) & 0xFF] ^ (crc >> 8)
+    return crc
+
+def _crc16_shift(crc, length):
+    """CRC 뒤에 0 바이트 length개를 이어 붙인 결과 (length가 음수이면 되돌림)
+
+    crc(A + B) = _crc16_shift(crc(A), len(B)) ^ crc(B) 이므로, 큰 구간의 CRC를
+    직접 계산하지 않고 ffmpeg이 기록한 CRC와 앞뒤 작은 구간만으로 가운데 구간의 CRC를 구합니다.
+    """
+    for _ in range(length % _CRC16_PERIOD):
+        crc = _CRC16_TABLE[crc & 0xFF] ^ (crc >> 8)
+    return crc
+
+class Mp3SpliceError(Exception):
+    """구간별 MP3 출력을 이어 붙일 수 없을 때 발생하는 예외 (프레임 형식, 태그, 길이 불일치)"""
+    pass
+
+class SegmentedEncoder:
+    """긴 오디오를 여러 구간으로 나누어 ffmpeg 프로세스 여러 개로 동시에 MP3 인코딩하는 클래스
+
+    LAME은 프레임 사이에 비트 저장소(bit reservoir)와 MDCT 중첩을 사용하므로, 구간을 그냥 이어
+    붙이면 경계에서 소리가 끊기거나 겹칩니다. 그래서 다음과 같이 인코딩합니다.
+
+    - 구간 경계는 MP3 프레임(1152 샘플) 단위로 정하고, 각 구간은 경계보다 preroll_frames개 프레임
+      앞에서부터 경계 뒤 preroll_frames개 프레임까지 인코딩합니다. 인코더 지연이 프레임 단위로
+      일정하므로 각 구간의 n번째 프레임은 한 번에 인코딩했을 때의 프레임 위치와 정확히 맞습니다.
+    - 비트 저장소를 끄고(-reservoir 0) 인코딩하여 각 프레임이 앞 프레임 없이 디코딩되도록 합니다.
+    - 앞뒤로 더 인코딩한 프레임을 버리고 이어 붙인 뒤, 마지막 구간의 Xing/LAME 태그(인코더 지연,
+      끝 패딩)를 기준으로 전체 프레임 수, 바이트 수, TOC, CRC를 다시 계산한 태그를 맨 앞에 씁니다.
+
+    구간마다 ffmpeg 프로세스를 하나씩 실행하므로 구간 수는 작업 엔진의 비어 있는 인코딩 슬롯 수로
+    제한되고(FFmpegRunner.borrow_slots), 구간 스레드는 호출한 워커의 CPU 고정 설정을 이어받습니다.
+    비트 저장소를 끄면 한 번에 인코딩한 결과와 음질/크기가 달라지므로 기본값은 사용하지 않음입니다.
+
+    config.json의 segmented_encode 항목:
+    - enabled: 사용 여부 (기본값: false)
+    - min_duration_seconds: 이 길이 이상인 오디오만 나누어 인코딩
+    - segments: 구간 수 (0이면 CPU 코어 수)
+    - preroll_frames: 구간 앞뒤로 더 인코딩하는 프레임 수
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super(SegmentedEncoder, cls).__new__(cls)
+                cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        with self._lock:
+            if not self._initialized:
+                self._initialized = True
+                self._settings = None
+
+    def is_enabled(self):
+        """config.json의 segmented_encode.enabled 값"""
+        return self._get_settings()['enabled']
+
+    def plan(self, settings, duration, max_segments=None):
+        """출력 설정과 길이로 인코딩 구간을 나눕니다.
+
+        Args:
+            settings (dict): ConverterToMP3.plan_output의 출력 설정
+            duration (float): 입력 오디오 길이 (초)
+            max_segments (int): 최대 구간 수 (동시에 실행할 수 있는 ffmpeg 프로세스 수, None이면 제한 없음)
+
+        Returns:
+            list: 구간 정보(dict) 목록, 나누어 인코딩하지 않으면 None
+        """
+        config = self._get_settings()
+        if not config['enabled'] or settings['encoder'] != 'libmp3lame':
+            return None
+        if not duration or duration < config['min_duration_seconds']:
+            return None
+        sample_rate = settings['sample_rate'] or settings['source_asr']
+        if sample_rate not in _FRAME_SAMPLE_RATES:
+            # MPEG-2/2.5 샘플레이트는 프레임 크기(576 샘플)가 달라 지원하지 않음
+            return None
+
+        count = min(config['segments'] or os.cpu_count() or 1, int(duration // MIN_SEGMENT_SECONDS))
+        if max_segments is not None:
+            count = min(count, max_segments)
+        if count < 2:
+            return None
+        frames = int(duration * sample_rate) // SAMPLES_PER_FRAME
+        preroll = config['preroll_frames']
+        bounds = [frames * index // count for index in range(count)] + [None]
+        segments = []
+        for index in range(count):
+            first, end = bounds[index], bounds[index + 1]
+            skip = preroll if index > 0 else 0
+            segments.append({
+                'index': index,
+                'sample_rate': sample_rate,
+                'start_frame': first - skip,
+                # 앞에서 버릴 프레임 수
+                'skip': skip,
+                # 남길 프레임 수 (마지막 구간은 끝까지)
+                'keep': None if end is None else end - first,
+                # 인코딩할 입력 길이 (프레임 수, 마지막 구간은 끝까지)
+                'frames': None if end is None else end - first + skip + preroll
+            })
+        return segments
+
+    def encode(self, input_file, output_file, segments, encoder_args, run_ffmpeg, progress_callback=None, duration=None):
+        """구간을 동시에 인코딩하고 하나의 MP3 파일로 이어 붙입니다.
+
+        구간은 모두 동시에 실행되므로, segments는 동시에 실행할 수 있는 프로세스 수에 맞춰
+        plan(max_segments=...)으로 나눈 것이어야 합니다.
+
+        Args:
+            input_file (str): 입력 오디오 파일 경로
+            output_file (str): 출력 MP3 파일 경로
+            segments (list): plan()의 결과
+            encoder_args (list): ffmpeg 인코더 옵션 (FFmpegEncoderBackend.encoder_args)
+            run_ffmpeg (callable): run_ffmpeg(cmd, duration, progress_callback, **trace_args)로 ffmpeg을 실행하고
+                stderr 상태(dict)를 반환하는 함수 (실패 시 예외)
+            progress_callback (callable): 전체 진행률(0-100) 콜백
+            duration (float): 입력 오디오 길이 (초, 마지막 구간의 진행률 계산에 사용)
+
+        Returns:
+            float: ffmpeg 프로세스들의 CPU 시간 합계 (초, -benchmark 결과가 없으면 None)
+
+        Raises:
+            Mp3SpliceError: 구간 출력을 이어 붙일 수 없는 경우
+        """
+        base, _ = os.path.splitext(output_file)
+        for segment in segments:
+            segment['path'] = f"{base}.part{segment['index']}.mp3"
+            start = segment['start_frame'] * SAMPLES_PER_FRAME / segment['sample_rate']
+            if segment['frames'] is None:
+                segment['duration'] = max(1.0, (duration or 0) - start)
+            else:
+                segment['duration'] = segment['frames'] * SAMPLES_PER_FRAME / segment['sample_rate']
+
+        lock = threading.Lock()
+        percentages = [0.0] * len(segments)
+        total = sum(segment['duration'] for segment in segments)
+
+        def segment_progress(segment):
+            def update(percentage):
+                with lock:
+                    # 스레드 사이에 진행률 순서가 바뀌지 않도록 잠금 안에서 전달
+                    percentages[segment['index']] = percentage
+                    if progress_callback:
+                        if min(percentages) >= 100:
+                            # 부동소수점 오차로 100%에 못 미치지 않도록 모두 끝나면 정확히 100
+                            progress_callback(100.0)
+                        else:
+                            progress_callback(sum(value * item['duration'] for value, item in zip(percentages, segments)) / total)
+            return update
+
+        # 구간 스레드에서 시작하는 ffmpeg도 호출한 워커의 CPU 고정 설정을 따름
+        worker_slot = ffmpeg_runner_instance.current_worker_slot()
+
+        def run(segment):
+            with ffmpeg_runner_instance.worker_slot(*worker_slot):
+                return run_ffmpeg(
+                    self._segment_cmd(input_file, segment, encoder_args),
+                    segment['duration'],
+                    segment_progress(segment),
+                    input_file=os.path.basename(input_file),
+                    segment=segment['index']
+                )
+
+        log.info(f"구간 인코딩 시작 - {len(segments)}개 구간, 입력: {input_file}")
+        try:
+            with ThreadPoolExecutor(max_workers=len(segments), thread_name_prefix='segment-encode') as executor:
+                futures = [executor.submit(run, segment) for segment in segments]
+                # 모든 구간이 끝날 때까지 기다린 뒤 첫 번째 오류를 전달
+                errors = [future.exception() for future in futures]
+            for error in errors:
+                if error is not None:
+                    raise error
+            with performance_log_instance.stage('splice', segments=len(segments)) as perf:
+                perf['frames'] = self._splice(segments, output_file)
+        finally:
+            for segment in segments:
+                if os.path.exists(segment['path']):
+                    os.remove(segment['path'])
+
+        cpu_seconds = [future.result()['cpu_seconds'] for future in futures]
+        return None if None in cpu_seconds else sum(cpu_seconds)
+
+    def _segment_cmd(self, input_file, segment, encoder_args):
+        sample_rate = segment['sample_rate']
+        cmd = [
+            ffmpeg_probe_instance.get_ffmpeg_path(),
+            '-nostats',
+            '-progress', 'pipe:1',
+            '-ss', f"{segment['start_frame'] * SAMPLES_PER_FRAME / sample_rate:.6f}",
+        ]
+        if segment['frames'] is not None:
+            cmd += ['-t', f"{segment['frames'] * SAMPLES_PER_FRAME / sample_rate:.6f}"]
+        cmd += [
+            '-i', input_file,
+            *encoder_args,
+            '-reservoir', '0',  # 프레임이 앞 프레임의 비트를 빌리지 않도록 함
+            '-id3v2_version', '0',
+            '-write_xing', '1',  # 구간 전체의 CRC와 인코더 지연/패딩을 태그에서 읽음
+            '-f', 'mp3',
+            '-y',
+            segment['path']
+        ]
+        if performance_log_instance.is_enabled():
+            cmd.insert(1, '-benchmark')
+        return cmd
+
+    def _splice(self, segments, output_file):
+        """구간 출력에서 앞뒤로 더 인코딩한 프레임을 버리고 이어 붙입니다.
+
+        Returns:
+            int: 출력 파일의 오디오 프레임 수
+        """
+        positions = []
+        audio_bytes = 0
+        music_crc = 0
+        tag_frame = None
+        with open(output_file, 'wb') as out:
+            for segment in segments:
+                with open(segment['path'], 'rb') as f:
+                    data = f.read()
+                frames = self._frame_offsets(data, segment['path'])
+                tag = self._read_tag(data, frames[0], segment['path'])
+                if tag_frame is None:
+                    # 태그 프레임 자리를 비워 두고 마지막에 채움
+                    out.write(bytes(tag['size']))
+                elif tag['size'] != len(tag_frame):
+                    raise Mp3SpliceError(f"구간별 태그 프레임 크기가 다릅니다: {segment['path']}")
+                tag_frame = data[:tag['size']]
+
+                audio = frames[1:]
+                keep = audio[segment['skip']:] if segment['keep'] is None else audio[segment['skip']:segment['skip'] + segment['keep']]
+                if not keep or (segment['keep'] is not None and len(keep) < segment['keep']):
+                    raise Mp3SpliceError(
+                        f"구간 {segment['index']}의 프레임이 부족합니다 (필요 {segment['skip'] + (segment['keep'] or 1)}, 출력 {len(audio)}): {segment['path']}"
+                    )
+                audio_start, audio_end = audio[0][0], audio[-1][0] + audio[-1][1]
+                start, end = keep[0][0], keep[-1][0] + keep[-1][1]
+
+                # ffmpeg이 기록한 구간 전체 CRC에서 버린 앞뒤 부분을 빼서 남길 부분의 CRC를 구함
+                before, after = data[audio_start:start], data[end:audio_end]
+                crc = _crc16_shift(tag['music_crc'] ^ _crc16(after), -len(after))
+                crc ^= _crc16_shift(_crc16(before), end - start)
+                music_crc = _crc16_shift(music_crc, end - start) ^ crc
+
+                positions.extend(audio_bytes + offset - start for offset, _ in keep)
+                out.write(data[start:end])
+                audio_bytes += end - start
+
+            out.seek(0)
+            # 인코더 지연과 끝 패딩은 마지막 구간의 값이 그대로 전체의 값
+            out.write(self._build_tag(tag_frame, tag['offset'], positions, audio_bytes, music_crc))
+        log.info(f"구간 연결 완료 - 프레임 {len(positions)}개, {audio_bytes} 바이트: {output_file}")
+        return len(positions)
+
+    @staticmethod
+    def _frame_offsets(data, path):
+        """MP3 데이터의 프레임 (위치, 크기) 목록 (ID3 태그 없이 프레임만 있어야 함)"""
+        frames = []
+        position = 0
+        while position + 4 <= len(data):
+            if data[position] != 0xFF or data[position + 1] & 0xFE != 0xFA:
+                raise Mp3SpliceError(f"MPEG-1 Layer III 프레임이 아닙니다 (위치 {position}): {path}")
+            bitrate = _FRAME_BITRATES[data[position + 2] >> 4]
+            sample_rate = _FRAME_SAMPLE_RATES[(data[position + 2] >> 2) & 0x03]
+            if bitrate is None or sample_rate is None:
+                raise Mp3SpliceError(f"지원하지 않는 프레임 헤더입니다 (위치 {position}): {path}")
+            size = 144000 * bitrate // sample_rate + ((data[position + 2] >> 1) & 0x01)
+            frames.append((position, size))
+            position += size
+        if position != len(data) or len(frames) < 2:
+            raise Mp3SpliceError(f"MP3 출력이 잘렸습니다: {path}")
+        return frames
+
+    @staticmethod
+    def _read_tag(data, frame, path):
+        """첫 프레임의 Xing/Info 태그에서 태그 위치와 음악 CRC를 읽습니다."""
+        position, size = frame
+        mono = data[position + 3] >> 6 == 3
+        offset = 4 + (17 if mono else 32) + (0 if data[position + 1] & 0x01 else 2)
+        if data[position + offset:position + offset + 4] not in (b'Xing', b'Info') or size < offset + 156:
+            raise Mp3SpliceError(f"Xing/LAME 태그가 없습니다: {path}")
+        if struct.unpack_from('>I', data, position + offset + 4)[0] != _XING_FLAGS:
+            raise Mp3SpliceError(f"지원하지 않는 Xing 태그 형식입니다: {path}")
+        return {
+            'size': size,
+            'offset': offset,
+            'music_crc': struct.unpack_from('>H', data, position + offset + 152)[0]
+        }
+
+    @staticmethod
+    def _build_tag(tag_frame, offset, positions, audio_bytes, music_crc):
+        """이어 붙인 전체 오디오에 맞게 Xing/LAME 태그의 프레임 수, 크기, TOC, CRC를 고친 태그 프레임"""
+        tag = bytearray(tag_frame)
+        total_bytes = len(tag) + audio_bytes
+        frames = len(positions)
+        struct.pack_into('>II', tag, offset + 8, frames, total_bytes)
+        for index in range(100):
+            # 재생 위치 index%에 해당하는 프레임의 파일 내 위치 (전체 크기의 1/256 단위)
+            position = len(tag) + positions[index * frames // 100]
+            tag[offset + 16 + index] = min(255, position * 256 // total_bytes)
+        struct.pack_into('>IH', tag, offset + 148, total_bytes, music_crc)
+        # 태그 CRC는 CRC 칸을 0으로 둔 채 프레임 앞 190 바이트로 계산
+        struct.pack_into('>H', tag, offset + 154, 0)
+        struct.pack_into('>H', tag, offset + 154, _crc16(tag[:190]))
+        return bytes(tag)
+
+    def _get_settings(self):
+        """config.json의 segmented_encode 항목을 읽습니다."""
+        if self._settings is None:
+            self._settings = {
+                'enabled': configuration_instance.get_or_default(False, "segmented_encode", "enabled"),
+                'min_duration_seconds': configuration_instance.get_or_default(1200, "segmented_encode", "min_duration_seconds"),
+                'segments': max(0, configuration_instance.get_or_default(0, "segmented_encode", "segments")),
+                'preroll_frames': max(1, configuration_instance.get_or_default(4, "segmented_encode", "preroll_frames"))
+            }
+        return self._settings
+
+# 싱글톤 인스턴스 생성
+segmented_encoder_instance = SegmentedEncoder()
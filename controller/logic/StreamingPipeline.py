@@ -0,0 +1,114 @@
+import os
+import threading
+from collections import deque
+from model.Log import log
+from model.PerformanceLog import performance_log_instance
+from model.TraceLog import trace_log_instance
+from controller.logic.DownloadYoutubeAudio import download_youtube_audio_instance
+from controller.logic.ConverterToMP3 import converter_to_mp3_instance
+
+class StreamingPipeline:
+    """다운로드 중인 오디오를 ffmpeg 표준 입력으로 바로 흘려보내는 파이프라인
+
+    중간 임시 파일을 쓰지 않고, 다운로드와 인코딩이 동시에 진행되므로
+    전체 소요 시간이 (다운로드 + 인코딩)이 아니라 대략 max(다운로드, 인코딩)이 됩니다.
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super(StreamingPipeline, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        pass
+
+    def run(self, url, quality, save_path, progress_callback=None, speed_callback=None, info=None, preset=None):
+        """URL의 오디오를 스트리밍으로 받아 MP3로 변환합니다.
+
+        Args:
+            url (str): YouTube URL
+            quality (str): MP3 품질 (예: '192K')
+            save_path (str): 저장 경로
+            progress_callback (callable): 진행률(0-100) 콜백
+            speed_callback (callable): 다운로드 속도 문자열 콜백
+            info (dict): YoutubeTitle.get_info()로 미리 추출한 정보 (없으면 새로 추출)
+            preset (str): 인코딩 프리셋 이름 (None이면 config.json의 output.preset)
+
+        Returns:
+            tuple: (최종 MP3 파일 경로, 비디오 제목, 실제 적용된 출력 설정)
+
+        Raises:
+            StreamingNotSupportedError: 스트리밍할 수 없는 포맷인 경우 (ffmpeg 실행 전에 발생)
+        """
+        encoder = {}
+
+        def open_encoder(info):
+            process, temp_mp3, settings = converter_to_mp3_instance.start_stream_encode(
+                quality, save_path, download_youtube_audio_instance.source_info(info), preset
+            )
+            # stderr를 별도 스레드에서 비워 파이프 버퍼가 가득 차 멈추지 않도록 함
+            stderr_tail = deque(maxlen=10)
+            drain_thread = threading.Thread(target=self._drain, args=(process.stderr, stderr_tail), daemon=True)
+            drain_thread.start()
+            encoder.update(process=process, temp_mp3=temp_mp3, settings=settings, stderr_tail=stderr_tail, drain_thread=drain_thread)
+            return process.stdin
+
+        try:
+            info = download_youtube_audio_instance.stream_audio(
+                url, quality, open_encoder, progress_callback, speed_callback, info=info
+            )
+
+            process = encoder['process']
+            process.stdin.close()
+            returncode = process.wait()
+            trace_log_instance.process_finished(process)
+            encoder['drain_thread'].join()
+            process.check_timeout()
+            if returncode != 0:
+                error_msg = f"FFmpeg 변환 실패 (종료 코드: {returncode}): {' / '.join(encoder['stderr_tail'])}"
+                log.error(error_msg)
+                raise Exception(error_msg)
+
+            title = info['title']
+            with performance_log_instance.stage('rename'):
+                final_path = converter_to_mp3_instance.finalize_output(
+                    encoder['temp_mp3'], converter_to_mp3_instance.sanitize_filename(title), save_path
+                )
+            log.info(f"스트리밍 변환 완료: {final_path}")
+            return final_path, title, encoder['settings']
+
+        except Exception:
+            self._cleanup(encoder)
+            raise
+
+    def _drain(self, stream, tail):
+        """ffmpeg stderr를 끝까지 읽고 마지막 몇 줄만 보관합니다."""
+        for line in iter(stream.readline, b''):
+            tail.append(line.decode('utf-8', errors='replace').strip())
+        stream.close()
+
+    def _cleanup(self, encoder):
+        """실패한 스트리밍 작업의 ffmpeg 프로세스와 임시 파일을 정리합니다."""
+        process = encoder.get('process')
+        if process is None:
+            return
+        if process.poll() is None:
+            # ffmpeg 프로세스 그룹 전체를 종료
+            process.kill()
+        try:
+            process.stdin.close()
+        except OSError:
+            pass
+        process.wait()
+        trace_log_instance.process_finished(process)
+        temp_mp3 = encoder['temp_mp3']
+        if os.path.exists(temp_mp3):
+            log.info(f"임시 MP3 파일 삭제: {temp_mp3}")
+            os.remove(temp_mp3)
+
+# 싱글톤 인스턴스 생성
+streaming_pipeline_instance = StreamingPipeline()
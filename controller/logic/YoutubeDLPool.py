@@ -0,0 +1,155 @@
+import queue
+import threading
+from contextlib import contextmanager
+import yt_dlp
+from model.Log import log
+from model.Configuration import configuration_instance
+
+# 설정되지 않은 params 키를 복원할 때 사용하는 표시
+_MISSING = object()
+
+class YoutubeDLPool:
+    """미리 만들어 둔 YoutubeDL 인스턴스를 작업 간에 재사용하는 풀
+
+    YoutubeDL 생성 시 매번 반복되는 추출기 초기화, HTTP 핸들러/쿠키 저장소 생성을
+    한 번만 수행하고, 연결(keep-alive)과 추출기 상태를 다음 작업에서도 이어서 사용합니다.
+    작업별로 달라지는 format, outtmpl, progress_hooks 및 기타 params는
+    acquire() 동안에만 적용되고 반납 시 원래 값으로 복원됩니다.
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    # 모든 인스턴스에 공통으로 적용되는 옵션
+    _base_options = {
+        'quiet': True,
+        'no_warnings': True,
+        'noplaylist': True,
+        'extract_flat': False,
+        'ignoreerrors': False,
+        'verbose': False,
+        'noprogress': True,
+        'logger': log,
+        'force_generic_extractor': False
+    }
+
+    def __new__(cls):
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super(YoutubeDLPool, cls).__new__(cls)
+                cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        with self._lock:
+            if not self._initialized:
+                self._initialized = True
+                self._pool_size = None
+                self._created = 0
+                self._idle = queue.LifoQueue()  # 가장 최근에 사용한 (연결이 살아있는) 인스턴스를 먼저 사용
+
+    @contextmanager
+    def acquire(self, **overrides):
+        """풀에서 YoutubeDL 인스턴스를 빌려 작업별 옵션을 적용합니다.
+
+        Args:
+            **overrides: 이번 작업에만 적용할 params.
+                format, outtmpl, progress_hooks는 YoutubeDL 내부 상태에도 반영됩니다.
+
+        Yields:
+            yt_dlp.YoutubeDL: 작업별 옵션이 적용된 인스턴스
+        """
+        ydl = self._take()
+        saved = self._apply(ydl, overrides)
+        try:
+            yield ydl
+        finally:
+            self._restore(ydl, saved)
+            self._idle.put(ydl)
+
+    @contextmanager
+    def dedicated(self, **overrides):
+        """풀과 별도로 공통 옵션을 적용한 YoutubeDL 인스턴스를 만들어 빌려줍니다.
+
+        플레이리스트/채널 항목 확인처럼 오래 걸리는 작업이 풀의 인스턴스를 붙잡아
+        다운로드 작업이 기다리지 않도록 할 때 사용하며, 블록을 벗어나면 닫힙니다.
+
+        Args:
+            **overrides: 이 인스턴스에 적용할 params
+
+        Yields:
+            yt_dlp.YoutubeDL: 풀에 속하지 않는 인스턴스
+        """
+        ydl = yt_dlp.YoutubeDL(dict(self._base_options, **overrides))
+        try:
+            yield ydl
+        finally:
+            ydl.close()
+
+    def close(self):
+        """풀의 모든 인스턴스를 닫습니다 (쿠키 저장, 연결 종료)."""
+        while True:
+            try:
+                ydl = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            ydl.close()
+            with self._lock:
+                self._created -= 1
+
+    def _take(self):
+        """쉬고 있는 인스턴스를 꺼내거나, 풀 크기 이내라면 새로 만듭니다."""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            if self._pool_size is None:
+                self._pool_size = max(1, configuration_instance.get_or_default(4, "engine", "ydl_pool_size"))
+            create = self._created < self._pool_size
+            if create:
+                self._created += 1
+
+        if create:
+            log.info(f"YoutubeDL 인스턴스 생성 ({self._created}/{self._pool_size})")
+            return yt_dlp.YoutubeDL(dict(self._base_options))
+
+        # 풀이 가득 찼으면 다른 작업이 반납할 때까지 대기
+        return self._idle.get()
+
+    def _apply(self, ydl, overrides):
+        """작업별 옵션을 적용하고 복원에 필요한 이전 값을 반환합니다."""
+        saved = {
+            'params': {},
+            'format_selector': ydl.format_selector,
+            'progress_hooks': list(ydl._progress_hooks)
+        }
+        for key, value in overrides.items():
+            if key == 'progress_hooks':
+                for hook in value:
+                    ydl.add_progress_hook(hook)
+                continue
+
+            saved['params'][key] = ydl.params.get(key, _MISSING)
+            if key == 'outtmpl':
+                # YoutubeDL은 생성 시 outtmpl을 {'default': ...} 형태로 정규화함
+                value = dict(ydl.params['outtmpl'], default=value) if isinstance(value, str) else value
+            ydl.params[key] = value
+            if key == 'format':
+                ydl.format_selector = ydl.build_format_selector(value) if value else None
+        return saved
+
+    def _restore(self, ydl, saved):
+        """_apply() 이전 상태로 되돌립니다."""
+        for key, value in saved['params'].items():
+            if value is _MISSING:
+                ydl.params.pop(key, None)
+            else:
+                ydl.params[key] = value
+        ydl.format_selector = saved['format_selector']
+        # YoutubeDL에는 훅 제거 API가 없으므로 목록을 직접 복원
+        ydl._progress_hooks[:] = saved['progress_hooks']
+
+# 싱글톤 인스턴스 생성
+youtube_dl_pool_instance = YoutubeDLPool()
@@ -1,5 +1,8 @@
-import yt_dlp
 from model.Log import log
+from model.MetadataCache import metadata_cache_instance
+from model.PerformanceLog import performance_log_instance
+from controller.logic.CheckURL import check_url_instance
+from controller.logic.YoutubeDLPool import youtube_dl_pool_instance
 import threading
 
 class YoutubeTitle:
@@ -17,26 +20,35 @@ class YoutubeTitle:
         
     def get(self, url):
         """YouTube URL에서 비디오 제목을 가져옵니다."""
+        info = self.get_info(url)
+        if info is None:
+            return None
+        return info['title']
+        
+    def get_info(self, url):
+        """YouTube URL에서 비디오 정보를 가져옵니다.
+        
+        포맷 선택 전의 원본 추출 결과(process=False) 또는 메타데이터 캐시의 요약 정보를 반환하므로,
+        다운로드 단계에서 DownloadYoutubeAudio.download_audio(info=...)로 넘기면
+        페이지/플레이어 JS를 다시 가져오지 않고 포맷 선택과 다운로드만 수행합니다.
+        
+        Returns:
+            dict: 비디오 정보 (실패 시 None)
+        """
         try:
-            # URL 정규화
-            if 'youtu.be' in url:
-                video_id = url.split('youtu.be/')[-1].split('?')[0]
-                url = f'https://www.youtube.com/watch?v={video_id}'
-            elif '&' in url:
-                url = url.split('&')[0]
-                
-            ydl_opts = {
-                'quiet': True,
-                'no_warnings': True,
-                'extract_flat': False,
-                'noplaylist': True,
-                'ignoreerrors': False,
-                'verbose': False,
-                'force_generic_extractor': False
-            }
+            url = self._normalize_url(url)
             
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
+            # 최근에 조회한 비디오면 캐시된 정보 사용
+            video_id = check_url_instance.extract_video_id(url)
+            with performance_log_instance.stage('metadata', source='cache'):
+                cached = metadata_cache_instance.get(video_id)
+            if cached:
+                log.info(f"메타데이터 캐시 사용: {video_id}")
+                return cached
+                
+            with youtube_dl_pool_instance.acquire() as ydl:
+                with performance_log_instance.stage('metadata', source='extract'):
+                    info = ydl.extract_info(url, download=False, process=False)
                 
                 if info is None:
                     log.error("비디오 정보를 추출할 수 없습니다.")
@@ -50,11 +62,21 @@ class YoutubeTitle:
                     log.error("제목 정보가 없습니다.")
                     return None
                     
-                return info['title']
+                metadata_cache_instance.put(info.get('id') or video_id, info)
+                return info
                 
         except Exception as e:
             log.error(f"비디오 정보를 가져오는 중 오류 발생: {str(e)}")
             return None
+            
+    def _normalize_url(self, url):
+        """URL을 정규화합니다."""
+        if 'youtu.be' in url:
+            video_id = url.split('youtu.be/')[-1].split('?')[0]
+            url = f'https://www.youtube.com/watch?v={video_id}'
+        elif '&' in url:
+            url = url.split('&')[0]
+        return url
 
 # 싱글톤 인스턴스 생성
 youtube_title_instance = YoutubeTitle() 
\ No newline at end of file
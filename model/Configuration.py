@@ -120,6 +120,23 @@ class Configuration:
             result = result[key]
         return result
 
+    def get_or_default(self, default: Any, *keys: str) -> Any:
+        """설정 값을 가져오고, 설정 키가 없으면 기본값을 반환합니다.
+        
+        이전 버전의 설정 파일에 없는 선택 설정을 읽을 때 사용합니다.
+        
+        Args:
+            default: 설정 키가 존재하지 않을 때 반환할 값
+            *keys: 가져올 설정의 키 값들 (여러 단계의 중첩된 키)
+            
+        Returns:
+            Any: 설정 값 또는 기본값
+        """
+        try:
+            return self.get(*keys)
+        except KeyError:
+            return default
+
     def set(self, value: Any, *keys: str) -> None:
         """설정 값을 업데이트합니다.
         
@@ -185,7 +202,71 @@ class Configuration:
                 "max_backup_count": 2,
                 "encoding": "utf-8",
                 "log_level": "DEBUG",
-                "enable_performance_logging": True
+                "enable_performance_logging": True,
+                "performance_log_file": "performance_log.jsonl",
+                "enable_tracing": False,
+                "trace_file": "trace.json",
+                "async_logging": True,
+                "queue_size": 10000,
+                "queue_full_policy": "drop_debug",
+                "compress_backups": True
+            },
+            "engine": {
+                "download_workers": 3,
+                "encode_workers": 0,
+                "encode_queue_size": 0,
+                "streaming": False,
+                "ydl_pool_size": 4,
+                "playlist_resolvers": 2,
+                "enable_job_journal": True,
+                "job_journal_file": "job_journal.db",
+                "resume_on_startup": True
+            },
+            "progress": {
+                "update_interval_ms": 100
+            },
+            "output": {
+                "profile": "mp3",
+                "keep_codecs": ["mp3", "aac"],
+                "adaptive_bitrate": True,
+                "preset": "cbr",
+                "encoder_backend": "ffmpeg",
+                "presets": {
+                    "cbr": {"mode": "cbr"},
+                    "abr": {"mode": "abr"},
+                    "vbr_high": {"mode": "vbr", "vbr_quality": 2},
+                    "vbr_standard": {"mode": "vbr", "vbr_quality": 4},
+                    "fast": {"mode": "cbr", "compression_level": 9},
+                    "mono": {"mode": "cbr", "mono": True}
+                }
+            },
+            "segmented_encode": {
+                "enabled": False,
+                "min_duration_seconds": 1200,
+                "segments": 0,
+                "preroll_frames": 4
+            },
+            "ffmpeg": {
+                "threads": 0,
+                "nice": 0,
+                "io_priority": "",
+                "pin_cpus": False,
+                "timeout_seconds": 0
+            },
+            "download": {
+                "parallel_download": False,
+                "connections_per_job": 4,
+                "max_connections": 16,
+                "chunk_size_mb": 4
+            },
+            "cache": {
+                "enable_metadata_cache": True,
+                "metadata_cache_file": "metadata_cache.db",
+                "metadata_ttl_seconds": 3600,
+                "metadata_max_entries": 5000,
+                "enable_download_archive": True,
+                "download_archive_file": "download_archive.db",
+                "ffmpeg_probe_file": "ffmpeg_probe.json"
             },
             "gui": {
                 "main_window": {
@@ -0,0 +1,146 @@
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+class DownloadArchive:
+    """이미 변환한 비디오를 기록하는 SQLite 색인
+
+    (비디오 ID, 품질, 인코더 설정, 저장 경로)를 키로 결과 파일 경로와 크기를 저장하여,
+    같은 설정으로 같은 경로에 다시 요청된 비디오는 네트워크 작업 없이 기존 파일을 반환할 수 있게 합니다.
+    """
+
+    _instance: Optional['DownloadArchive'] = None
+    _lock = threading.Lock()
+
+    def __new__(cls) -> 'DownloadArchive':
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super(DownloadArchive, cls).__new__(cls)
+                cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        with self._lock:
+            if not self._initialized:
+                self._initialized = True
+                self._enabled = False
+                self._connection = None
+
+    def setup(self,
+              enable_archive: bool = True,
+              archive_file: str = 'download_archive.db') -> None:
+        """
+        다운로드 색인을 초기화합니다.
+
+        Args:
+            enable_archive (bool): 색인 사용 여부
+            archive_file (str): SQLite 색인 파일 경로
+        """
+        with self._lock:
+            if self._connection:
+                self._connection.close()
+                self._connection = None
+            self._enabled = enable_archive
+
+            if False == enable_archive:
+                return
+
+            self._connection = sqlite3.connect(archive_file, check_same_thread=False, isolation_level=None)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            columns = [row[1] for row in self._connection.execute("PRAGMA table_info(archive)")]
+            if columns and 'save_dir' not in columns:
+                # 저장 경로가 키에 없던 이전 색인은 어느 요청의 결과인지 알 수 없으므로 다시 만듦
+                self._connection.execute("DROP TABLE archive")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS archive ("
+                "video_id TEXT NOT NULL, "
+                "quality TEXT NOT NULL, "
+                "encoder_settings TEXT NOT NULL, "
+                "save_dir TEXT NOT NULL, "
+                "output_path TEXT NOT NULL, "
+                "output_size INTEGER NOT NULL, "
+                "title TEXT, "
+                "created_at REAL NOT NULL, "
+                "PRIMARY KEY (video_id, quality, encoder_settings, save_dir))"
+            )
+
+    def get(self, video_id: str, quality: str, encoder_settings: str, save_dir: str) -> Optional[dict]:
+        """
+        같은 설정으로 같은 저장 경로에 변환한 기존 결과를 반환합니다.
+        파일이 삭제되었거나 크기가 달라졌으면 항목을 지우고 None을 반환합니다.
+
+        Args:
+            video_id (str): YouTube 비디오 ID
+            quality (str): 품질 (예: '192K')
+            encoder_settings (str): 인코더 설정 문자열
+            save_dir (str): 저장 경로
+
+        Returns:
+            dict: {'output_path', 'output_size', 'title'} 또는 None
+        """
+        if not self._enabled or not video_id:
+            return None
+        save_dir = os.path.abspath(save_dir)
+        with self._lock:
+            if not self._connection:
+                return None
+            row = self._connection.execute(
+                "SELECT output_path, output_size, title FROM archive "
+                "WHERE video_id = ? AND quality = ? AND encoder_settings = ? AND save_dir = ?",
+                (video_id, quality, encoder_settings, save_dir)
+            ).fetchone()
+        if row is None:
+            return None
+
+        output_path, output_size, title = row
+        try:
+            valid = os.path.getsize(output_path) == output_size
+        except OSError:
+            valid = False
+        if not valid:
+            self.remove(video_id, quality, encoder_settings, save_dir)
+            return None
+        return {'output_path': output_path, 'output_size': output_size, 'title': title}
+
+    def put(self, video_id: str, quality: str, encoder_settings: str, save_dir: str, output_path: str, title: str = None) -> None:
+        """
+        변환 결과를 기록합니다.
+
+        Args:
+            video_id (str): YouTube 비디오 ID
+            quality (str): 품질 (예: '192K')
+            encoder_settings (str): 인코더 설정 문자열
+            save_dir (str): 요청한 저장 경로
+            output_path (str): 결과 파일 경로
+            title (str): 비디오 제목
+        """
+        if not self._enabled or not video_id:
+            return
+        save_dir = os.path.abspath(save_dir)
+        output_path = os.path.abspath(output_path)
+        output_size = os.path.getsize(output_path)
+        with self._lock:
+            if not self._connection:
+                return
+            self._connection.execute(
+                "INSERT OR REPLACE INTO archive "
+                "(video_id, quality, encoder_settings, save_dir, output_path, output_size, title, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (video_id, quality, encoder_settings, save_dir, output_path, output_size, title, time.time())
+            )
+
+    def remove(self, video_id: str, quality: str, encoder_settings: str, save_dir: str) -> None:
+        """항목을 삭제합니다."""
+        save_dir = os.path.abspath(save_dir)
+        with self._lock:
+            if self._connection:
+                self._connection.execute(
+                    "DELETE FROM archive WHERE video_id = ? AND quality = ? AND encoder_settings = ? AND save_dir = ?",
+                    (video_id, quality, encoder_settings, save_dir)
+                )
+
+# 싱글톤 인스턴스 생성
+download_archive_instance = DownloadArchive()
@@ -0,0 +1,123 @@
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+class JobJournal:
+    """끝나지 않은 작업을 기록하는 SQLite 저널
+
+    작업을 등록할 때 기록하고 작업이 끝나면(성공/실패) 지웁니다.
+    프로그램이 비정상 종료되거나 취소되어 남은 항목은 다음 실행 시
+    다시 등록되어, 남아 있는 .part 파일부터 이어서 다운로드됩니다.
+    """
+
+    _instance: Optional['JobJournal'] = None
+    _lock = threading.Lock()
+
+    def __new__(cls) -> 'JobJournal':
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super(JobJournal, cls).__new__(cls)
+                cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        with self._lock:
+            if not self._initialized:
+                self._initialized = True
+                self._enabled = False
+                self._connection = None
+
+    def setup(self,
+              enable_journal: bool = True,
+              journal_file: str = 'job_journal.db') -> None:
+        """
+        작업 저널을 초기화합니다.
+
+        Args:
+            enable_journal (bool): 저널 사용 여부
+            journal_file (str): SQLite 저널 파일 경로
+        """
+        with self._lock:
+            if self._connection:
+                self._connection.close()
+                self._connection = None
+            self._enabled = enable_journal
+
+            if False == enable_journal:
+                return
+
+            self._connection = sqlite3.connect(journal_file, check_same_thread=False, isolation_level=None)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS pending_jobs ("
+                "journal_id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                "url TEXT NOT NULL, "
+                "quality TEXT NOT NULL, "
+                "save_path TEXT NOT NULL, "
+                "profile TEXT, "
+                "preset TEXT, "
+                "created_at REAL NOT NULL)"
+            )
+            # 출력 프로필/프리셋 항목이 없던 이전 저널에 열 추가 (기존 항목은 NULL이면 기본값으로 재등록)
+            columns = [row[1] for row in self._connection.execute("PRAGMA table_info(pending_jobs)")]
+            for column in ('profile', 'preset'):
+                if column not in columns:
+                    self._connection.execute(f"ALTER TABLE pending_jobs ADD COLUMN {column} TEXT")
+
+    def add(self, url: str, quality: str, save_path: str, profile: str = None, preset: str = None) -> Optional[int]:
+        """
+        작업을 기록합니다.
+
+        Args:
+            url (str): YouTube URL
+            quality (str): 품질 (예: '192K')
+            save_path (str): 저장 경로
+            profile (str): 출력 프로필
+            preset (str): 인코딩 프리셋 이름
+
+        Returns:
+            int: 저널 항목 ID (저널을 사용하지 않으면 None)
+        """
+        if not self._enabled:
+            return None
+        with self._lock:
+            if not self._connection:
+                return None
+            cursor = self._connection.execute(
+                "INSERT INTO pending_jobs (url, quality, save_path, profile, preset, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (url, quality, save_path, profile, preset, time.time())
+            )
+            return cursor.lastrowid
+
+    def remove(self, journal_id: Optional[int]) -> None:
+        """끝난 작업을 지웁니다."""
+        if not self._enabled or journal_id is None:
+            return
+        with self._lock:
+            if self._connection:
+                self._connection.execute("DELETE FROM pending_jobs WHERE journal_id = ?", (journal_id,))
+
+    def pending(self) -> list:
+        """
+        끝나지 않은 작업 목록을 등록 순서대로 반환합니다.
+
+        Returns:
+            list[dict]: {'journal_id', 'url', 'quality', 'save_path', 'profile', 'preset'} 목록
+                (profile, preset은 이전 저널의 항목이면 None)
+        """
+        if not self._enabled:
+            return []
+        with self._lock:
+            if not self._connection:
+                return []
+            rows = self._connection.execute(
+                "SELECT journal_id, url, quality, save_path, profile, preset FROM pending_jobs ORDER BY journal_id"
+            ).fetchall()
+        return [
+            {'journal_id': row[0], 'url': row[1], 'quality': row[2], 'save_path': row[3], 'profile': row[4], 'preset': row[5]}
+            for row in rows
+        ]
+
+# 싱글톤 인스턴스 생성
+job_journal_instance = JobJournal()
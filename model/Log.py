@@ -1,10 +1,13 @@
 import threading
 from typing import Optional
+import atexit
+import gzip
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 import datetime
-import inspect
 import os
+import queue
+import shutil
 
 class MicrosecondFormatter(logging.Formatter):
     def formatTime(self, record, datefmt=None):
@@ -16,6 +19,79 @@ class MicrosecondFormatter(logging.Formatter):
             s = "%s.%03d" % (t, record.msecs)
         return s
 
+# 로깅이 비활성화되었을 때의 최소 레벨
+DISABLED_LEVEL = logging.CRITICAL + 1
+
+# 비동기 로깅 큐가 가득 찼을 때의 처리 방식
+QUEUE_FULL_BLOCK = 'block'            # 자리가 날 때까지 대기
+QUEUE_FULL_DROP_DEBUG = 'drop_debug'  # DEBUG 레코드는 버리고, 그 외 레벨만 대기
+
+class _BoundedQueueHandler(QueueHandler):
+    """큐가 가득 찼을 때의 처리 방식을 선택할 수 있는 QueueHandler"""
+
+    def __init__(self, log_queue, queue_full_policy):
+        super().__init__(log_queue)
+        self._queue_full_policy = queue_full_policy
+        self.dropped_count = 0
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            if self._queue_full_policy == QUEUE_FULL_DROP_DEBUG and record.levelno <= logging.DEBUG:
+                self.dropped_count += 1
+                return
+            self.queue.put(record)
+
+class _CompressingRotator:
+    """백업 로그 파일을 별도 스레드에서 gzip으로 압축하는 RotatingFileHandler용 rotator
+
+    로그 파일은 이름만 바꾸고 바로 반환하므로 로그 기록이 압축을 기다리지 않습니다.
+    """
+
+    def __init__(self):
+        self._thread = None
+
+    @staticmethod
+    def namer(default_name):
+        return default_name + '.gz'
+
+    def __call__(self, source, dest):
+        # 이전 압축은 _CompressingFileHandler.doRollover가 백업 파일 이름을 밀기 전에 기다렸으므로 끝나 있음
+        plain_dest = dest[:-len('.gz')] if dest.endswith('.gz') else dest + '.log'
+        os.replace(source, plain_dest)
+        self._thread = threading.Thread(target=self._compress, args=(plain_dest, dest), daemon=True)
+        self._thread.start()
+
+    def wait(self):
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    @staticmethod
+    def _compress(source, dest):
+        with open(source, 'rb') as f_in, gzip.open(dest + '.tmp', 'wb') as f_out:
+            shutil.copyfileobj(f_in, f_out)
+        os.replace(dest + '.tmp', dest)
+        os.remove(source)
+
+class _CompressingFileHandler(RotatingFileHandler):
+    """백업 로그 파일을 _CompressingRotator로 압축하는 RotatingFileHandler
+
+    압축 중인 백업은 아직 .gz 이름이 없어 다음 교체 때 뒤로 밀리지 않고 새 백업에 덮어써지므로,
+    백업 파일 이름을 밀기 전에 진행 중인 압축이 끝나기를 기다립니다.
+    """
+
+    def __init__(self, *args, compressor, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._compressor = compressor
+        self.namer = compressor.namer
+        self.rotator = compressor
+
+    def doRollover(self):
+        self._compressor.wait()
+        super().doRollover()
+
 class Log:
     _instance: Optional['Log'] = None
     _lock = threading.Lock()
@@ -42,6 +118,16 @@ class Log:
                 self._file_formatter = None
                 self._console_formatter = None
                 self._logger = None
+                self._async_logging = True
+                self._queue_size = 10000
+                self._queue_full_policy = QUEUE_FULL_DROP_DEBUG
+                self._compress_backups = True
+                self._queue_handler = None
+                self._listener = None
+                self._rotator = None
+                self._atexit_registered = False
+                # 기록되는 최소 레벨 (로깅 비활성화 시 어떤 레벨보다 큼)
+                self._min_level = DISABLED_LEVEL
                 
     def setup(self, 
               enable_logging: bool = True,
@@ -49,7 +135,11 @@ class Log:
               max_size_mb: int = 10,
               backup_count: int = 2,
               encoding: str = 'utf-8',
-              log_level: str = 'DEBUG') -> None:
+              log_level: str = 'DEBUG',
+              async_logging: bool = True,
+              queue_size: int = 10000,
+              queue_full_policy: str = QUEUE_FULL_DROP_DEBUG,
+              compress_backups: bool = True) -> None:
         """
         로깅 시스템을 초기화합니다.
         
@@ -60,6 +150,10 @@ class Log:
             backup_count (int): 백업 파일 최대 개수
             encoding (str): 파일 인코딩
             log_level (str): 로그 레벨 (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+            async_logging (bool): 로그를 메모리 큐에 넣고 별도 스레드에서 기록할지 여부
+            queue_size (int): 비동기 로깅 큐 크기
+            queue_full_policy (str): 큐가 가득 찼을 때 처리 방식 ('block', 'drop_debug')
+            compress_backups (bool): 백업 로그 파일을 gzip으로 압축할지 여부
         """
         with self._lock:
             self._enable_logging = enable_logging
@@ -68,8 +162,13 @@ class Log:
             self._backup_count = backup_count
             self._encoding = encoding
             self._log_level = self._convert_log_level(log_level)
+            self._async_logging = async_logging
+            self._queue_size = queue_size
+            self._queue_full_policy = queue_full_policy
+            self._compress_backups = compress_backups
 
             if False == enable_logging:
+                self._min_level = DISABLED_LEVEL
                 return
             
             # 로거 초기화
@@ -85,6 +184,12 @@ class Log:
             # 콘솔 핸들러 설정
             self._open_console_handler()
             self._set_console_formatter()
+            
+            # 비동기 로깅: 핸들러를 기록 스레드로 옮기고 로거에는 큐 핸들러만 연결
+            if self._async_logging:
+                self._start_listener()
+            
+            self._min_level = self._log_level
 
     def _convert_log_level(self, log_level: str) -> int:
         """
@@ -109,12 +214,58 @@ class Log:
         self._logger = logging.getLogger('default_logger')
         self._logger.setLevel(self._log_level)
 
+    def _start_listener(self) -> None:
+        """
+        로그 레코드를 큐에서 꺼내 파일/콘솔에 기록하는 스레드를 시작합니다.
+        """
+        log_queue = queue.Queue(maxsize=max(0, self._queue_size))
+        self._logger.removeHandler(self._file_handler)
+        self._logger.removeHandler(self._console_handler)
+        self._queue_handler = _BoundedQueueHandler(log_queue, self._queue_full_policy)
+        self._logger.addHandler(self._queue_handler)
+        self._listener = QueueListener(log_queue, self._file_handler, self._console_handler, respect_handler_level=True)
+        self._listener.start()
+        if not self._atexit_registered:
+            # 종료 시 큐에 남은 로그를 모두 기록
+            atexit.register(self.close)
+            self._atexit_registered = True
+
+    def _stop_listener(self) -> None:
+        """
+        기록 스레드를 멈춥니다. 큐에 남은 로그는 모두 기록한 뒤 반환합니다.
+        """
+        if self._queue_handler and self._queue_handler.dropped_count:
+            self._logger.warning(f"로그 큐가 가득 차서 DEBUG 로그 {self._queue_handler.dropped_count}개를 버렸습니다.")
+        if self._listener:
+            self._listener.stop()
+            self._listener = None
+        if self._queue_handler:
+            self._logger.removeHandler(self._queue_handler)
+            self._queue_handler = None
+
+    def close(self) -> None:
+        """
+        남은 로그를 모두 기록하고 핸들러를 닫습니다.
+        """
+        with self._lock:
+            self._min_level = DISABLED_LEVEL
+            self._remove_existing_handlers()
+
     def _remove_existing_handlers(self) -> None:
         """
         기존에 등록된 모든 핸들러를 제거하고 닫습니다.
         이는 로깅 설정을 재설정하기 전에 호출되어야 합니다.
         """
-        if hasattr(self, '_logger'):
+        if self._logger:
+            self._stop_listener()
+            if self._file_handler:
+                self._file_handler.close()
+            if self._console_handler:
+                self._console_handler.close()
+        if self._rotator:
+            self._rotator.wait()
+            self._rotator = None
+        if self._logger:
             for handler in self._logger.handlers[:]:
                 self._logger.removeHandler(handler)
                 handler.close()
@@ -123,12 +274,17 @@ class Log:
         """
         파일 핸들러를 생성하고 로거에 추가합니다.
         """
-        self._file_handler = RotatingFileHandler(
+        options = dict(
             filename=self._log_file,
             maxBytes=self._max_size_mb * 1024 * 1024    ,
             backupCount=self._backup_count,
             encoding=self._encoding
         )
+        if self._compress_backups:
+            self._rotator = _CompressingRotator()
+            self._file_handler = _CompressingFileHandler(compressor=self._rotator, **options)
+        else:
+            self._file_handler = RotatingFileHandler(**options)
         self._file_handler.setLevel(self._log_level)
         self._logger.addHandler(self._file_handler)
 
@@ -139,7 +295,7 @@ class Log:
         """
         if hasattr(self, '_file_handler'):
             self._file_formatter = MicrosecondFormatter(
-                '[%(asctime)s][%(levelname)s]%(message)s',
+                '[%(asctime)s][%(levelname)s][%(filename)s:%(lineno)d] %(message)s',
                 datefmt='%Y-%m-%d %H:%M:%S.%f'
             )
             self._file_handler.setFormatter(self._file_formatter)
@@ -159,7 +315,7 @@ class Log:
         """
         if hasattr(self, '_console_handler'):
             self._console_formatter = MicrosecondFormatter(
-                '[%(asctime)s][%(levelname)s]%(message)s',
+                '[%(asctime)s][%(levelname)s][%(filename)s:%(lineno)d] %(message)s',
                 datefmt='%Y-%m-%d %H:%M:%S.%f'
             )
             self._console_handler.setFormatter(self._console_formatter)
@@ -184,64 +340,42 @@ class Log:
             del self._console_handler
             self._console_handler = None
 
-    def _get_caller_info(self) -> str:
-        """
-        로그를 호출한 파일과 라인 번호를 반환합니다.
-        """
-        frame = inspect.currentframe()
-        try:
-            # 호출 스택을 거슬러 올라가서 로그를 호출한 위치를 찾습니다
-            while frame:
-                frame = frame.f_back
-                if frame and frame.f_code.co_filename != __file__:
-                    # 파일 경로에서 파일명만 추출
-                    filename = os.path.basename(frame.f_code.co_filename)
-                    return f"{filename}:{frame.f_lineno}"
-        finally:
-            del frame
-        return "unknown:0"
-
-    def debug(self, msg: str) -> None:
+    def is_enabled_for(self, level: int) -> bool:
+        """해당 레벨의 로그가 기록되는지 반환합니다. (메시지를 만드는 비용이 큰 경우 미리 확인용)"""
+        return level >= self._min_level
+
+    # 로그 함수는 기록되지 않는 레벨이면 락이나 포매팅 없이 바로 반환합니다.
+    # 메시지는 logging과 같이 %-스타일 인자를 받아 실제로 기록될 때만 포매팅하며,
+    # 호출 위치(파일:라인)는 stacklevel로 logging 모듈이 직접 찾습니다.
+    def debug(self, msg: str, *args) -> None:
         """디버그 메시지를 로깅합니다."""
-        with self._lock:
-            if self._logger and self._enable_logging:
-                caller_info = self._get_caller_info()
-                self._logger.debug(f"[{caller_info}] {msg}")
+        if logging.DEBUG >= self._min_level:
+            self._logger.debug(msg, *args, stacklevel=2)
 
-    def info(self, msg: str) -> None:
+    def info(self, msg: str, *args) -> None:
         """정보 메시지를 로깅합니다."""
-        with self._lock:
-            if self._logger and self._enable_logging:
-                caller_info = self._get_caller_info()
-                self._logger.info(f"[{caller_info}] {msg}")
+        if logging.INFO >= self._min_level:
+            self._logger.info(msg, *args, stacklevel=2)
 
-    def warning(self, msg: str) -> None:
+    def warning(self, msg: str, *args) -> None:
         """경고 메시지를 로깅합니다."""
-        with self._lock:
-            if self._logger and self._enable_logging:
-                caller_info = self._get_caller_info()
-                self._logger.warning(f"[{caller_info}] {msg}")
+        if logging.WARNING >= self._min_level:
+            self._logger.warning(msg, *args, stacklevel=2)
 
-    def error(self, msg: str) -> None:
+    def error(self, msg: str, *args) -> None:
         """오류 메시지를 로깅합니다."""
-        with self._lock:
-            if self._logger and self._enable_logging:
-                caller_info = self._get_caller_info()
-                self._logger.error(f"[{caller_info}] {msg}")
+        if logging.ERROR >= self._min_level:
+            self._logger.error(msg, *args, stacklevel=2)
 
-    def critical(self, msg: str) -> None:
+    def critical(self, msg: str, *args) -> None:
         """심각한 오류 메시지를 로깅합니다."""
-        with self._lock:
-            if self._logger and self._enable_logging:
-                caller_info = self._get_caller_info()
-                self._logger.critical(f"[{caller_info}] {msg}")
+        if logging.CRITICAL >= self._min_level:
+            self._logger.critical(msg, *args, stacklevel=2)
 
-    def exception(self, msg: str) -> None:
+    def exception(self, msg: str, *args) -> None:
         """예외 정보를 로깅합니다."""
-        with self._lock:
-            if self._logger and self._enable_logging:
-                caller_info = self._get_caller_info()
-                self._logger.exception(f"[{caller_info}] {msg}")
+        if logging.ERROR >= self._min_level:
+            self._logger.exception(msg, *args, stacklevel=2)
                 
 # 싱글톤 인스턴스 생성
 log = Log()
\ No newline at end of file
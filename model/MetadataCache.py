@@ -0,0 +1,195 @@
+import json
+import re
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+# 캐시에 보관할 비디오 정보 키
+_RECORD_KEYS = ('id', 'title', 'duration', 'uploader', 'thumbnail', 'webpage_url', 'extractor', 'extractor_key')
+# 캐시에 보관할 포맷 정보 키
+_FORMAT_KEYS = (
+    'format_id', 'format_note', 'url', 'ext', 'protocol', 'container',
+    'acodec', 'vcodec', 'abr', 'asr', 'tbr', 'audio_channels',
+    'filesize', 'filesize_approx', 'quality', 'source_preference', 'language_preference',
+    'http_headers', 'downloader_options'
+)
+
+# 포맷 URL의 만료 시각 (예: "...&expire=1700000000&..." 또는 ".../expire/1700000000/...")
+_EXPIRE_PATTERN = re.compile(r'[?&/]expire[=/](\d+)')
+# 다운로드가 끝나기 전에 URL이 만료되지 않도록 만료 시각보다 이만큼 먼저 항목을 버림 (초)
+URL_EXPIRY_MARGIN = 600
+
+class MetadataCache:
+    """비디오 ID를 키로 yt-dlp 추출 결과를 요약 저장하는 SQLite 캐시
+
+    제목, 길이, 업로더, 썸네일 URL과 오디오 포맷 목록만 저장하며,
+    저장된 지 TTL이 지났거나 포맷 URL의 만료 시각(expire)이 가까운 항목은 무시하고 항목 수가 최대치를 넘으면
+    가장 오래 사용되지 않은 항목부터 삭제합니다 (LRU).
+    """
+
+    _instance: Optional['MetadataCache'] = None
+    _lock = threading.Lock()
+
+    def __new__(cls) -> 'MetadataCache':
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super(MetadataCache, cls).__new__(cls)
+                cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        with self._lock:
+            if not self._initialized:
+                self._initialized = True
+                self._enabled = False
+                self._ttl_seconds = 3600
+                self._max_entries = 5000
+                self._connection = None
+
+    def setup(self,
+              enable_cache: bool = True,
+              cache_file: str = 'metadata_cache.db',
+              ttl_seconds: int = 3600,
+              max_entries: int = 5000) -> None:
+        """
+        메타데이터 캐시를 초기화합니다.
+
+        Args:
+            enable_cache (bool): 캐시 사용 여부
+            cache_file (str): SQLite 캐시 파일 경로
+            ttl_seconds (int): 항목 유효 시간 (초). 포맷 URL의 만료 시각이 더 이르면 그 시각까지
+            max_entries (int): 최대 항목 수
+        """
+        with self._lock:
+            if self._connection:
+                self._connection.close()
+                self._connection = None
+            self._enabled = enable_cache
+            self._ttl_seconds = ttl_seconds
+            self._max_entries = max_entries
+
+            if False == enable_cache:
+                return
+
+            self._connection = sqlite3.connect(cache_file, check_same_thread=False, isolation_level=None)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            columns = [row[1] for row in self._connection.execute("PRAGMA table_info(metadata)")]
+            if columns and 'expires_at' not in columns:
+                # 만료 시각이 없던 이전 캐시는 URL이 언제 만료되는지 알 수 없으므로 다시 만듦
+                self._connection.execute("DROP TABLE metadata")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS metadata ("
+                "video_id TEXT PRIMARY KEY, "
+                "record TEXT NOT NULL, "
+                "created_at REAL NOT NULL, "
+                "expires_at REAL NOT NULL, "
+                "last_access REAL NOT NULL)"
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS metadata_last_access ON metadata (last_access)")
+
+    def get(self, video_id: str) -> Optional[dict]:
+        """
+        캐시된 비디오 정보를 반환합니다.
+
+        Args:
+            video_id (str): YouTube 비디오 ID
+
+        Returns:
+            dict: 요약된 비디오 정보 (없거나 만료되었으면 None)
+        """
+        if not self._enabled or not video_id:
+            return None
+        now = time.time()
+        with self._lock:
+            if not self._connection:
+                return None
+            row = self._connection.execute(
+                "SELECT record, expires_at FROM metadata WHERE video_id = ?", (video_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            if now >= row[1]:
+                self._connection.execute("DELETE FROM metadata WHERE video_id = ?", (video_id,))
+                return None
+            self._connection.execute("UPDATE metadata SET last_access = ? WHERE video_id = ?", (now, video_id))
+        return json.loads(row[0])
+
+    def put(self, video_id: str, info: dict) -> None:
+        """
+        yt-dlp 추출 결과를 요약하여 저장합니다.
+
+        Args:
+            video_id (str): YouTube 비디오 ID
+            info (dict): yt-dlp 추출 결과
+        """
+        if not self._enabled or not video_id or not info:
+            return
+        compact = self._compact(info)
+        record = json.dumps(compact, ensure_ascii=False)
+        now = time.time()
+        expires_at = now + self._ttl_seconds
+        url_expires_at = self._url_expires_at(compact)
+        if url_expires_at is not None:
+            expires_at = min(expires_at, url_expires_at - URL_EXPIRY_MARGIN)
+        with self._lock:
+            if not self._connection:
+                return
+            self._connection.execute(
+                "INSERT OR REPLACE INTO metadata (video_id, record, created_at, expires_at, last_access) VALUES (?, ?, ?, ?, ?)",
+                (video_id, record, now, expires_at, now)
+            )
+            self._evict()
+
+    def invalidate(self, video_id: str) -> None:
+        """항목을 삭제합니다 (예: 캐시된 포맷 URL이 만료된 경우)."""
+        if not self._enabled or not video_id:
+            return
+        with self._lock:
+            if self._connection:
+                self._connection.execute("DELETE FROM metadata WHERE video_id = ?", (video_id,))
+
+    def _evict(self) -> None:
+        """최대 항목 수를 넘는 만큼 가장 오래 사용되지 않은 항목을 삭제합니다."""
+        count = self._connection.execute("SELECT COUNT(*) FROM metadata").fetchone()[0]
+        if count > self._max_entries:
+            self._connection.execute(
+                "DELETE FROM metadata WHERE video_id IN "
+                "(SELECT video_id FROM metadata ORDER BY last_access ASC LIMIT ?)",
+                (count - self._max_entries,)
+            )
+
+    @staticmethod
+    def _url_expires_at(record: dict) -> Optional[float]:
+        """저장할 포맷 URL 중 가장 먼저 만료되는 시각 (URL에 만료 시각이 없으면 None)"""
+        expires = []
+        for fmt in record.get('formats') or []:
+            match = _EXPIRE_PATTERN.search(fmt.get('url') or '')
+            if match:
+                expires.append(int(match.group(1)))
+        return min(expires) if expires else None
+
+    def _compact(self, info: dict) -> dict:
+        """
+        추출 결과에서 필요한 값만 남깁니다.
+        포맷은 단일 HTTP로 받을 수 있는 오디오 전용 포맷만 저장합니다.
+        """
+        record = {key: info[key] for key in _RECORD_KEYS if info.get(key) is not None}
+        formats = []
+        for fmt in info.get('formats') or []:
+            if fmt.get('vcodec') != 'none' or fmt.get('acodec') in (None, 'none'):
+                continue
+            # 포맷 선택 전(process=False) 결과에는 protocol이 없을 수 있으므로 URL에서 판단
+            protocol = fmt.get('protocol') or (fmt.get('url') or '').partition(':')[0]
+            if protocol not in ('http', 'https') or fmt.get('fragments'):
+                continue
+            compact = {key: fmt[key] for key in _FORMAT_KEYS if fmt.get(key) is not None}
+            compact['protocol'] = protocol
+            formats.append(compact)
+        if formats:
+            record['formats'] = formats
+        return record
+
+# 싱글톤 인스턴스 생성
+metadata_cache_instance = MetadataCache()
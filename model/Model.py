@@ -2,6 +2,11 @@ import json
 import os
 from model.Configuration import configuration_instance
 from model.Log import log
+from model.PerformanceLog import performance_log_instance
+from model.TraceLog import trace_log_instance
+from model.MetadataCache import metadata_cache_instance
+from model.DownloadArchive import download_archive_instance
+from model.JobJournal import job_journal_instance
 
 class Model:
     _instance = None
@@ -32,7 +37,47 @@ class Model:
             max_size_mb=max_size_mb,
             backup_count=backup_count,
             encoding=encoding,
-            log_level=log_level
+            log_level=log_level,
+            # 이전 버전 설정 파일에는 비동기 로깅 항목이 없을 수 있음
+            async_logging=configuration_instance.get_or_default(True, "logging", "async_logging"),
+            queue_size=configuration_instance.get_or_default(10000, "logging", "queue_size"),
+            queue_full_policy=configuration_instance.get_or_default("drop_debug", "logging", "queue_full_policy"),
+            compress_backups=configuration_instance.get_or_default(True, "logging", "compress_backups")
+        )
+        
+        # 단계별 성능 로그 초기화 (일반 로그와 별도 파일)
+        performance_log_instance.setup(
+            enable_performance_logging=configuration_instance.get_or_default(False, "logging", "enable_performance_logging"),
+            log_file=configuration_instance.get_or_default("performance_log.jsonl", "logging", "performance_log_file"),
+            max_size_mb=max_size_mb,
+            backup_count=backup_count,
+            encoding=encoding
+        )
+        
+        # Chrome Trace Event 형식 타임라인 기록 초기화
+        trace_log_instance.setup(
+            enable_tracing=configuration_instance.get_or_default(False, "logging", "enable_tracing"),
+            trace_file=configuration_instance.get_or_default("trace.json", "logging", "trace_file")
+        )
+        
+        # 메타데이터 캐시 초기화 (이전 버전 설정 파일에는 cache 항목이 없을 수 있음)
+        metadata_cache_instance.setup(
+            enable_cache=configuration_instance.get_or_default(True, "cache", "enable_metadata_cache"),
+            cache_file=configuration_instance.get_or_default("metadata_cache.db", "cache", "metadata_cache_file"),
+            ttl_seconds=configuration_instance.get_or_default(3600, "cache", "metadata_ttl_seconds"),
+            max_entries=configuration_instance.get_or_default(5000, "cache", "metadata_max_entries")
+        )
+        
+        # 다운로드 색인 초기화
+        download_archive_instance.setup(
+            enable_archive=configuration_instance.get_or_default(True, "cache", "enable_download_archive"),
+            archive_file=configuration_instance.get_or_default("download_archive.db", "cache", "download_archive_file")
+        )
+        
+        # 끝나지 않은 작업 저널 초기화
+        job_journal_instance.setup(
+            enable_journal=configuration_instance.get_or_default(True, "engine", "enable_job_journal"),
+            journal_file=configuration_instance.get_or_default("job_journal.db", "engine", "job_journal_file")
         )
 
 # 싱글톤 인스턴스 생성
@@ -0,0 +1,171 @@
+import atexit
+import contextlib
+import datetime
+import json
+import logging
+import queue
+import threading
+import time
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+from typing import Optional
+
+class PerformanceLog:
+    """작업 단계별 성능 기록을 별도 파일에 JSON Lines 형식으로 남기는 클래스
+
+    단계(URL 확인, 정보 추출, 포맷 선택, 다운로드, 인코딩, 이름 변경/정리)마다
+    경과 시간(wall), 호출 스레드의 CPU 시간, 처리한 바이트 수를 한 줄씩 기록합니다.
+    기록은 메모리 큐를 거쳐 별도 스레드에서 파일에 쓰므로 작업 스레드는 파일 I/O를 기다리지 않습니다.
+    """
+
+    _instance: Optional['PerformanceLog'] = None
+    _lock = threading.Lock()
+
+    def __new__(cls) -> 'PerformanceLog':
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super(PerformanceLog, cls).__new__(cls)
+                cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        with self._lock:
+            if not self._initialized:
+                self._initialized = True
+                self._enabled = False
+                self._logger = None
+                self._listener = None
+                self._atexit_registered = False
+                self._context = threading.local()
+
+    def setup(self,
+              enable_performance_logging: bool = True,
+              log_file: str = 'performance_log.jsonl',
+              max_size_mb: int = 10,
+              backup_count: int = 2,
+              encoding: str = 'utf-8') -> None:
+        """
+        성능 로그를 초기화합니다.
+
+        Args:
+            enable_performance_logging (bool): 성능 로그 사용 여부
+            log_file (str): 성능 로그 파일 경로
+            max_size_mb (int): 최대 파일 크기 (MB)
+            backup_count (int): 백업 파일 최대 개수
+            encoding (str): 파일 인코딩
+        """
+        with self._lock:
+            self._enabled = False
+            if self._listener:
+                self._listener.stop()
+                self._listener = None
+            if self._logger:
+                for handler in self._logger.handlers[:]:
+                    self._logger.removeHandler(handler)
+                    handler.close()
+
+            if False == enable_performance_logging:
+                return
+
+            file_handler = RotatingFileHandler(
+                filename=log_file,
+                maxBytes=max_size_mb * 1024 * 1024,
+                backupCount=backup_count,
+                encoding=encoding
+            )
+            file_handler.setFormatter(logging.Formatter('%(message)s'))
+
+            log_queue = queue.Queue()
+            self._logger = logging.getLogger('performance_logger')
+            self._logger.setLevel(logging.INFO)
+            self._logger.propagate = False
+            self._logger.addHandler(QueueHandler(log_queue))
+            self._listener = QueueListener(log_queue, file_handler)
+            self._listener.start()
+            self._enabled = True
+            if not self._atexit_registered:
+                # 종료 시 큐에 남은 기록을 모두 파일에 씀
+                atexit.register(self.close)
+                self._atexit_registered = True
+
+    def close(self) -> None:
+        """남은 기록을 모두 파일에 쓰고 종료합니다."""
+        self.setup(enable_performance_logging=False)
+
+    def is_enabled(self) -> bool:
+        return self._enabled
+
+    @contextlib.contextmanager
+    def job_context(self, job_id):
+        """이 스레드에서 기록되는 단계에 작업 ID를 붙입니다.
+
+        Args:
+            job_id: 작업 ID (JobEngine 작업 번호 또는 GUI의 비디오 ID)
+        """
+        previous = getattr(self._context, 'job_id', None)
+        self._context.job_id = job_id
+        try:
+            yield
+        finally:
+            self._context.job_id = previous
+
+    def current_job_id(self):
+        """이 스레드의 현재 작업 ID를 반환합니다."""
+        return getattr(self._context, 'job_id', None)
+
+    @contextlib.contextmanager
+    def stage(self, name: str, **fields):
+        """with 블록을 한 단계로 측정하여 기록합니다.
+
+        블록 안에서 반환된 dict에 'bytes' 등 값을 넣으면 함께 기록됩니다.
+        블록에서 예외가 발생하면 'ok': false로 기록하고 예외는 그대로 전달합니다.
+        트레이스 기록이 켜져 있으면 같은 구간이 타임라인에도 표시됩니다.
+
+        Args:
+            name (str): 단계 이름 ('url_check', 'metadata', 'format_selection', 'download', 'encode', 'rename')
+            **fields: 함께 기록할 값
+        """
+        # 순환 import 방지 (TraceLog가 작업 컨텍스트를 위해 이 모듈을 사용)
+        from model.TraceLog import trace_log_instance
+        tracing = trace_log_instance.is_enabled()
+        if not self._enabled and not tracing:
+            yield {}
+            return
+
+        record = dict(fields)
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        ok = False
+        if tracing:
+            trace_log_instance.begin(name, 'stage', **fields)
+        try:
+            yield record
+            ok = True
+        finally:
+            if tracing:
+                trace_log_instance.end(name, 'stage', ok=ok)
+            self.record(
+                name,
+                wall_seconds=time.perf_counter() - wall_start,
+                cpu_seconds=time.thread_time() - cpu_start,
+                ok=ok,
+                **record
+            )
+
+    def record(self, name: str, wall_seconds: float, cpu_seconds: float = None, ok: bool = True, **fields) -> None:
+        """측정한 단계 하나를 기록합니다."""
+        if not self._enabled:
+            return
+        entry = {
+            'time': datetime.datetime.now().isoformat(timespec='milliseconds'),
+            'job': getattr(self._context, 'job_id', None),
+            'stage': name,
+            'wall_ms': round(wall_seconds * 1000, 3),
+            'cpu_ms': round(cpu_seconds * 1000, 3) if cpu_seconds is not None else None,
+            'ok': ok,
+            'thread': threading.current_thread().name
+        }
+        entry.update(fields)
+        self._logger.info(json.dumps(entry, ensure_ascii=False, default=str))
+
+# 싱글톤 인스턴스 생성
+performance_log_instance = PerformanceLog()
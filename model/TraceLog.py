@@ -0,0 +1,174 @@
+import atexit
+import contextlib
+import json
+import os
+import queue
+import threading
+import time
+from typing import Optional
+from model.PerformanceLog import performance_log_instance
+
+class TraceLog:
+    """작업 타임라인을 Chrome Trace Event 형식(JSON)으로 기록하는 클래스
+
+    구간의 시작(B)/끝(E) 이벤트를 스레드 ID, 작업 ID와 함께 기록하므로
+    결과 파일을 Perfetto(https://ui.perfetto.dev)나 chrome://tracing에서 열면
+    동시에 실행된 작업들이 스레드별 타임라인으로 표시됩니다.
+    ffmpeg 프로세스는 프로세스 ID를 스레드 ID로 사용하는 별도 트랙에 표시됩니다.
+    """
+
+    _instance: Optional['TraceLog'] = None
+    _lock = threading.Lock()
+
+    def __new__(cls) -> 'TraceLog':
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super(TraceLog, cls).__new__(cls)
+                cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        with self._lock:
+            if not self._initialized:
+                self._initialized = True
+                self._enabled = False
+                self._queue = None
+                self._writer = None
+                self._named_tracks = set()
+                self._track_lock = threading.Lock()  # 이름 이벤트를 트랙마다 한 번만 기록
+                self._pid = os.getpid()
+                self._atexit_registered = False
+
+    def setup(self, enable_tracing: bool = True, trace_file: str = 'trace.json') -> None:
+        """
+        트레이스 기록을 초기화합니다.
+
+        Args:
+            enable_tracing (bool): 트레이스 기록 여부
+            trace_file (str): Chrome Trace Event JSON 파일 경로
+        """
+        with self._lock:
+            self._stop_writer()
+            if False == enable_tracing:
+                return
+
+            self._queue = queue.Queue()
+            self._named_tracks = set()
+            self._writer = threading.Thread(target=self._write_events, args=(trace_file, self._queue), name='trace-writer', daemon=True)
+            self._writer.start()
+            self._enabled = True
+            if not self._atexit_registered:
+                # 종료 시 남은 이벤트를 쓰고 JSON 배열을 닫음
+                atexit.register(self.close)
+                self._atexit_registered = True
+
+    def close(self) -> None:
+        """남은 이벤트를 모두 파일에 쓰고 종료합니다."""
+        with self._lock:
+            self._stop_writer()
+
+    def is_enabled(self) -> bool:
+        return self._enabled
+
+    @contextlib.contextmanager
+    def span(self, name: str, category: str = 'job', **args):
+        """with 블록을 하나의 구간으로 기록합니다.
+
+        Args:
+            name (str): 구간 이름 (예: 'DownloadThread', 'download')
+            category (str): 이벤트 분류 ('gui', 'job', 'stage', 'process')
+            **args: 함께 기록할 값
+        """
+        if not self._enabled:
+            yield
+            return
+        self.begin(name, category, **args)
+        try:
+            yield
+        finally:
+            self.end(name, category)
+
+    def begin(self, name: str, category: str = 'job', track_id: int = None, track_name: str = None, **args) -> None:
+        """구간 시작 이벤트를 기록합니다.
+
+        Args:
+            track_id (int): 이벤트를 표시할 트랙 ID (None이면 현재 스레드, 예: ffmpeg 프로세스 ID)
+            track_name (str): 트랙 이름 (track_id를 지정한 경우 표시 이름)
+        """
+        if self._enabled:
+            # 작업 ID는 성능 로그와 같은 작업 컨텍스트(PerformanceLog.job_context)를 사용
+            args.setdefault('job', performance_log_instance.current_job_id())
+            self._emit('B', name, category, track_id, track_name, args)
+
+    def end(self, name: str, category: str = 'job', track_id: int = None, **args) -> None:
+        """구간 끝 이벤트를 기록합니다."""
+        if self._enabled:
+            self._emit('E', name, category, track_id, None, args)
+
+    def process_started(self, process, name: str = 'ffmpeg', **args) -> None:
+        """외부 프로세스의 시작을 프로세스 전용 트랙에 기록합니다."""
+        if self._enabled:
+            self.begin(name, 'process', track_id=process.pid, track_name=f"{name} (pid {process.pid})", **args)
+
+    def process_finished(self, process, name: str = 'ffmpeg') -> None:
+        """외부 프로세스의 종료를 기록합니다."""
+        if self._enabled:
+            self.end(name, 'process', track_id=process.pid, returncode=process.returncode)
+
+    def _emit(self, phase, name, category, track_id, track_name, args):
+        if track_id is None:
+            track_id = threading.get_native_id()
+            track_name = threading.current_thread().name
+        event = {
+            'name': name,
+            'cat': category,
+            'ph': phase,
+            'ts': time.perf_counter_ns() // 1000,
+            'pid': self._pid,
+            'tid': track_id
+        }
+        if args:
+            event['args'] = args
+
+        events = []
+        with self._track_lock:
+            name_track = bool(track_name) and track_id not in self._named_tracks
+            if name_track:
+                self._named_tracks.add(track_id)
+        if name_track:
+            events.append({'name': 'thread_name', 'ph': 'M', 'pid': self._pid, 'tid': track_id, 'args': {'name': track_name}})
+        events.append(event)
+        trace_queue = self._queue
+        if trace_queue is not None:
+            for item in events:
+                trace_queue.put(item)
+
+    def _stop_writer(self) -> None:
+        self._enabled = False
+        if self._writer:
+            self._queue.put(None)
+            self._writer.join()
+            self._writer = None
+            self._queue = None
+
+    @staticmethod
+    def _write_events(trace_file, trace_queue):
+        """큐의 이벤트를 JSON 배열로 파일에 씁니다.
+
+        비정상 종료로 배열이 닫히지 않아도 Perfetto와 chrome://tracing은 파일을 읽을 수 있습니다.
+        """
+        with open(trace_file, 'w', encoding='utf-8') as f:
+            f.write('[\n')
+            first = True
+            while True:
+                event = trace_queue.get()
+                if event is None:
+                    break
+                f.write(('' if first else ',\n') + json.dumps(event, ensure_ascii=False, default=str))
+                first = False
+                if trace_queue.empty():
+                    f.flush()
+            f.write('\n]\n')
+
+# 싱글톤 인스턴스 생성
+trace_log_instance = TraceLog()
@@ -0,0 +1,89 @@
+import contextlib
+import os
+
+import pytest
+
+yt_dlp = pytest.importorskip('yt_dlp')
+
+from controller.logic.DownloadYoutubeAudio import download_youtube_audio_instance
+from controller.logic.YoutubeDLPool import youtube_dl_pool_instance
+from model.MetadataCache import metadata_cache_instance
+
+URL = 'https://www.youtube.com/watch?v=abcdefghijk'
+VIDEO_ID = 'abcdefghijk'
+
+
+def _info(url):
+    return {
+        'id': VIDEO_ID,
+        'title': 'title',
+        'formats': [{'format_id': '140', 'url': url, 'ext': 'm4a', 'protocol': 'https', 'acodec': 'mp4a.40.2', 'vcodec': 'none'}]
+    }
+
+
+class FakeYdl:
+    """포맷 URL이 만료된 정보로 다운로드하면 yt-dlp처럼 DownloadError를 발생시키는 YoutubeDL 흉내"""
+
+    def __init__(self, save_path):
+        self.save_path = save_path
+        self.extracted = 0
+        self.downloaded = []
+
+    def extract_info(self, url, download, process):
+        self.extracted += 1
+        return _info('https://media/fresh.m4a')
+
+    def process_ie_result(self, info, download):
+        # 다운로드는 포맷 선택 결과(선택된 포맷이 펼쳐진 info)로 다시 호출됨
+        selected = dict(info['formats'][0], id=info['id'], title=info['title']) if 'formats' in info else info
+        if not download:
+            return selected
+        self.downloaded.append(selected['url'])
+        if selected['url'] != 'https://media/fresh.m4a':
+            raise yt_dlp.utils.DownloadError('ERROR: unable to download video data: HTTP Error 403: Forbidden')
+        path = os.path.join(self.save_path, f"partial_{VIDEO_ID}_140.m4a")
+        open(path, 'wb').close()
+        return dict(selected, requested_downloads=[{'filepath': path}])
+
+
+@pytest.fixture
+def ydl(tmp_path, monkeypatch):
+    ydl = FakeYdl(str(tmp_path))
+    cache = {}
+    monkeypatch.setattr(youtube_dl_pool_instance, 'acquire', lambda **options: contextlib.nullcontext(ydl))
+    monkeypatch.setattr(download_youtube_audio_instance, '_parallel_settings', lambda: {
+        'parallel_download': False, 'connections_per_job': 4, 'max_connections': 16, 'chunk_size': 4 * 1024 * 1024
+    })
+    monkeypatch.setattr(metadata_cache_instance, 'get', cache.get)
+    monkeypatch.setattr(metadata_cache_instance, 'put', cache.__setitem__)
+    monkeypatch.setattr(metadata_cache_instance, 'invalidate', lambda video_id: cache.pop(video_id, None))
+    ydl.cache = cache
+    return ydl
+
+
+def test_expired_url_is_extracted_again(ydl, tmp_path):
+    # 미리 추출된 정보의 포맷 URL은 포맷 선택은 되지만 다운로드 시 만료됨
+    downloaded_file, title, _ = download_youtube_audio_instance.download_audio(
+        URL, '128K', str(tmp_path), info=_info('https://media/expired.m4a')
+    )
+    assert ydl.downloaded == ['https://media/expired.m4a', 'https://media/fresh.m4a']
+    assert ydl.extracted == 1
+    assert os.path.exists(downloaded_file) and title == 'title'
+
+
+def test_expired_cached_url_is_extracted_again(ydl, tmp_path):
+    ydl.cache[VIDEO_ID] = _info('https://media/expired.m4a')
+    download_youtube_audio_instance.download_audio(URL, '128K', str(tmp_path))
+    assert ydl.downloaded == ['https://media/expired.m4a', 'https://media/fresh.m4a']
+    # 만료된 항목은 지우고 새로 추출한 정보로 바꿈
+    assert ydl.cache[VIDEO_ID]['formats'][0]['url'] == 'https://media/fresh.m4a'
+
+
+def test_other_errors_are_not_retried(ydl, tmp_path, monkeypatch):
+    def fail(*args):
+        raise OSError('disk full')
+
+    monkeypatch.setattr(download_youtube_audio_instance, '_download_single', fail)
+    with pytest.raises(OSError):
+        download_youtube_audio_instance.download_audio(URL, '128K', str(tmp_path), info=_info('https://media/fresh.m4a'))
+    assert ydl.extracted == 0
@@ -0,0 +1,197 @@
+"""인코더 백엔드 공통 확인 항목
+
+모든 인코더 백엔드(EncoderBackend)가 같은 출력 설정에 대해 같은 결과를 내는지 확인합니다.
+ffmpeg으로 생성한 오디오 파일을 백엔드별로 프리셋/스트림 복사/리샘플링 설정으로 인코딩한 뒤
+출력 파일을 ffmpeg으로 다시 디코딩하여 확인하며, ffmpeg이 없으면 건너뜁니다.
+"""
+import array
+import math
+import os
+import re
+import shutil
+import subprocess
+
+import pytest
+
+from benchmark.media_server import Fixture, generate_fixtures
+from controller.logic.ConverterToMP3 import converter_to_mp3_instance
+from controller.logic.SegmentedEncoder import segmented_encoder_instance
+
+pytestmark = pytest.mark.skipif(shutil.which('ffmpeg') is None, reason='ffmpeg 실행 파일이 없음')
+
+# `ffmpeg -i` 출력의 오디오 스트림 줄 (예: "Audio: mp3 (mp3float), 44100 Hz, stereo, fltp, 128 kb/s")
+_AUDIO_PATTERN = re.compile(r'Audio: (\w+).*?, (\d+) Hz, (mono|stereo)(?:.*?, (\d+) kb/s)?')
+# 길이 허용 오차 (초)
+DURATION_TOLERANCE = 0.05
+# 구간 인코딩 확인에 사용하는 구간 수와, 한 번에 인코딩한 결과와 비교할 때 1초 단위 구간의 최소 SNR (dB)
+# 구간 경계에서 프레임이 하나라도 빠지거나 겹치면 그 뒤 파형이 어긋나 SNR이 0dB 근처로 떨어짐
+# (비트 저장소를 끈 구간 인코딩은 정상이어도 잡음이 섞인 첫 몇 초가 15dB 안팎까지 내려감)
+SEGMENT_COUNT = 2
+SEGMENT_MIN_SNR_DB = 10
+# 오디오 길이 (초), 구간 인코딩은 구간 하나가 60초 이상이어야 함
+DURATION = 20
+SEGMENT_DURATION = 150
+
+# (이름, 출력 프로필, 프리셋, 품질, 설정 변경)
+CASES = [
+    ('cbr', 'mp3', 'cbr', '128K', {}),
+    ('abr', 'mp3', 'abr', '128K', {}),
+    ('vbr_standard', 'mp3', 'vbr_standard', '128K', {}),
+    ('fast', 'mp3', 'fast', '96K', {}),
+    ('mono', 'mp3', 'mono', '64K', {}),
+    ('resample_32k', 'mp3', 'cbr', '96K', {'sample_rate': 32000}),
+    ('copy', 'original', None, '128K', {})
+]
+
+
+def _audio_info(path):
+    """출력 파일의 코덱, 샘플레이트, 채널 수, 비트레이트와 디코딩한 길이(초)"""
+    result = subprocess.run(
+        [converter_to_mp3_instance.get_ffmpeg_path(), '-hide_banner', '-i', path, '-f', 's16le', '-ac', '1', '-'],
+        stdin=subprocess.DEVNULL, capture_output=True
+    )
+    stderr = result.stderr.decode('utf-8', 'replace')
+    match = _AUDIO_PATTERN.search(stderr)
+    assert result.returncode == 0 and match, f"출력 파일을 디코딩할 수 없음: {stderr[-500:]}"
+    codec, rate, layout, bitrate = match.groups()
+    return {
+        'codec': codec,
+        'sample_rate': int(rate),
+        'channels': 1 if layout == 'mono' else 2,
+        'bitrate_kbps': int(bitrate) if bitrate else None,
+        'duration': len(result.stdout) / 2 / int(rate)
+    }
+
+
+def _decode_pcm(path):
+    """출력 파일을 모노 16비트 PCM으로 디코딩합니다 (인코더 지연/패딩은 디코더가 제거)."""
+    result = subprocess.run(
+        [converter_to_mp3_instance.get_ffmpeg_path(), '-v', 'error', '-i', path, '-f', 's16le', '-ac', '1', '-'],
+        stdin=subprocess.DEVNULL, capture_output=True, check=True
+    )
+    samples = array.array('h')
+    samples.frombytes(result.stdout)
+    return samples
+
+
+def _window_snr(reference, samples, sample_rate):
+    """1초 단위 구간마다 reference 대비 samples의 SNR (dB) 목록
+
+    끝에 남는 1초보다 짧은 구간은 샘플 수가 적어 잡음 성분만으로 SNR이 크게 흔들리므로 제외합니다.
+    """
+    snr = []
+    for start in range(0, len(reference) - sample_rate + 1, sample_rate):
+        signal = noise = 0
+        for a, b in zip(reference[start:start + sample_rate], samples[start:start + sample_rate]):
+            signal += a * a
+            noise += (a - b) * (a - b)
+        snr.append(float('inf') if noise == 0 else 10 * math.log10(max(signal, 1) / noise))
+    return snr
+
+
+@pytest.fixture(scope='module')
+def media(tmp_path_factory):
+    """확인에 사용할 오디오 파일 (짧은 파일, 구간 인코딩용 긴 파일)과 원본 정보"""
+    fixtures = generate_fixtures(
+        [Fixture('conformance', DURATION, 128), Fixture('conformance', SEGMENT_DURATION, 128)],
+        str(tmp_path_factory.mktemp('fixtures')), converter_to_mp3_instance.get_ffmpeg_path()
+    )
+    media = {}
+    for fixture in fixtures:
+        source = _audio_info(fixture.path)
+        media[fixture.duration] = (fixture, {
+            'acodec': 'mp4a.40.2', 'abr': fixture.bitrate_kbps, 'asr': source['sample_rate'],
+            'codec': source['codec'], 'channels': source['channels'], 'duration': source['duration']
+        })
+    return media
+
+
+@pytest.fixture
+def config():
+    """segmented_encode 설정을 테스트마다 새로 지정하고 끝나면 config.json 값으로 되돌립니다 (기본: 나누지 않음)."""
+    saved = segmented_encoder_instance._settings
+    segmented_encoder_instance._settings = {
+        'enabled': False,
+        'min_duration_seconds': 0,
+        'segments': SEGMENT_COUNT,
+        'preroll_frames': 4
+    }
+    yield segmented_encoder_instance._settings
+    segmented_encoder_instance._settings = saved
+
+
+@pytest.fixture(params=['ffmpeg', 'pyav', 'segmented'])
+def backend(request, config, media):
+    """확인할 백엔드와 입력 오디오 (segmented는 긴 오디오를 구간으로 나누어 인코딩하는 ffmpeg 백엔드)"""
+    if request.param == 'pyav':
+        pytest.importorskip('av')
+    if request.param == 'segmented':
+        config['enabled'] = True
+        fixture, source_info = media[SEGMENT_DURATION]
+        return converter_to_mp3_instance.get_backend('ffmpeg'), fixture, source_info, request.param
+    fixture, source_info = media[DURATION]
+    return converter_to_mp3_instance.get_backend(request.param), fixture, source_info, request.param
+
+
+@pytest.mark.parametrize('case', CASES, ids=[case[0] for case in CASES])
+def test_encode(backend, case, tmp_path):
+    backend, fixture, source_info, kind = backend
+    _, profile, preset, quality, overrides = case
+    settings = converter_to_mp3_instance.plan_output(profile, quality, source_info, preset)
+    settings.update(overrides)
+    output_file = str(tmp_path / f"output.{settings['extension']}")
+    progress = []
+
+    stats = backend.encode(fixture.path, output_file, settings, fixture.duration, progress.append)
+
+    expected_segments = SEGMENT_COUNT if kind == 'segmented' and settings['encoder'] == 'libmp3lame' else 1
+    assert isinstance(stats, dict) and 'cpu_seconds' in stats
+    assert stats['segments'] == expected_segments
+    assert progress and progress[-1] == 100
+    assert all(b >= a for a, b in zip(progress, progress[1:])), "진행률이 줄어듦"
+
+    if settings['encoder'] != 'copy':
+        # CBR은 Info, ABR/VBR은 Xing 태그 (프레임 수와 인코더 지연/패딩 기록)
+        expected_tag = b'Info' if settings['mode'] == 'cbr' else b'Xing'
+        with open(output_file, 'rb') as f:
+            assert expected_tag in f.read(8192)
+
+    info = _audio_info(output_file)
+    assert info['codec'] == ('mp3' if settings['encoder'] != 'copy' else source_info['codec'])
+    assert info['sample_rate'] == (settings['sample_rate'] or source_info['asr'])
+    assert info['channels'] == (settings['channels'] or source_info['channels'])
+    if settings['mode'] == 'cbr':
+        assert info['bitrate_kbps'] == settings['bitrate_kbps']
+    # 인코더 지연/패딩이 태그에 기록되어 앞뒤 무음이 없어야 함
+    assert info['duration'] == pytest.approx(source_info['duration'], abs=DURATION_TOLERANCE)
+
+
+def test_missing_input(backend, tmp_path):
+    """입력 파일이 없으면 예외가 발생하고 출력 파일이 남지 않아야 합니다."""
+    backend, fixture, source_info, _ = backend
+    settings = converter_to_mp3_instance.plan_output('mp3', '128K', source_info, 'cbr')
+    output_file = str(tmp_path / 'missing.mp3')
+    with pytest.raises(Exception):
+        backend.encode(str(tmp_path / 'missing.m4a'), output_file, settings, fixture.duration)
+    assert not os.path.exists(output_file)
+
+
+def test_segmented_matches_single(config, media, tmp_path):
+    """구간 인코딩 결과가 같은 설정으로 한 번에 인코딩한 결과와 길이와 파형이 같아야 합니다."""
+    fixture, source_info = media[SEGMENT_DURATION]
+    backend = converter_to_mp3_instance.get_backend('ffmpeg')
+    settings = converter_to_mp3_instance.plan_output('mp3', '128K', source_info, 'cbr')
+    decoded = {}
+    for name, enabled in (('single', False), ('segmented', True)):
+        config['enabled'] = enabled
+        output_file = str(tmp_path / f"{name}.mp3")
+        stats = backend.encode(fixture.path, output_file, settings, fixture.duration)
+        assert stats['segments'] == (SEGMENT_COUNT if enabled else 1)
+        decoded[name] = _decode_pcm(output_file)
+
+    single, segmented = decoded['single'], decoded['segmented']
+    assert len(segmented) == len(single)
+    assert len(segmented) / source_info['asr'] == pytest.approx(source_info['duration'], abs=DURATION_TOLERANCE)
+    snr = _window_snr(single, segmented, source_info['asr'])
+    worst = min(range(len(snr)), key=snr.__getitem__)
+    assert snr[worst] >= SEGMENT_MIN_SNR_DB, f"{worst}초 부근 파형 불일치 (SNR {snr[worst]:.1f}dB)"
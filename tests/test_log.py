@@ -0,0 +1,39 @@
+import gzip
+import logging
+import os
+import time
+
+from model.Log import _CompressingFileHandler, _CompressingRotator
+
+
+def _record(message):
+    return logging.LogRecord('test', logging.INFO, __file__, 0, message, None, None)
+
+
+def test_rollover_waits_for_slow_compression(tmp_path, monkeypatch):
+    compress = _CompressingRotator._compress
+
+    def slow_compress(source, dest):
+        time.sleep(0.2)
+        compress(source, dest)
+
+    monkeypatch.setattr(_CompressingRotator, '_compress', staticmethod(slow_compress))
+    log_file = str(tmp_path / 'log.txt')
+    rotator = _CompressingRotator()
+    handler = _CompressingFileHandler(log_file, maxBytes=64, backupCount=2, encoding='utf-8', compressor=rotator)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    try:
+        # 레코드마다 maxBytes를 넘기므로 두 번째 레코드부터 교체되며, 두 번째 교체는 첫 압축이 끝나기 전에 일어남
+        for index in range(3):
+            handler.emit(_record(f"{index}" * 80))
+    finally:
+        handler.close()
+        rotator.wait()
+
+    backups = sorted(name for name in os.listdir(str(tmp_path)) if name != 'log.txt')
+    assert backups == ['log.txt.1.gz', 'log.txt.2.gz']
+    contents = []
+    for name in backups:
+        with gzip.open(str(tmp_path / name), 'rt', encoding='utf-8') as f:
+            contents.append(f.read())
+    assert contents == ['1' * 80 + '\n', '0' * 80 + '\n']
@@ -0,0 +1,62 @@
+import sqlite3
+import time
+
+import pytest
+
+from model.MetadataCache import URL_EXPIRY_MARGIN, MetadataCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """임시 파일을 쓰는 캐시 (싱글톤이므로 끝나면 닫음)"""
+    cache = MetadataCache()
+    cache.setup(enable_cache=True, cache_file=str(tmp_path / 'metadata_cache.db'), ttl_seconds=3600)
+    yield cache
+    cache.setup(enable_cache=False)
+
+
+def _info(url):
+    return {
+        'id': 'video',
+        'title': 'title',
+        'formats': [{'format_id': '140', 'url': url, 'ext': 'm4a', 'acodec': 'mp4a.40.2', 'vcodec': 'none'}]
+    }
+
+
+def test_entry_without_expire_uses_ttl(cache):
+    cache.put('video', _info('https://media/audio.m4a'))
+    assert cache.get('video')['formats'][0]['url'] == 'https://media/audio.m4a'
+
+
+def test_entry_is_dropped_before_url_expires(cache):
+    # TTL(1시간)보다 먼저 만료되는 URL은 만료 시각에서 여유 시간을 뺀 시각까지만 사용
+    expire = int(time.time()) + URL_EXPIRY_MARGIN - 1
+    cache.put('video', _info(f'https://media/videoplayback?expire={expire}&itag=140'))
+    assert cache.get('video') is None
+
+
+def test_entry_is_kept_until_url_expires(cache, monkeypatch):
+    now = time.time()
+    expire = int(now) + URL_EXPIRY_MARGIN + 60
+    cache.put('video', _info(f'https://media/videoplayback/expire/{expire}/itag/140'))
+    assert cache.get('video') is not None
+    monkeypatch.setattr(time, 'time', lambda: now + 61)
+    assert cache.get('video') is None
+
+
+def test_old_cache_without_expiry_is_rebuilt(tmp_path):
+    cache_file = str(tmp_path / 'metadata_cache.db')
+    connection = sqlite3.connect(cache_file)
+    connection.execute("CREATE TABLE metadata (video_id TEXT PRIMARY KEY, record TEXT NOT NULL, created_at REAL NOT NULL, last_access REAL NOT NULL)")
+    connection.execute("INSERT INTO metadata VALUES ('video', '{}', ?, ?)", (time.time(), time.time()))
+    connection.commit()
+    connection.close()
+
+    cache = MetadataCache()
+    cache.setup(enable_cache=True, cache_file=cache_file, ttl_seconds=3600)
+    try:
+        assert cache.get('video') is None
+        cache.put('video', _info('https://media/audio.m4a'))
+        assert cache.get('video') is not None
+    finally:
+        cache.setup(enable_cache=False)
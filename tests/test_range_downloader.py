@@ -0,0 +1,140 @@
+import contextlib
+import os
+import re
+import threading
+
+import pytest
+
+pytest.importorskip('yt_dlp')
+
+from controller.logic.DownloadYoutubeAudio import download_youtube_audio_instance
+from controller.logic.YoutubeDLPool import youtube_dl_pool_instance
+from controller.logic.RangeDownloader import RangeNotSupportedError, honours_range, range_downloader_instance
+
+CONTENT = bytes(range(256)) * 40  # 10240 바이트
+CHUNK_SIZE = 1024
+
+
+class FakeResponse:
+    def __init__(self, status, body, headers=None):
+        self.status = status
+        self.headers = headers or {}
+        self._body = body
+        self._position = 0
+
+    def read(self, size):
+        data = self._body[self._position:self._position + size]
+        self._position += len(data)
+        return data
+
+    def close(self):
+        pass
+
+
+class FakeYdl:
+    """Range 요청에 응답하는 서버 흉내 (honour_range가 False이면 항상 200으로 전체 본문)"""
+
+    def __init__(self, honour_range=True):
+        self.honour_range = honour_range
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def urlopen(self, request):
+        start, end = map(int, re.match(r'bytes=(\d+)-(\d+)', request.headers['Range']).groups())
+        with self._lock:
+            self.requests.append((start, end))
+        if not self.honour_range:
+            return FakeResponse(200, CONTENT)
+        return FakeResponse(206, CONTENT[start:end + 1], {'Content-Range': f'bytes {start}-{end}/{len(CONTENT)}'})
+
+
+def _download(ydl, output_path):
+    return range_downloader_instance.download(
+        ydl, 'http://media/audio.m4a', {}, len(CONTENT), output_path, connections=4, chunk_size=CHUNK_SIZE
+    )
+
+
+def test_honours_range():
+    assert honours_range(FakeResponse(206, b'', {'Content-Range': 'bytes 100-199/1000'}), 100)
+    assert honours_range(FakeResponse(206, b''), 100)
+    assert not honours_range(FakeResponse(206, b'', {'Content-Range': 'bytes 0-999/1000'}), 100)
+    assert not honours_range(FakeResponse(200, b''), 0)
+
+
+def test_download_in_chunks(tmp_path):
+    output_path = str(tmp_path / 'audio.m4a')
+    ydl = FakeYdl()
+    assert _download(ydl, output_path) == output_path
+    with open(output_path, 'rb') as f:
+        assert f.read() == CONTENT
+    assert len(ydl.requests) == len(CONTENT) // CHUNK_SIZE
+    assert not os.path.exists(output_path + '.part')
+    assert not os.path.exists(output_path + '.part.chunks')
+
+
+def test_ignored_range_discards_partial_state(tmp_path):
+    output_path = str(tmp_path / 'audio.m4a')
+    ydl = FakeYdl(honour_range=False)
+    with pytest.raises(RangeNotSupportedError):
+        _download(ydl, output_path)
+    # 본문을 쓰기 전에 멈추고, 재시도하지 않으며, 믿을 수 없는 이어받기 상태를 남기지 않음
+    assert len(ydl.requests) <= 4
+    assert not os.path.exists(output_path)
+    assert not os.path.exists(output_path + '.part')
+    assert not os.path.exists(output_path + '.part.chunks')
+
+
+def test_ignored_range_falls_back_to_single_stream(tmp_path, monkeypatch):
+    ydl = FakeYdl(honour_range=False)
+    info = {'id': 'video', 'format_id': '251', 'ext': 'webm', 'url': 'http://media/audio.webm', 'filesize': len(CONTENT)}
+    assert download_youtube_audio_instance._download_in_ranges(ydl, info, str(tmp_path), None, None) is None
+    assert os.listdir(str(tmp_path)) == []
+
+    single = []
+    monkeypatch.setattr(youtube_dl_pool_instance, 'acquire', lambda **options: contextlib.nullcontext(ydl))
+    monkeypatch.setattr(download_youtube_audio_instance, '_parallel_settings', lambda: {
+        'parallel_download': True, 'connections_per_job': 4, 'max_connections': 16, 'chunk_size': CHUNK_SIZE
+    })
+    monkeypatch.setattr(download_youtube_audio_instance, '_download_single', lambda ydl, info, save_path: single.append(info) or __file__)
+    monkeypatch.setattr(download_youtube_audio_instance, '_extract_or_process', lambda ydl, url, info, download: dict(info, title='t', protocol='https'))
+    result = download_youtube_audio_instance.download_audio('https://www.youtube.com/watch?v=video', '128K', str(tmp_path), info=info)
+    assert result[0] == __file__ and len(single) == 1
+
+
+def test_fragment_downloads_share_connection_limit(tmp_path, monkeypatch):
+    max_connections = 6
+    monkeypatch.setattr(range_downloader_instance, '_connection_slots', threading.BoundedSemaphore(max_connections))
+    monkeypatch.setattr(range_downloader_instance, '_max_connections', max_connections)
+    monkeypatch.setattr(download_youtube_audio_instance, '_parallel_settings', lambda: {
+        'parallel_download': True, 'connections_per_job': 4, 'max_connections': max_connections, 'chunk_size': CHUNK_SIZE
+    })
+    lock = threading.Lock()
+    active = {'connections': 0, 'peak': 0}
+
+    def fake_process(ydl, info, download):
+        # yt-dlp가 concurrent_fragment_downloads개의 연결로 조각을 받는 동안
+        connections = download_youtube_audio_instance._fragment_concurrency()
+        with lock:
+            active['connections'] += connections
+            active['peak'] = max(active['peak'], active['connections'])
+        threading.Event().wait(0.05)
+        with lock:
+            active['connections'] -= connections
+        path = str(tmp_path / f"{info['id']}.m4a")
+        open(path, 'wb').close()
+        return dict(info, requested_downloads=[{'filepath': path}])
+
+    monkeypatch.setattr(download_youtube_audio_instance, '_process', fake_process)
+    jobs = [
+        threading.Thread(target=download_youtube_audio_instance._download_single,
+                         args=(None, {'id': f'video{i}', 'format_id': '140', 'protocol': 'http_dash_segments'}, str(tmp_path)))
+        for i in range(2)
+    ]
+    for job in jobs:
+        job.start()
+    for job in jobs:
+        job.join()
+
+    assert active['peak'] == 4
+    assert active['peak'] <= max_connections
+    assert sorted(os.listdir(str(tmp_path))) == ['video0.m4a', 'video1.m4a']
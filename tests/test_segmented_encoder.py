@@ -0,0 +1,229 @@
+import struct
+
+import pytest
+
+from controller.logic.SegmentedEncoder import (
+    SAMPLES_PER_FRAME, Mp3SpliceError, _crc16, _crc16_shift, segmented_encoder_instance
+)
+
+# MPEG-1 Layer III 48kHz 프레임 헤더의 비트레이트 인덱스 → 프레임 크기 (144000 * kbps / 48000, 패딩 없음)
+FRAME_SIZES = {5: 192, 9: 384, 10: 480}
+
+
+@pytest.fixture
+def config():
+    """segmented_encode 설정을 테스트마다 새로 지정하고 끝나면 config.json 값으로 되돌립니다."""
+    saved = segmented_encoder_instance._settings
+    segmented_encoder_instance._settings = {
+        'enabled': True,
+        'min_duration_seconds': 1200,
+        'segments': 4,
+        'preroll_frames': 4
+    }
+    yield segmented_encoder_instance._settings
+    segmented_encoder_instance._settings = saved
+
+
+def _settings(sample_rate=None, source_asr=48000, encoder='libmp3lame'):
+    return {'encoder': encoder, 'sample_rate': sample_rate, 'source_asr': source_asr}
+
+
+def _header(bitrate_index=9, rate_index=1, padding=0, mono=False, crc=False):
+    return bytes([
+        0xFF,
+        0xFA if crc else 0xFB,
+        (bitrate_index << 4) | (rate_index << 2) | (padding << 1),
+        0xC0 if mono else 0x00
+    ])
+
+
+def _audio_frame(number, bitrate_index=9):
+    """프레임 번호로 채운 오디오 프레임 (이어 붙인 순서를 내용으로 확인할 수 있도록)"""
+    size = FRAME_SIZES[bitrate_index]
+    payload = bytes((number * 7 + i) % 256 for i in range(size - 4))
+    return _header(bitrate_index) + payload
+
+
+def _tag_frame(music_crc, mono=False, flags=0x0F, marker=b'Info'):
+    """ffmpeg이 쓰는 것과 같은 배치의 Xing/LAME 태그 프레임 (384 바이트)"""
+    frame = bytearray(_header(mono=mono) + bytes(380))
+    offset = 4 + (17 if mono else 32)
+    frame[offset:offset + 4] = marker
+    struct.pack_into('>I', frame, offset + 4, flags)
+    struct.pack_into('>H', frame, offset + 152, music_crc)
+    return bytes(frame)
+
+
+def _write_segment(path, numbers, bitrate_of=lambda number: 9):
+    audio = b''.join(_audio_frame(number, bitrate_of(number)) for number in numbers)
+    with open(path, 'wb') as f:
+        f.write(_tag_frame(_crc16(audio)) + audio)
+
+
+class TestPlan:
+    def test_disabled(self, config):
+        config['enabled'] = False
+        assert segmented_encoder_instance.plan(_settings(), 3600) is None
+
+    def test_short_or_unknown_duration(self, config):
+        assert segmented_encoder_instance.plan(_settings(), 1199) is None
+        assert segmented_encoder_instance.plan(_settings(), None) is None
+
+    def test_only_libmp3lame(self, config):
+        assert segmented_encoder_instance.plan(_settings(encoder='copy'), 3600) is None
+
+    @pytest.mark.parametrize('sample_rate', [22050, 24000, 16000, 8000])
+    def test_mpeg2_sample_rates_are_not_split(self, config, sample_rate):
+        assert segmented_encoder_instance.plan(_settings(source_asr=sample_rate), 3600) is None
+        assert segmented_encoder_instance.plan(_settings(sample_rate=sample_rate, source_asr=48000), 3600) is None
+
+    def test_resampled_rate_wins_over_source(self, config):
+        segments = segmented_encoder_instance.plan(_settings(sample_rate=44100, source_asr=48000), 3600)
+        assert all(segment['sample_rate'] == 44100 for segment in segments)
+
+    def test_bounds_cover_timeline_without_gaps(self, config):
+        duration = 3600
+        segments = segmented_encoder_instance.plan(_settings(), duration)
+        frames = duration * 48000 // SAMPLES_PER_FRAME
+        preroll = config['preroll_frames']
+
+        assert [segment['index'] for segment in segments] == [0, 1, 2, 3]
+        assert segments[0]['start_frame'] == 0 and segments[0]['skip'] == 0
+        position = 0
+        for segment in segments:
+            # 앞에서 버리는 프레임을 빼면 이전 구간이 끝난 프레임에서 시작
+            assert segment['start_frame'] + segment['skip'] == position
+            if segment['keep'] is None:
+                assert segment is segments[-1] and segment['frames'] is None
+                break
+            assert segment['frames'] == segment['skip'] + segment['keep'] + preroll
+            position += segment['keep']
+        assert 0 < frames - position <= frames // len(segments) + 1
+        assert all(segment['skip'] == preroll for segment in segments[1:])
+
+    def test_segment_count_limits(self, config):
+        # 구간은 MIN_SEGMENT_SECONDS(60초)보다 짧아지지 않음
+        config['min_duration_seconds'] = 0
+        assert len(segmented_encoder_instance.plan(_settings(), 150)) == 2
+        assert segmented_encoder_instance.plan(_settings(), 119) is None
+        # 비어 있는 인코딩 슬롯 수로 제한
+        assert len(segmented_encoder_instance.plan(_settings(), 3600, max_segments=3)) == 3
+        assert segmented_encoder_instance.plan(_settings(), 3600, max_segments=1) is None
+
+
+class TestFrameParsing:
+    def test_frame_offsets(self):
+        data = _audio_frame(0, 9) + _audio_frame(1, 5) + _audio_frame(2, 10)
+        assert segmented_encoder_instance._frame_offsets(data, 'x') == [(0, 384), (384, 192), (576, 480)]
+
+    def test_frame_offsets_with_padding(self):
+        # 44.1kHz 128kbps는 417 바이트 + 패딩 1 바이트
+        padded = _header(9, 0, padding=1) + bytes(414)
+        plain = _header(9, 0) + bytes(413)
+        assert segmented_encoder_instance._frame_offsets(padded + plain, 'x') == [(0, 418), (418, 417)]
+
+    def test_frame_offsets_rejects_truncated_output(self):
+        data = _audio_frame(0) + _audio_frame(1)
+        with pytest.raises(Mp3SpliceError):
+            segmented_encoder_instance._frame_offsets(data[:-1], 'x')
+        with pytest.raises(Mp3SpliceError):
+            segmented_encoder_instance._frame_offsets(data[:384], 'x')
+
+    def test_frame_offsets_rejects_other_formats(self):
+        id3 = b'ID3' + bytes(381) + _audio_frame(0)
+        with pytest.raises(Mp3SpliceError):
+            segmented_encoder_instance._frame_offsets(id3, 'x')
+        # MPEG-2 헤더 (버전 비트 10)
+        mpeg2 = bytes([0xFF, 0xF3]) + _audio_frame(0)[2:] + _audio_frame(1)
+        with pytest.raises(Mp3SpliceError):
+            segmented_encoder_instance._frame_offsets(mpeg2, 'x')
+        # free format 비트레이트
+        with pytest.raises(Mp3SpliceError):
+            segmented_encoder_instance._frame_offsets(_header(0) + bytes(380) + _audio_frame(0), 'x')
+
+    @pytest.mark.parametrize('mono, offset', [(False, 36), (True, 21)])
+    def test_read_tag(self, mono, offset):
+        data = _tag_frame(0x1234, mono=mono) + _audio_frame(0)
+        tag = segmented_encoder_instance._read_tag(data, (0, 384), 'x')
+        assert tag == {'size': 384, 'offset': offset, 'music_crc': 0x1234}
+
+    def test_read_tag_accepts_xing_marker(self):
+        data = _tag_frame(1, marker=b'Xing')
+        assert segmented_encoder_instance._read_tag(data, (0, 384), 'x')['offset'] == 36
+
+    def test_read_tag_rejects_missing_or_partial_tag(self):
+        with pytest.raises(Mp3SpliceError):
+            segmented_encoder_instance._read_tag(_audio_frame(0), (0, 384), 'x')
+        with pytest.raises(Mp3SpliceError):
+            segmented_encoder_instance._read_tag(_tag_frame(0, flags=0x07), (0, 384), 'x')
+
+
+class TestCrc:
+    def test_shift_concatenation(self):
+        a, b = bytes(range(200)), bytes(range(50, 250)) * 3
+        assert _crc16(a + b) == _crc16_shift(_crc16(a), len(b)) ^ _crc16(b)
+
+    def test_negative_shift_reverts(self):
+        crc = _crc16(b'segment audio')
+        assert _crc16_shift(_crc16_shift(crc, 1000), -1000) == crc
+
+
+class TestBuildTag:
+    def test_counts_toc_and_crc(self):
+        tag_frame = _tag_frame(0)
+        sizes = [384, 192, 480] * 40
+        positions = [sum(sizes[:index]) for index in range(len(sizes))]
+        audio_bytes = sum(sizes)
+        tag = segmented_encoder_instance._build_tag(tag_frame, 36, positions, audio_bytes, 0xBEEF)
+
+        assert len(tag) == len(tag_frame) and tag[:4] == tag_frame[:4]
+        frames, total_bytes = struct.unpack_from('>II', tag, 36 + 8)
+        assert frames == len(sizes)
+        assert total_bytes == len(tag_frame) + audio_bytes
+        toc = tag[36 + 16:36 + 116]
+        assert list(toc) == sorted(toc)
+        assert toc[0] == len(tag_frame) * 256 // total_bytes
+        assert toc[50] == (len(tag_frame) + positions[60]) * 256 // total_bytes
+        # LAME 태그의 음악 길이와 음악 CRC
+        assert struct.unpack_from('>IH', tag, 36 + 148) == (total_bytes, 0xBEEF)
+        # 태그 CRC는 CRC 칸을 제외한 프레임 앞 190 바이트
+        assert struct.unpack_from('>H', tag, 36 + 154)[0] == _crc16(tag[:190])
+
+
+class TestSplice:
+    def test_splice_keeps_planned_frames_and_rewrites_tag(self, tmp_path):
+        preroll = 2
+        # 프레임 번호 0~13이 전체 타임라인, 구간은 앞뒤로 preroll개씩 더 인코딩
+        layout = [
+            ({'index': 0, 'skip': 0, 'keep': 5}, range(0, 7)),
+            ({'index': 1, 'skip': preroll, 'keep': 5}, range(3, 12)),
+            ({'index': 2, 'skip': preroll, 'keep': None}, range(8, 14))
+        ]
+        bitrate_of = lambda number: (9, 5, 10)[number % 3]
+        segments = []
+        for segment, numbers in layout:
+            segment['path'] = str(tmp_path / f"out.part{segment['index']}.mp3")
+            _write_segment(segment['path'], numbers, bitrate_of)
+            segments.append(segment)
+        output_file = str(tmp_path / 'out.mp3')
+
+        assert segmented_encoder_instance._splice(segments, output_file) == 14
+
+        with open(output_file, 'rb') as f:
+            data = f.read()
+        expected_audio = b''.join(_audio_frame(number, bitrate_of(number)) for number in range(14))
+        assert data[384:] == expected_audio
+        tag = segmented_encoder_instance._read_tag(data, (0, 384), output_file)
+        assert struct.unpack_from('>II', data, 36 + 8) == (14, len(data))
+        # 구간 CRC에서 계산한 음악 CRC가 이어 붙인 오디오 전체의 CRC와 같아야 함
+        assert tag['music_crc'] == _crc16(expected_audio)
+        assert struct.unpack_from('>H', data, 36 + 154)[0] == _crc16(data[:190])
+
+    def test_splice_rejects_short_segment(self, tmp_path):
+        segments = []
+        for index, numbers, skip, keep in [(0, range(0, 4), 0, 5), (1, range(3, 8), 2, None)]:
+            path = str(tmp_path / f"out.part{index}.mp3")
+            _write_segment(path, numbers)
+            segments.append({'index': index, 'skip': skip, 'keep': keep, 'path': path})
+        with pytest.raises(Mp3SpliceError):
+            segmented_encoder_instance._splice(segments, str(tmp_path / 'out.mp3'))
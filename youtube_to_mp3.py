@@ -1,20 +1,42 @@
 import sys
-from view.View import view_instance
 from model.Model import model_instance
-from controller.Controller import controller_instance
 
 def main():
+    # 배치 모드: GUI 패키지(PyQt5, view, controller.gui)를 import 하지 않음
+    if len(sys.argv) > 1 and sys.argv[1] == 'batch':
+        sys.exit(run_batch(sys.argv[2:]))
+
+    run_gui()
+
+def run_batch(argv):
+    from controller.logic.BatchRunner import batch_runner_instance
+
+    args = batch_runner_instance.parse_args(argv)
+
+    # Model 실행
+    model_instance.run(args.config)
+
+    return batch_runner_instance.run(args)
+
+def run_gui():
+    from view.View import view_instance
+    from controller.Controller import controller_instance
+
     # Model 실행행
     model_instance.run('config.json')
-    
+
+    # ffmpeg 위치/인코더 확인 (첫 다운로드 전에 미리)
+    from controller.logic.FFmpegProbe import ffmpeg_probe_instance
+    ffmpeg_probe_instance.warm_up()
+
     # View 초기화 및 GUI 실행
     app, window = view_instance.run()
 
     # Controller 실행
     controller_instance.run(window)
-    
+
     # 애플리케이션 실행
     sys.exit(app.exec_())
 
 if __name__ == '__main__':
-    main() 
\ No newline at end of file
+    main()